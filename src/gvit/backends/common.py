@@ -3,6 +3,8 @@ Module with common functions for different commands.
 """
 
 from pathlib import Path
+import shutil
+import subprocess
 
 import typer
 
@@ -10,9 +12,17 @@ from gvit.backends.conda import CondaBackend
 from gvit.backends.venv import VenvBackend
 from gvit.backends.virtualenv import VirtualenvBackend
 from gvit.backends.uv import UvBackend
+from gvit.utils.freeze import FreezeSnapshot, scan_freeze
+from gvit.utils.requirements import PROJECT_FILES, get_requirements_includes
 from gvit.utils.schemas import LocalConfig, RepoConfig
 from gvit.utils.utils import get_base_deps, get_extra_deps
-from gvit.utils.globals import DEFAULT_VENV_NAME, ENVS_DIR
+from gvit.utils.globals import DEFAULT_VENV_NAME
+from gvit.utils.packages_cache import get_install_env, touch_packages_cache_entries
+from gvit.utils.venv_copy import copy_venv, read_pyvenv_cfg
+
+
+# pyvenv.cfg keys that must match to copy an environment (same base interpreter)
+PYVENV_CFG_KEYS = ("home", "version", "version_info", "include-system-site-packages")
 
 
 def create_venv(
@@ -103,6 +113,7 @@ def install_dependencies(
         package_manager = "pip"
 
     package_manager = "uv" if backend == "uv" else package_manager
+    install_env = _get_install_env(venv_name, backend, Path(repo_path).resolve())
 
     typer.echo("\n- Resolving dependencies...")
     resolved_base = _resolve_base_deps(base_deps, repo_config, local_config)
@@ -110,6 +121,7 @@ def install_dependencies(
     if "pyproject.toml" in resolved_base:
         extra_deps_ = extra_deps.split(",") if extra_deps else None
         typer.echo(f'  Dependencies to install: pyproject.toml{f" (extras: {extra_deps})" if extra_deps else ""}')
+        extras_deps = {extra_dep: "pyproject.toml" for extra_dep in extra_deps_} if extra_deps_ else {}
         typer.echo(f"\n- Installing project and dependencies with {package_manager}", nl=False)
         typer.secho(" (this might take some time)", nl=False, fg=typer.colors.BLUE)
         typer.echo("...")
@@ -122,41 +134,108 @@ def install_dependencies(
             deps_group_name=deps_group_name,
             deps_path=resolved_base,
             extra_deps=extra_deps_,
-            verbose=verbose
-        )
-        return (
-            resolved_base if success else None,
-            {extra_dep: "pyproject.toml" for extra_dep in extra_deps_} if extra_deps_ else {}
+            verbose=verbose,
+            install_env=install_env
         )
+        record_packages_cache_use(venv_name, backend, repo_path)
+        return resolved_base if success else None, extras_deps
 
     resolved_extras = _resolve_extra_deps(extra_deps, repo_config, local_config)
     deps_to_install = {**{"_base": resolved_base}, **resolved_extras}
     typer.echo(f"  Dependencies to install: {deps_to_install}")
+    if _install_from_donor(venv_name, backend, repo_path, deps_to_install):
+        record_packages_cache_use(venv_name, backend, repo_path)
+        return resolved_base, resolved_extras
     typer.echo(f"\n- Installing dependencies with {package_manager}", nl=False)
     typer.secho(" (this might take some time)", nl=False, fg=typer.colors.BLUE)
     typer.echo("...")
-    base_sucess = _install_dependencies_from_file(
-        venv_name=venv_name,
-        backend=backend,
-        package_manager=package_manager,
-        repo_path=repo_path,
-        deps_group_name="_base",
-        deps_path=resolved_base,
-        verbose=verbose
+    installed = _install_dependency_groups(
+        venv_name, backend, package_manager, repo_path, deps_to_install, install_env, verbose
     )
-    for deps_group_name, deps_path in resolved_extras.items():
-        deps_group_sucess = _install_dependencies_from_file(
-            venv_name=venv_name,
-            backend=backend,
-            package_manager=package_manager,
-            repo_path=repo_path,
-            deps_group_name=deps_group_name,
-            deps_path=deps_path, verbose=verbose
-        )
-        if not deps_group_sucess:
-            resolved_extras.pop(deps_group_name)
+    record_packages_cache_use(venv_name, backend, repo_path)
+    resolved_extras = {name: path for name, path in resolved_extras.items() if name in installed}
 
-    return resolved_base if base_sucess else None, resolved_extras
+    return resolved_base if "_base" in installed else None, resolved_extras
+
+
+def install_extra_dependencies(
+    venv_name: str,
+    backend: str,
+    package_manager: str,
+    repo_path: str,
+    extra_deps: dict[str, str],
+    verbose: bool = False
+) -> dict[str, str]:
+    """
+    Install only the given extra dependency groups {group: path}, without the base dependencies.
+    The pyproject.toml extras are installed with the project (-e .[extra]).
+    Returns the groups successfully installed.
+    """
+    if package_manager == "uv" and not _is_uv_installed(backend, Path(repo_path) / venv_name):
+        typer.secho("\n⚠️  Package manager uv is not available. Falling back to pip.", fg=typer.colors.YELLOW)
+        package_manager = "pip"
+
+    package_manager = "uv" if backend == "uv" else package_manager
+
+    install_env = _get_install_env(venv_name, backend, Path(repo_path).resolve())
+
+    typer.echo("\n- Resolving dependencies...")
+    typer.echo(f"  Dependencies to install: {extra_deps}")
+    typer.echo(f"\n- Installing dependencies with {package_manager}", nl=False)
+    typer.secho(" (this might take some time)", nl=False, fg=typer.colors.BLUE)
+    typer.echo("...")
+    installed = _install_dependency_groups(
+        venv_name, backend, package_manager, repo_path, extra_deps, install_env, verbose
+    )
+    record_packages_cache_use(venv_name, backend, repo_path)
+    return installed
+
+
+def sync_dependencies(
+    venv_name: str,
+    backend: str,
+    package_manager: str,
+    repo_path: str,
+    deps_group_name: str,
+    to_install: list[str],
+    to_uninstall: list[str],
+    verbose: bool = False
+) -> bool:
+    """
+    Install only the given requirement specifiers (added or changed) and uninstall the given packages
+    (no longer required), instead of installing a whole dependency group.
+    The use of the shared package cache is not recorded, call record_packages_cache_use once all the
+    groups are synced.
+    """
+    if package_manager == "uv" and not _is_uv_installed(backend, Path(repo_path) / venv_name):
+        typer.secho("\n⚠️  Package manager uv is not available. Falling back to pip.", fg=typer.colors.YELLOW)
+        package_manager = "pip"
+    repo_path_ = Path(repo_path).resolve()
+
+    cmds = []
+    if to_install:
+        if (install_cmd := _get_pip_cmd(venv_name, backend, package_manager, repo_path_, "install")) is None:
+            return False
+        cmds.append([*install_cmd, *to_install])
+    if to_uninstall:
+        if (uninstall_cmd := _get_pip_cmd(venv_name, backend, package_manager, repo_path_, "uninstall")) is None:
+            return False
+        cmds.append([*uninstall_cmd, *to_uninstall])
+    typer.echo(f'  Group "{deps_group_name}" (+{len(to_install)} / -{len(to_uninstall)})...', nl=False)
+    return _run_pip_cmds(
+        cmds,
+        repo_path_,
+        _get_install_env(venv_name, backend, repo_path_),
+        f'❗ Failed to sync "{deps_group_name}" dependencies',
+        verbose
+    )
+
+
+def record_packages_cache_use(venv_name: str, backend: str, repo_path: str) -> None:
+    """Function to record the use of the shared package cache entries linked into the environment."""
+    venv_path = CondaBackend().get_venv_path(venv_name) if backend == "conda" else str(Path(repo_path) / venv_name)
+    if venv_path:
+        touch_packages_cache_entries(Path(venv_path))
 
 
 def get_activate_cmd(backend: str, venv_name: str, venv_path: Path, relative: bool = True) -> str | None:
@@ -195,50 +274,174 @@ def get_deactivate_cmd(backend: str) -> str | None:
         return None
 
 
-def show_summary_message(registry_name: str, repo_path: Path, venv_path: Path, backend: str) -> None:
+def show_summary_message(
+    registry_name: str, registry_location: str, repo_path: Path, venv_path: Path, backend: str
+) -> None:
     """Function to show the summary message of the process."""
     venv_name = venv_path.name
     activate_cmd = get_activate_cmd(backend, venv_name, venv_path) or "# Activation command not available"
     typer.echo("\n🎉  Project setup complete!")
     typer.echo(f"📁  Repository -> {repo_path.name} ({str(repo_path)})")
     typer.echo(f"🐍  Environment [{backend}] -> {venv_name} ({str(venv_path)})")
-    typer.echo(f"📖  Registry -> {registry_name} ({ENVS_DIR / f'{registry_name}.toml'})")
+    typer.echo(f"📖  Registry -> {registry_name} ({registry_location})")
     typer.echo("🚀  Ready to start working -> ", nl=False)
     typer.secho(f'cd {str(repo_path)} && {activate_cmd}', fg=typer.colors.YELLOW, bold=True)
 
 
-def get_freeze(venv_name: str, repo_path: Path, repo_url: str, backend: str) -> str | None:
-    """Function to get the complete pip freeze output for the environment."""
+def get_freeze(venv_name: str, repo_path: Path, repo_url: str, backend: str, scan: bool = True) -> FreezeSnapshot | None:
+    """
+    Function to get the pip freeze of the environment (computed once, parsed and hashed).
+    With scan=False it is always taken from the package manager instead of site-packages.
+    """
     if backend == "conda":
         conda_backend = CondaBackend()
-        return conda_backend.get_freeze(venv_name, repo_url)
+        freeze = conda_backend.get_freeze(venv_name, repo_url, repo_path, scan)
     elif backend == "venv":
         venv_backend = VenvBackend()
-        return venv_backend.get_freeze(venv_name, repo_path, repo_url)
+        freeze = venv_backend.get_freeze(venv_name, repo_path, repo_url, scan)
     elif backend == "virtualenv":
         virtualenv_backend = VirtualenvBackend()
-        return virtualenv_backend.get_freeze(venv_name, repo_path, repo_url)
+        freeze = virtualenv_backend.get_freeze(venv_name, repo_path, repo_url, scan)
     elif backend == "uv":
         uv_backend = UvBackend()
-        return uv_backend.get_freeze(venv_name, repo_path, repo_url)
-    return None
+        freeze = uv_backend.get_freeze(venv_name, repo_path, repo_url, scan)
+    else:
+        freeze = None
+    return FreezeSnapshot(freeze) if freeze else None
 
 
-def get_freeze_hash(venv_name: str, repo_path: Path, repo_url: str, backend: str) -> str | None:
-    """Function to get the pip freeze hash for the environment."""
-    if backend == "conda":
-        conda_backend = CondaBackend()
-        return conda_backend.get_freeze_hash(venv_name, repo_url)
-    elif backend == "venv":
-        venv_backend = VenvBackend()
-        return venv_backend.get_freeze_hash(venv_name, repo_path, repo_url)
-    elif backend == "virtualenv":
-        virtualenv_backend = VirtualenvBackend()
-        return virtualenv_backend.get_freeze_hash(venv_name, repo_path, repo_url)
-    elif backend == "uv":
-        uv_backend = UvBackend()
-        return uv_backend.get_freeze_hash(venv_name, repo_path, repo_url)
-    return None
+def _install_from_donor(venv_name: str, backend: str, repo_path: str, deps: dict[str, str]) -> bool:
+    """
+    Materialize a new (empty) environment as a copy of an identical one already built for another
+    repository (the donor, see EnvRegistry.find_donor_env) instead of installing its dependencies.
+    Only for the venv, virtualenv and uv backends, if both were created from the same base interpreter, and
+    for requirements files without local editable installs: the project itself (pyproject.toml or -e) is
+    installed from the sources of each repository, it cannot be copied from the donor.
+    The copy is checked against the freeze of the donor before replacing the new environment.
+    Returns False (install the dependencies) if there is no donor or the copy fails or does not match.
+    """
+    if backend not in ("venv", "virtualenv", "uv"):
+        return False
+    for deps_path in deps.values():
+        deps_file = Path(repo_path) / deps_path
+        if deps_file.name in PROJECT_FILES or any(
+            include.name in PROJECT_FILES for include in get_requirements_includes(deps_file, Path(repo_path))
+        ):
+            return False
+    # Imported here, as the registry depends on this module
+    from gvit.env_registry import EnvRegistry
+
+    repo_path_ = Path(repo_path).resolve()
+    venv_path = repo_path_ / venv_name
+    if scan_freeze(venv_path, exclude_paths=[repo_path_]) != "":
+        return False  # Not a new environment
+    donor = EnvRegistry().find_donor_env(repo_path_, backend, None, deps)
+    if donor is None:
+        return False
+    donor_path = Path(donor["environment"]["path"])
+    venv_cfg, donor_cfg = read_pyvenv_cfg(venv_path), read_pyvenv_cfg(donor_path)
+    if not venv_cfg or any(venv_cfg.get(key) != donor_cfg.get(key) for key in PYVENV_CFG_KEYS):
+        return False
+
+    typer.echo(f'\n- Copying environment "{donor["environment"]["name"]}" (identical dependencies)...', nl=False)
+    tmp_path = venv_path.with_name(f".{venv_name}.gvit-tmp")
+    old_path = venv_path.with_name(f".{venv_name}.gvit-old")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    try:
+        link_mode = copy_venv(
+            donor_path, tmp_path, {str(donor_path): str(venv_path), donor["repository"]["path"]: str(repo_path_)}
+        )
+        freeze = scan_freeze(tmp_path, exclude_paths=[repo_path_])
+        if freeze is None or FreezeSnapshot(freeze).hash != donor["deps"]["installed"]["_freeze_hash"]:
+            raise OSError("the copied packages do not match")
+        venv_path.rename(old_path)
+        try:
+            tmp_path.rename(venv_path)
+        except OSError:
+            old_path.rename(venv_path)
+            raise
+    except OSError as e:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        typer.secho(f"⚠️  Could not copy it ({e}), installing the dependencies instead.", fg=typer.colors.YELLOW)
+        return False
+    shutil.rmtree(old_path, ignore_errors=True)
+    typer.echo(f"✅ ({link_mode})")
+    return True
+
+
+def _install_dependency_groups(
+    venv_name: str,
+    backend: str,
+    package_manager: str,
+    repo_path: str,
+    deps_groups: dict[str, str],
+    install_env: dict[str, str] | None,
+    verbose: bool = False
+) -> dict[str, str]:
+    """
+    Install several dependency groups {group: path}. The requirements files are installed together
+    (pip install -r a -r b...), so that they are resolved once and a group cannot downgrade the
+    packages of another one. If that fails, they are retried one by one to find the failing groups.
+    The pyproject.toml groups are installed with the project (-e .[group]).
+    Returns the groups successfully installed.
+    """
+    repo_path_ = Path(repo_path).resolve()
+    requirements_groups = {
+        name: deps_path for name, deps_path in deps_groups.items()
+        if Path(deps_path).suffix in [".txt", ".in"]
+        and (Path(deps_path) if Path(deps_path).is_absolute() else repo_path_ / deps_path).exists()
+    }
+    installed = {}
+    if len(requirements_groups) > 1:
+        if _install_combined_dependencies(
+            venv_name, backend, package_manager, repo_path, requirements_groups, install_env, verbose
+        ):
+            installed.update(requirements_groups)
+        else:
+            typer.echo("  Retrying group by group...")
+    for deps_group_name, deps_path in deps_groups.items():
+        if deps_group_name in installed:
+            continue
+        if _install_dependencies_from_file(
+            venv_name=venv_name,
+            backend=backend,
+            package_manager=package_manager,
+            repo_path=repo_path,
+            deps_group_name=deps_group_name,
+            deps_path=deps_path,
+            extra_deps=[deps_group_name] if Path(deps_path).name == "pyproject.toml" else None,
+            verbose=verbose,
+            install_env=install_env
+        ):
+            installed[deps_group_name] = deps_path
+    return installed
+
+
+def _install_combined_dependencies(
+    venv_name: str,
+    backend: str,
+    package_manager: str,
+    repo_path: str,
+    deps_groups: dict[str, str],
+    install_env: dict[str, str] | None,
+    verbose: bool = False
+) -> bool:
+    """Install several requirements files {group: path} with a single pip (or uv pip) resolution."""
+    repo_path_ = Path(repo_path).resolve()
+    install_cmd = _get_pip_cmd(venv_name, backend, package_manager, repo_path_, "install")
+    if install_cmd is None:
+        return False
+    for deps_path in deps_groups.values():
+        install_cmd.extend(["-r", str(Path(deps_path) if Path(deps_path).is_absolute() else repo_path_ / deps_path)])
+    groups = ", ".join(f'"{name}"' for name in deps_groups)
+    typer.echo(f"  Groups {groups}...", nl=False)
+    return _run_pip_cmds(
+        [install_cmd],
+        repo_path_,
+        install_env,
+        "❗ Failed to install the dependencies together",
+        verbose
+    )
 
 
 def _install_dependencies_from_file(
@@ -249,7 +452,8 @@ def _install_dependencies_from_file(
     deps_group_name: str,
     deps_path: str,
     extra_deps: list[str] | None = None,
-    verbose: bool = False
+    verbose: bool = False,
+    install_env: dict[str, str] | None = None
 ) -> bool:
     """Install dependencies from a single file."""
     repo_path_ = Path(repo_path).resolve()
@@ -265,7 +469,8 @@ def _install_dependencies_from_file(
             deps_group_name=deps_group_name,
             deps_path=deps_abs_path,
             extras=extra_deps,
-            verbose=verbose
+            verbose=verbose,
+            env=install_env
         )
     elif backend == "venv":
         venv_backend = VenvBackend()
@@ -276,7 +481,8 @@ def _install_dependencies_from_file(
             deps_group_name=deps_group_name,
             deps_path=deps_abs_path,
             extras=extra_deps,
-            verbose=verbose
+            verbose=verbose,
+            env=install_env
         )
     elif backend == "virtualenv":
         virtualenv_backend = VirtualenvBackend()
@@ -287,7 +493,8 @@ def _install_dependencies_from_file(
             deps_group_name=deps_group_name,
             deps_path=deps_abs_path,
             extras=extra_deps,
-            verbose=verbose
+            verbose=verbose,
+            env=install_env
         )
     elif backend == "uv":
         uv_backend = UvBackend()
@@ -297,33 +504,19 @@ def _install_dependencies_from_file(
             deps_group_name=deps_group_name,
             deps_path=deps_abs_path,
             extras=extra_deps,
-            verbose=verbose
+            verbose=verbose,
+            env=install_env
         )
 
     return False
 
 
 def get_freeze_diff(
-    stored_freeze: str, current_freeze: str
+    stored_freeze: FreezeSnapshot, current_freeze: FreezeSnapshot
 ) -> tuple[dict[str, str], dict[str, str], dict[str, tuple[str, str]]]:
     """Get the added, removed and modified packages."""
-    def parse_freeze(text: str) -> dict[str, str]:
-        """Convert a pip freeze text into a {package: version} dict."""
-        packages = {}
-        for line in text.strip().splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "==" in line:
-                pkg, ver = line.split("==", 1)
-                packages[pkg.lower()] = ver
-            else:
-                # handle non-standard lines (like editable installs or VCS)
-                packages[line.lower()] = None
-        return packages
-
-    old = parse_freeze(stored_freeze)
-    new = parse_freeze(current_freeze)
+    old = stored_freeze.packages
+    new = current_freeze.packages
 
     added = {pkg: new[pkg] for pkg in new.keys() - old.keys()}
     removed = {pkg: old[pkg] for pkg in old.keys() - new.keys()}
@@ -365,6 +558,45 @@ def _resolve_base_deps(base_deps: str | None, repo_config: RepoConfig, local_con
     return base_deps or repo_config.get("deps", {}).get("_base") or get_base_deps(local_config)
 
 
+def _get_pip_cmd(venv_name: str, backend: str, package_manager: str, repo_path: Path, action: str) -> list[str] | None:
+    """Function to get the pip (or uv pip) command of an action (install/uninstall) of the backend."""
+    if backend == "conda":
+        conda_backend = CondaBackend()
+        return conda_backend._get_pip_cmd(venv_name, package_manager, action)
+    elif backend == "venv":
+        venv_backend = VenvBackend()
+        return venv_backend._get_pip_cmd(repo_path / venv_name, package_manager, action)
+    elif backend == "virtualenv":
+        virtualenv_backend = VirtualenvBackend()
+        return virtualenv_backend._get_pip_cmd(repo_path / venv_name, package_manager, action)
+    elif backend == "uv":
+        uv_backend = UvBackend()
+        return uv_backend._get_pip_cmd(repo_path / venv_name, action)
+    return None
+
+
+def _get_install_env(venv_name: str, backend: str, repo_path: Path) -> dict[str, str] | None:
+    """Function to get the environment variables of the install commands of the backend (shared package cache)."""
+    venv_path = CondaBackend().get_venv_path(venv_name) if backend == "conda" else str(repo_path / venv_name)
+    return get_install_env(Path(venv_path) if venv_path else None)
+
+
+def _run_pip_cmds(
+    cmds: list[list[str]], repo_path: Path, env: dict[str, str] | None, error_msg: str, verbose: bool = False
+) -> bool:
+    """Function to run pip (or uv pip) commands in the repository, stopping at the first one that fails."""
+    try:
+        for cmd in cmds:
+            result = subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=repo_path, env=env)
+            if verbose and result.stdout:
+                typer.echo(result.stdout)
+        typer.echo("✅")
+        return True
+    except subprocess.CalledProcessError as e:
+        typer.secho(f"{error_msg}: {e}", fg=typer.colors.RED)
+        return False
+
+
 def _is_uv_installed(backend: str, venv_path: Path) -> bool:
     """Function to check if uv is installed (globally or locally)."""
     if backend == "conda":
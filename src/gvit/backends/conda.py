@@ -6,7 +6,6 @@ import re
 from pathlib import Path
 import shutil
 import platform
-import hashlib
 import os
 import subprocess
 import json
@@ -14,10 +13,19 @@ import json
 import typer
 
 from gvit.error_handler import exit_with_error
+from gvit.utils.freeze import scan_freeze
+
+
+# Prefixes of the environments already resolved in this process -> {venv_name: prefix}
+_ENV_PREFIXES: dict[str, str] = {}
 
 
 class CondaBackend:
-    """Class for the operations with the Conda backend."""
+    """
+    Class for the operations with the Conda backend.
+    The environments are located without running conda (from ~/.conda/environments.txt and the envs
+    directories), and their python, pip and uv executables are called directly instead of `conda run`.
+    """
 
     def __init__(self) -> None:
         self.path = self._get_path() or "conda"
@@ -85,6 +93,10 @@ class CondaBackend:
     def is_uv_installed(self, venv_name: str) -> bool:
         """Method to check if uv is installed (globally or locally)."""
         uv_global_path = shutil.which("uv")
+        if uv_global_path or self._get_env_executable(venv_name, "uv"):
+            return True
+        if self.get_venv_path(venv_name):
+            return False
         result = subprocess.run(
             [self.path, "run", "-n", venv_name, "python", "-c",
              "import shutil; print(shutil.which('uv') or '')"],
@@ -101,7 +113,8 @@ class CondaBackend:
         deps_group_name: str,
         deps_path: Path,
         extras: list[str] | None = None,
-        verbose: bool = False
+        verbose: bool = False,
+        env: dict[str, str] | None = None
     ) -> bool:
         """Method to install the dependencies from the provided deps_path."""
         typer.echo(f'  Group "{deps_group_name}"...', nl=False)
@@ -120,7 +133,8 @@ class CondaBackend:
                 check=True,
                 capture_output=True,
                 text=True,
-                cwd=repo_path
+                cwd=repo_path,
+                env=env
             )
             if verbose and result.stdout:
                 typer.echo(result.stdout)
@@ -132,18 +146,7 @@ class CondaBackend:
 
     def venv_exists(self, venv_name: str) -> bool:
         """Check if a conda environment with the given name already exists."""
-        try:
-            result = subprocess.run(
-                [self.path, "env", "list", "--json"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            envs_data = json.loads(result.stdout)
-            env_names = [Path(env).name for env in envs_data.get("envs", [])]
-            return venv_name in env_names
-        except (subprocess.CalledProcessError, json.JSONDecodeError, FileNotFoundError):
-            return False
+        return bool(self.get_venv_path(venv_name))
 
     def delete_venv(self, venv_name: str, verbose: bool = False) -> None:
         """Remove a conda environment."""
@@ -170,42 +173,63 @@ class CondaBackend:
         return "conda deactivate"
 
     def get_venv_path(self, venv_name: str) -> str:
-        """Get the absolute path to the conda environment directory."""
-        try:
-            result = subprocess.run(
-                [self.path, "env", "list", "--json"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            envs_data = json.loads(result.stdout)
-            for env_path in envs_data.get("envs", []):
-                if Path(env_path).name == venv_name:
-                    return env_path
-            return ""
-        except (subprocess.CalledProcessError, json.JSONDecodeError, FileNotFoundError):
-            return ""
+        """
+        Get the absolute path (prefix) to the conda environment directory.
+        It is looked up in the environments known by conda (~/.conda/environments.txt, the envs
+        directories and the root prefix) and cached for the process; `conda env list` is only run
+        if it is not found there. Returns an empty string if the environment does not exist.
+        """
+        cached = _ENV_PREFIXES.get(venv_name)
+        if cached and self._is_env_prefix(Path(cached)):
+            return cached
+        env_paths = [str(prefix) for prefix in self._get_known_prefixes()]
+        if not any(Path(env_path).name == venv_name for env_path in env_paths):
+            try:
+                result = subprocess.run(
+                    [self.path, "env", "list", "--json"],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+                env_paths = json.loads(result.stdout).get("envs", [])
+            except (subprocess.CalledProcessError, json.JSONDecodeError, FileNotFoundError):
+                return ""
+        for env_path in env_paths:
+            if Path(env_path).name == venv_name and self._is_env_prefix(Path(env_path)):
+                _ENV_PREFIXES[venv_name] = env_path
+                return env_path
+        return ""
 
-    def get_freeze(self, venv_name: str, repo_url: str) -> str | None:
-        """Method to get the complete pip freeze output for the environment (excluding repo URL)."""
+    def get_freeze(self, venv_name: str, repo_url: str, repo_path: Path | None = None, scan: bool = True) -> str | None:
+        """
+        Method to get the complete pip freeze output for the environment (excluding repo URL and the
+        editable install of repo_path). It is read from the site-packages directory, pip freeze is only
+        run if it cannot be found (always with scan=False).
+        The conda-meta/*.json records are deliberately not merged: the packages without Python metadata
+        (openssl, libffi...) are not in pip freeze, so the freeze would differ from the pip freeze fallback
+        and from the freezes already stored in the registry. The Python packages installed by conda have a
+        dist-info directory, so they are listed anyway (with their direct URL, as pip does).
+        """
         try:
-            result = subprocess.run(
-                [self.path, "run", "-n", venv_name, "pip", "freeze"],
-                capture_output=True,
-                text=True,
-                check=True
+            venv_path = self.get_venv_path(venv_name)
+            freeze = (
+                scan_freeze(Path(venv_path), exclude_paths=[repo_path] if repo_path else None)
+                if venv_path and scan
+                else None
             )
-            if not result.stdout:
+            if freeze is None:
+                freeze = subprocess.run(
+                    self._get_pip_cmd(venv_name, "pip", "freeze"),
+                    capture_output=True,
+                    text=True,
+                    check=True
+                ).stdout
+            if not freeze:
                 return None
-            return re.sub(rf'^.*{repo_url}.*$\n?', '', result.stdout, flags=re.MULTILINE)
+            return re.sub(rf'^.*{repo_url}.*$\n?', '', freeze, flags=re.MULTILINE)
         except (subprocess.CalledProcessError, json.JSONDecodeError, FileNotFoundError):
             return None
 
-    def get_freeze_hash(self, venv_name: str, repo_url: str) -> str | None:
-        """Method to calculate SHA256 hash (first 16 chars) of pip freeze output for the environment."""
-        freeze = self.get_freeze(venv_name, repo_url)
-        return hashlib.sha256(freeze.encode()).hexdigest()[:16] if freeze else None
-
     def _get_path(self) -> str | None:
         """Try to find the conda executable in PATH or common install locations."""
         if conda_path := shutil.which("conda"):
@@ -224,11 +248,7 @@ class CondaBackend:
         self, venv_name: str, package_manager: str, deps_path: Path, extras: list[str] | None
     ) -> list[str] | None:
         """Method to get the install command."""
-        install_cmd = [self.path, "run", "-n", venv_name]
-        if package_manager == "uv":
-            install_cmd.extend(["uv", "pip", "install"])
-        else:
-            install_cmd.extend(["python", "-m", "pip", "install"])
+        install_cmd = self._get_pip_cmd(venv_name, package_manager, "install")
 
         if deps_path.name == "pyproject.toml":
             install_cmd.extend(["-e", f".[{','.join(extras)}]" if extras else "."])
@@ -240,6 +260,104 @@ class CondaBackend:
 
         return install_cmd
 
+    def _get_pip_cmd(self, venv_name: str, package_manager: str, action: str) -> list[str]:
+        """
+        Method to get the pip (or uv pip) command of an action (install/uninstall/freeze) without arguments.
+        The executables of the environment are called directly, `conda run` is only used if they are not found.
+        """
+        python_path = self._get_env_executable(venv_name, "python")
+        extra_args = ["-y"] if action == "uninstall" else []
+        if package_manager == "uv":
+            if python_path:
+                return [self._get_env_executable(venv_name, "uv") or "uv", "pip", action, "-p", python_path]
+            return [self.path, "run", "-n", venv_name, "uv", "pip", action]
+        if python_path:
+            return [python_path, "-m", "pip", action, *extra_args]
+        return [self.path, "run", "-n", venv_name, "python", "-m", "pip", action, *extra_args]
+
+    def _get_env_executable(self, venv_name: str, name: str) -> str | None:
+        """Method to get the path of an executable (python, pip, uv) of the environment, None if not found."""
+        if not (venv_path := self.get_venv_path(venv_name)):
+            return None
+        prefix = Path(venv_path)
+        if platform.system() == "Windows":
+            executable = prefix / "python.exe" if name == "python" else prefix / "Scripts" / f"{name}.exe"
+        else:
+            executable = prefix / "bin" / name
+        return str(executable) if executable.exists() else None
+
+    def _get_known_prefixes(self) -> list[Path]:
+        """
+        Method to get the prefixes of the environments known by conda without running it: the ones
+        registered in ~/.conda/environments.txt, the directories inside the envs directories and the root prefix.
+        """
+        prefixes = []
+        try:
+            environments_file = Path.home() / ".conda" / "environments.txt"
+            prefixes.extend(Path(line.strip()) for line in environments_file.read_text().splitlines() if line.strip())
+        except OSError:
+            pass
+        for envs_dir in self._get_envs_dirs():
+            try:
+                prefixes.extend(sorted(path for path in envs_dir.iterdir() if path.is_dir()))
+            except OSError:
+                continue
+        if root_prefix := self._get_root_prefix():
+            prefixes.append(root_prefix)
+        return prefixes
+
+    def _get_envs_dirs(self) -> list[Path]:
+        """
+        Method to get the directories where conda creates the environments: $CONDA_ENVS_PATH/$CONDA_ENVS_DIRS,
+        the envs_dirs of the .condarc files, <root prefix>/envs and ~/.conda/envs.
+        """
+        envs_dirs = [
+            Path(path).expanduser()
+            for var in ("CONDA_ENVS_PATH", "CONDA_ENVS_DIRS")
+            for path in os.environ.get(var, "").split(os.pathsep) if path
+        ]
+        root_prefix = self._get_root_prefix()
+        condarc_files = [
+            *([Path(os.environ["CONDARC"])] if os.environ.get("CONDARC") else []),
+            Path.home() / ".condarc",
+            Path.home() / ".conda" / ".condarc",
+            *([root_prefix / ".condarc"] if root_prefix else []),
+        ]
+        for condarc_file in condarc_files:
+            envs_dirs.extend(self._get_condarc_envs_dirs(condarc_file))
+        if root_prefix:
+            envs_dirs.append(root_prefix / "envs")
+        envs_dirs.append(Path.home() / ".conda" / "envs")
+        return list(dict.fromkeys(envs_dirs))
+
+    def _get_condarc_envs_dirs(self, condarc_file: Path) -> list[Path]:
+        """Method to get the envs_dirs list of a .condarc file (a simple YAML list, no YAML parser needed)."""
+        try:
+            lines = condarc_file.read_text().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return []
+        envs_dirs, in_envs_dirs = [], False
+        for line in lines:
+            if line.startswith("envs_dirs:"):
+                in_envs_dirs = True
+            elif in_envs_dirs and line.strip().startswith("- "):
+                envs_dirs.append(Path(line.strip()[2:].strip().strip("'\"")).expanduser())
+            elif in_envs_dirs and line.strip() and not line.startswith((" ", "\t")):
+                in_envs_dirs = False
+        return envs_dirs
+
+    def _get_root_prefix(self) -> Path | None:
+        """Method to get the root prefix of the conda installation (<root>/bin/conda, <root>/condabin/conda...)."""
+        conda_path = Path(self.path)
+        if not conda_path.is_absolute() or not conda_path.exists():
+            return None
+        root_prefix = conda_path.resolve().parent.parent
+        return root_prefix if self._is_env_prefix(root_prefix) else None
+
+    def _is_env_prefix(self, prefix: Path) -> bool:
+        """Method to check if a directory is a conda environment (it has a conda-meta directory)."""
+        return (prefix / "conda-meta").is_dir()
+
     def _get_conda_windows_candidates(self) -> list[Path]:
         """Method to get the candidate conda paths for Windows."""
         home = Path.home()
@@ -13,6 +13,7 @@ import hashlib
 import typer
 
 from gvit.error_handler import exit_with_error
+from gvit.utils.freeze import scan_freeze
 
 
 class VirtualenvBackend:
@@ -88,7 +89,8 @@ class VirtualenvBackend:
         deps_group_name: str,
         deps_path: Path,
         extras: list[str] | None = None,
-        verbose: bool = False
+        verbose: bool = False,
+        env: dict[str, str] | None = None
     ) -> bool:
         """Install dependencies in the virtualenv using pip."""
         typer.echo(f'  Group "{deps_group_name}"...', nl=False)
@@ -108,7 +110,8 @@ class VirtualenvBackend:
                 check=True,
                 capture_output=True,
                 text=True,
-                cwd=repo_path
+                cwd=repo_path,
+                env=env
             )
             if verbose and result.stdout:
                 typer.echo(result.stdout)
@@ -162,28 +165,29 @@ class VirtualenvBackend:
         """Get the absolute path to the virtualenv directory."""
         return str((repo_path / venv_name).resolve())
 
-    def get_freeze(self, venv_name: str, repo_path: Path, repo_url: str) -> str | None:
-        """Method to get the complete pip freeze output for the environment (excluding repo URL)."""
+    def get_freeze(self, venv_name: str, repo_path: Path, repo_url: str, scan: bool = True) -> str | None:
+        """
+        Method to get the complete pip freeze output for the environment (excluding repo URL).
+        It is read from the site-packages directory, pip freeze is only run if it cannot be found
+        (always with scan=False).
+        """
         try:
             venv_path = self.get_venv_path(venv_name, repo_path)
-            python_path = self._get_python_executable_path(Path(venv_path))
-            result = subprocess.run(
-                [python_path, "-m", "pip", "freeze"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if not result.stdout:
+            freeze = scan_freeze(Path(venv_path), exclude_paths=[repo_path]) if scan else None
+            if freeze is None:
+                python_path = self._get_python_executable_path(Path(venv_path))
+                freeze = subprocess.run(
+                    [python_path, "-m", "pip", "freeze"],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                ).stdout
+            if not freeze:
                 return None
-            return re.sub(rf'^.*{repo_url}.*$\n?', '', result.stdout, flags=re.MULTILINE)
+            return re.sub(rf'^.*{repo_url}.*$\n?', '', freeze, flags=re.MULTILINE)
         except (subprocess.CalledProcessError, FileNotFoundError, Exception):
             return None
 
-    def get_freeze_hash(self, venv_name: str, repo_path: Path, repo_url: str) -> str | None:
-        """Method to calculate SHA256 hash (first 16 chars) of pip freeze output for the environment."""
-        freeze = self.get_freeze(venv_name, repo_path, repo_url)
-        return hashlib.sha256(freeze.encode()).hexdigest()[:16] if freeze else None
-
     def _create_venv(self, venv_path: str, python: str, verbose: bool = False) -> None:
         """Create the virtual environment using virtualenv."""
         try:
@@ -279,6 +283,13 @@ class VirtualenvBackend:
 
         return install_cmd
 
+    def _get_pip_cmd(self, venv_path: Path, package_manager: str, action: str) -> list[str]:
+        """Method to get the pip (or uv pip) command of an action (install/uninstall) without arguments."""
+        python_path = self._get_python_executable_path(venv_path)
+        if package_manager == "uv":
+            return ["uv", "pip", action, "-p", python_path]
+        return [python_path, "-m", "pip", action, *(["-y"] if action == "uninstall" else [])]
+
     def _get_python_executable_path(self, venv_path: Path) -> str:
         """Get the python executable path inside the venv."""
         pip_executable_path = (
@@ -1,5 +1,9 @@
 """
 gvit CLI.
+
+Command modules (and their heavy dependencies) are imported lazily by GvitGroup, and the
+helpers only needed by some code paths are imported inside the functions that use them,
+so that `gvit --version` and the git fallback start as fast as possible.
 """
 
 import os
@@ -8,65 +12,28 @@ import time
 from pathlib import Path
 
 import typer
-from gvit.commands.pull import pull
-from gvit.commands.clone import clone
-from gvit.commands.commit import commit
-from gvit.commands.status import status
-from gvit.commands.init import init
-from gvit.commands.setup import setup as setup_repo
-from gvit.commands.tree import tree
-from gvit.commands.envs import list_, manage, delete, show as show_env, prune, reset, show_activate, show_deactivate
-from gvit.commands.config import setup, add_extra_deps, remove_extra_deps, show as show_config
-from gvit.commands.logs import show as show_logs, clear, stats, enable, disable, config as config_logs
-from gvit.utils.utils import get_app_commands, get_version
+
+from gvit.utils.lazy_group import LazyGroup
+from gvit.utils.manifest import COMMANDS, GROUPS, GVIT_COMMANDS, GROUP_SUBCOMMANDS
 from gvit.utils.globals import ASCII_LOGO
 from gvit.git import Git
-from gvit.logger import GvitLogger
-from gvit.env_registry import EnvRegistry
 from gvit.error_handler import clear_error_message, get_error_message
 
 
+class GvitGroup(LazyGroup):
+    """Root group of the gvit CLI. Command modules are imported only when the command is invoked."""
+
+    lazy_commands = COMMANDS
+    lazy_groups = GROUPS
+
+
 app = typer.Typer(
+    cls=GvitGroup,
     context_settings={"help_option_names": ["-h", "--help"]},
     no_args_is_help=False,
     invoke_without_command=True
 )
 
-config = typer.Typer(help="Configuration management commands.")
-config.command()(setup)
-config.command()(add_extra_deps)
-config.command()(remove_extra_deps)
-config.command()(show_config)
-
-envs = typer.Typer(help="Environments management commands.")
-envs.command(name="list")(list_)
-envs.command()(manage)
-envs.command()(delete)
-envs.command()(reset)
-envs.command(name="show")(show_env)
-envs.command()(prune)
-envs.command()(show_activate)
-envs.command()(show_deactivate)
-
-logs = typer.Typer(help="Log management commands.")
-logs.command(name="show")(show_logs)
-logs.command()(clear)
-logs.command()(stats)
-logs.command()(enable)
-logs.command()(disable)
-logs.command(name="config")(config_logs)
-
-app.add_typer(config, name="config")
-app.add_typer(envs, name="envs")
-app.add_typer(logs, name="logs")
-app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})(clone)
-app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})(commit)
-app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})(init)
-app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})(pull)
-app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})(status)
-app.command(name="setup")(setup_repo)
-app.command()(tree)
-
 
 @app.callback(invoke_without_command=True)
 def main(
@@ -78,6 +45,7 @@ def main(
         typer.echo("Use `gvit --help` to see available commands.\n")
         raise typer.Exit()
     if version:
+        from gvit.utils.utils import get_version
         typer.echo(get_version())
         raise typer.Exit()
 
@@ -88,7 +56,7 @@ def gvit_cli() -> None:
 
     Flow:
     1. Parse command from argv.
-    2. Check if it is a git command/alias, delegate if so (do not log).
+    2. Check if it is a git command/alias, replace the process with git if so (do not log).
     3. Execute gvit command via typer.
     4. Log command execution (time, exit code, etc.).
     """
@@ -99,7 +67,8 @@ def gvit_cli() -> None:
     command_info = _parse_command_from_argv()
 
     if command_info and command_info["is_git_fallback"]:
-        Git().run(sys.argv[1:])
+        # Git fallbacks are not logged, so gvit can be replaced by git right away
+        Git().passthrough(sys.argv[1:])
         return None
 
     try:
@@ -155,9 +124,7 @@ def _parse_command_from_argv() -> dict | None:
     if command in ["-h", "--help", "-V", "--version"] or command.startswith("-"):
         return None
 
-    gvit_commands = get_app_commands(app)
-
-    if command in gvit_commands:
+    if command in GVIT_COMMANDS:
         return {
             "command": command,
             "is_git_fallback": False,
@@ -166,7 +133,7 @@ def _parse_command_from_argv() -> dict | None:
 
     git = Git()
 
-    if (resolved := git.resolve_alias(command)) in gvit_commands:
+    if (resolved := git.resolve_alias(command)) in GVIT_COMMANDS:
           # Replace alias with actual command
         sys.argv[1] = resolved
         return {
@@ -175,7 +142,8 @@ def _parse_command_from_argv() -> dict | None:
             "should_log": True,
         }
 
-    if git.command_exists(command):
+    # Aliases are resolved from the git config, the catalogue covers built-in and external commands
+    if resolved != command or git.command_exists(command):
         return {
             "command": command,
             "is_git_fallback": True,
@@ -185,13 +153,14 @@ def _parse_command_from_argv() -> dict | None:
 
 def _log_command(command: str, exit_code: int, duration_ms: int, error: str = "") -> None:
     """Log command execution to the logger."""
-    group_commands = ["config", "envs", "logs"]
+    from gvit.logger import GvitLogger
+
     no_env_commands = ["config", "logs", "tree"]
-    no_env_subcommands = ["config", "envs.list", "envs.prune", "logs", "tree"]
+    no_env_subcommands = ["cache.stats", "cache.prune", "config", "envs.list", "envs.prune", "envs.reindex", "envs.migrate", "logs", "tree"]
 
-    if len(sys.argv) > 2 and command in group_commands:
+    if len(sys.argv) > 2 and command in GROUP_SUBCOMMANDS:
         subcommand = sys.argv[2]
-        command_short = f"{command}.{subcommand}" if not subcommand.startswith("-") else command
+        command_short = f"{command}.{subcommand}" if subcommand in GROUP_SUBCOMMANDS[command] else command
     else:
         command_short = command
 
@@ -251,14 +220,12 @@ def _detect_environment_from_argv() -> str:
             target_dir = Path(sys.argv[i + 1]).resolve()
             break
 
+    from gvit.env_registry import EnvRegistry
+
     target_dir = target_dir or Path(os.getcwd()).resolve()
-    registry = EnvRegistry()
-    for env in registry.get_environments():
-        repo_path = Path(env["repository"]["path"]).resolve()
-        if repo_path == target_dir:
-            return env["environment"]["name"]
+    env = EnvRegistry().find_by_repo(target_dir)
 
-    return ""
+    return env["environment"]["name"] if env else ""
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+"""
+Shared package cache management commands for gvit.
+
+Provides commands to inspect and prune the pip and uv caches shared by all the environments.
+"""
+
+import typer
+from rich.console import Console
+
+from gvit.utils.packages_cache import (
+    get_packages_cache_dir,
+    get_packages_cache_max_size,
+    get_packages_cache_stats,
+    prune_packages_cache,
+)
+
+
+console = Console()
+
+
+def stats() -> None:
+    """Show the shared package cache statistics."""
+    if (cache_dir := get_packages_cache_dir()) is None:
+        console.print("[yellow]The shared package cache is disabled (cache.enabled = false).[/yellow]")
+        return None
+    cache_stats = get_packages_cache_stats(cache_dir)
+    total_bytes = sum(tool_stats["size_bytes"] for tool_stats in cache_stats.values())
+    max_size = get_packages_cache_max_size()
+    console.print("[bold]📦 Package Cache Statistics[/bold]\n")
+    console.print(f"- [green]Directory:[/green] {cache_dir}")
+    console.print(f"- [green]Total size:[/green] {round(total_bytes / 1_000_000, 2)} MB (max: {round(max_size / 1_000_000)} MB)")
+    for package_manager, tool_stats in cache_stats.items():
+        console.print(
+            f"- [dim]{package_manager}: {tool_stats['entries']} entries, "
+            f"{round(tool_stats['size_bytes'] / 1_000_000, 2)} MB ({tool_stats['path']})[/dim]"
+        )
+
+
+def prune(
+    max_size: int | None = typer.Option(
+        None, "--max-size", "-m", help="Maximum size of the cache in MB (default: cache.max_size_mb from the config)."
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", "-d", is_flag=True, help="Show what would be evicted."),
+) -> None:
+    """
+    Evict the least recently used entries of the shared package cache until it fits in the maximum size.
+
+    Do not run it while dependencies are being installed.
+    """
+    if (cache_dir := get_packages_cache_dir()) is None:
+        console.print("[yellow]The shared package cache is disabled (cache.enabled = false).[/yellow]")
+        return None
+    max_size_bytes = max_size * 1_000_000 if max_size is not None else get_packages_cache_max_size()
+    typer.echo(f"- Pruning package cache to {round(max_size_bytes / 1_000_000)} MB...", nl=False)
+    evicted, freed = prune_packages_cache(cache_dir, max_size_bytes, dry_run)
+    typer.echo("✅")
+    action = "Would evict" if dry_run else "Evicted"
+    typer.echo(f"  {action} {evicted} entries ({round(freed / 1_000_000, 2)} MB).")
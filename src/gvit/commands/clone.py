@@ -99,5 +99,7 @@ def clone(
 
     # 7. Summary message
     show_summary_message(
-        registry_name=registry_name, repo_path=Path(target_dir), venv_path=Path(venv_path), backend=backend
+        registry_name=registry_name,
+        registry_location=env_registry.get_registry_location(registry_name),
+        repo_path=Path(target_dir), venv_path=Path(venv_path), backend=backend
     )
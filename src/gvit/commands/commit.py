@@ -11,7 +11,7 @@ import typer
 from gvit.env_registry import EnvRegistry
 from gvit.utils.utils import load_local_config, get_verbose
 from gvit.utils.validators import validate_directory, validate_git_repo
-from gvit.backends.common import get_freeze, get_freeze_hash, get_freeze_diff, show_freeze_diff
+from gvit.backends.common import get_freeze, get_freeze_diff, show_freeze_diff
 from gvit.git import Git
 from gvit.error_handler import exit_with_error
 
@@ -56,10 +56,9 @@ def commit(
     # 4. Get environment from registry (search by repo path)
     typer.echo("- Searching for the environment in the registry...", nl=False)
     env_registry = EnvRegistry()
-    envs = [env for env in env_registry.get_environments() if Path(env['repository']['path']) == target_dir_]
+    env = env_registry.find_by_repo(target_dir_)
     git = Git()
-    if envs:
-        env = envs[0]
+    if env:
         registry_name = env["environment"]["name"]
         venv_name = Path(env["environment"]["path"]).name
         backend = env["environment"]["backend"]
@@ -67,7 +66,6 @@ def commit(
         stored_freeze_hash = env.get("deps", {}).get("installed", {}).get("_freeze_hash")
         typer.secho(f'environment found: "{registry_name}". ✅', fg=typer.colors.GREEN)
     else:
-        env = None
         stored_freeze_hash = None
         typer.secho("⚠️  No tracked environment found for this repository.", fg=typer.colors.YELLOW)
         typer.echo("\n- Skipping dependency validation. Use `gvit setup` to track this repository.\n")
@@ -87,16 +85,18 @@ def commit(
     # 6. Validate dependencies
     typer.echo("\n- Validating dependencies...", nl=False)
 
-    current_freeze_hash = get_freeze_hash(venv_name, repo_path, env["repository"]["url"], backend)
+    current_freeze = get_freeze(venv_name, repo_path, env["repository"]["url"], backend)
+    current_freeze_hash = current_freeze.hash if current_freeze else None
 
-    if current_freeze_hash == stored_freeze_hash:
+    if current_freeze_hash == stored_freeze_hash or (
+        current_freeze and env_registry.restamp_legacy_freeze(env, current_freeze)
+    ):
         typer.secho("dependencies are in sync ✅", fg=typer.colors.GREEN)
     else:
         typer.secho("⚠️  Dependency drift detected!", fg=typer.colors.YELLOW)
         typer.echo("  The installed packages differ from the last tracked state.\n")
 
-        stored_freeze = env.get("deps", {}).get("installed", {}).get("_freeze", "")
-        current_freeze = get_freeze(venv_name, repo_path, env["repository"]["url"], backend)
+        stored_freeze = env_registry.load_freeze(env)
 
         if stored_freeze and current_freeze:
             added, removed, changed = get_freeze_diff(stored_freeze, current_freeze)
@@ -228,7 +228,7 @@ def show() -> None:
 def _get_updated_local_config(
     backend: str, python: str, package_manager: str, base_deps: str, conda_path: str | None, venv_name: str | None, logging: bool
 ) -> LocalConfig:
-    """Build the local configuration file, preserving existing extra deps."""
+    """Build the local configuration file, preserving existing extra deps, registry and cache settings."""
     existing_config = load_local_config()
     config = {
         "gvit": {
@@ -247,6 +247,10 @@ def _get_updated_local_config(
             "ignored": existing_config.get("logging", {}).get("ignored", DEFAULT_LOG_IGNORED_COMMANDS)
         }
     }
+    if "registry" in existing_config:
+        config["registry"] = existing_config["registry"]
+    if "cache" in existing_config:
+        config["cache"] = existing_config["cache"]
     if conda_path or venv_name:
         config["backends"] = existing_config.get("backends", {})
         if conda_path:
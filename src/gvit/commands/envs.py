@@ -8,17 +8,24 @@ import subprocess
 import shutil
 from pathlib import Path
 
-import toml
 import typer
 import questionary
 import pyperclip
 
 from gvit.env_registry import EnvRegistry
-from gvit.utils.globals import ENVS_DIR, DEFAULT_LOG_SHOW_LIMIT, SUPPORTED_PACKAGE_MANAGERS
-from gvit.utils.utils import load_local_config, load_repo_config, get_package_manager
+from gvit.utils.globals import DEFAULT_LOG_SHOW_LIMIT, SUPPORTED_PACKAGE_MANAGERS, SUPPORTED_REGISTRY_STORAGES
+from gvit.utils.utils import (
+    ensure_local_config_dir,
+    load_local_config,
+    save_local_config,
+    load_repo_config,
+    get_package_manager,
+    get_registry_storage
+)
 from gvit.backends.common import create_venv, delete_venv, install_dependencies, get_activate_cmd, get_deactivate_cmd
-from gvit.utils.validators import validate_directory, validate_package_manager
+from gvit.utils.validators import validate_directory, validate_package_manager, validate_registry_storage
 from gvit.error_handler import exit_with_error
+from gvit.utils.freeze import prune_freezes_cache
 from gvit.commands.logs import show as show_logs
 
 
@@ -121,10 +128,13 @@ def manage() -> None:
         delete(venv_name, verbose=False)
 
 
-def list_() -> None:
+def list_(
+    backend: str = typer.Option(None, "--backend", "-b", help="Only list the environments of this backend."),
+    python: str = typer.Option(None, "--python", "-p", help="Only list the environments of this Python version.")
+) -> None:
     """List the environments tracked in the gvit environment registry."""
     env_registry = EnvRegistry()
-    envs = env_registry.get_environments()
+    envs = env_registry.get_environments(backend=backend, python=python)
     if not envs:
         typer.echo("No environments in registry.")
         return None
@@ -136,7 +146,7 @@ def list_() -> None:
         backend = env["environment"]["backend"]
         python = env["environment"]["python"]
         repo_path = env["repository"]["path"]
-        env_registry_file = ENVS_DIR / f"{venv_name}.toml"
+        env_registry_file = env_registry.get_registry_location(venv_name)
         activate_cmd = get_activate_cmd(backend, venv_name, Path(venv_path)) or f"# Activate command for {backend} not available"
         typer.secho(f"\n  • {venv_name}", fg=typer.colors.CYAN, bold=True)
         typer.echo(f"    Backend:       {backend}")
@@ -167,12 +177,10 @@ def show_activate(
             typer.secho(f'⚠️  Environment "{venv_name}" not found.', fg=typer.colors.YELLOW)
             return None
     else:
-        cwd = Path(".").resolve()
-        envs = [env for env in env_registry.get_environments() if Path(env['repository']['path']) == cwd]
-        if not envs:
+        env = env_registry.find_by_repo(Path(".").resolve())
+        if env is None:
             typer.secho("⚠️  No tracked environment found for this repository.", fg=typer.colors.YELLOW)
             return None
-        env = envs[0]
 
     backend = env["environment"]["backend"]
     venv_path = env["environment"]["path"]
@@ -204,12 +212,10 @@ def show_deactivate(
             typer.secho(f'⚠️  Environment "{venv_name}" not found.', fg=typer.colors.YELLOW)
             return None
     else:
-        cwd = Path(".").resolve()
-        envs = [env for env in env_registry.get_environments() if Path(env['repository']['path']) == cwd]
-        if not envs:
+        env = env_registry.find_by_repo(Path(".").resolve())
+        if env is None:
             typer.secho("⚠️  No tracked environment found for this repository.", fg=typer.colors.YELLOW)
             return None
-        env = envs[0]
 
     backend = env["environment"]["backend"]
 
@@ -270,6 +276,8 @@ def prune(
 
     if not orphaned_envs:
         typer.echo("no orphaned environments found")
+        if not dry_run:
+            _prune_freezes_cache()
         return None
 
     typer.echo(f"found {len(orphaned_envs)} orphaned environment(s):\n")
@@ -317,6 +325,11 @@ def prune(
         for venv_info in orphaned_envs
         if venv_info["environment"]["name"] not in errors_registry + errors_backend
     ]
+    typer.echo("\n- Removing unreferenced freeze snapshots...", nl=False)
+    n_snapshots = env_registry.collect_freezes_garbage()
+    typer.echo(f"{n_snapshots} removed ✅")
+    _prune_freezes_cache()
+
     if pruned_envs:
         typer.echo(f"\n🎉 Pruned {len(pruned_envs)} environment(s).")
     if errors_registry:
@@ -325,6 +338,43 @@ def prune(
         typer.secho(f'\n⚠️  Errors on backend deletion: {errors_backend}', fg=typer.colors.YELLOW)
 
 
+def reindex() -> None:
+    """
+    Rebuild the index of the environment registry.
+
+    The index maps each repository path to its environments, so that commands run inside a
+    repository (pull, commit, status...) do not need to parse every registry file.
+    It is kept up to date automatically; use this command if it gets out of sync.
+    """
+    typer.echo("- Rebuilding environment registry index...", nl=False)
+    n_envs = EnvRegistry().reindex()
+    typer.echo(f"{n_envs} environment(s) indexed ✅")
+
+
+def migrate(
+    to: str = typer.Option("sqlite", "--to", help=f"Target storage engine ({'/'.join(SUPPORTED_REGISTRY_STORAGES)})."),
+) -> None:
+    """
+    Migrate the environment registry to another storage engine.
+
+    The environments are copied from the current storage (TOML files by default) to the target
+    one, which is then set in the local configuration. The source registry is kept as a backup.
+    """
+    validate_registry_storage(to)
+    local_config = load_local_config()
+    current = get_registry_storage(local_config)
+    if to == current:
+        typer.echo(f'Environment registry already uses the "{to}" storage.')
+        return None
+
+    typer.echo(f'- Migrating environment registry from "{current}" to "{to}"...', nl=False)
+    n_envs = EnvRegistry(current).migrate(to)
+    local_config.setdefault("registry", {})["storage"] = to
+    ensure_local_config_dir()
+    save_local_config(local_config)
+    typer.echo(f"{n_envs} environment(s) migrated ✅")
+
+
 def reset(
     venv_name: str = typer.Argument(help="Name of the environment to reset."),
     package_manager: str = typer.Option(None, "--package-manager", "-m", help=f"Python package manager ({'/'.join(SUPPORTED_PACKAGE_MANAGERS)})."),
@@ -397,16 +447,15 @@ def reset(
         if "deps" in venv_info and "installed" in venv_info.get("deps", {}):
             typer.echo("\n- Clearing dependency tracking from registry...", nl=False)
             venv_info["deps"].pop("installed", None)
-            with open(ENVS_DIR / f"{registry_name}.toml", "w") as f:
-                toml.dump(venv_info, f)
+            env_registry.save_environment_info(registry_name, venv_info)
             typer.echo("✅")
-        _show_summary_msg_reset(registry_name)
+        _show_summary_msg_reset(registry_name, env_registry.get_registry_location(registry_name))
         return None
 
     deps = venv_info.get("deps", {})
     if not deps or ("_base" not in deps and len([k for k in deps.keys() if k != "installed"]) == 0):
         typer.echo("\n- No dependencies tracked in registry...✅")
-        _show_summary_msg_reset(registry_name)
+        _show_summary_msg_reset(registry_name, env_registry.get_registry_location(registry_name))
         return None
 
     local_config = load_local_config()
@@ -441,7 +490,7 @@ def reset(
     )
 
     # 5. Summary message
-    _show_summary_msg_reset(registry_name)
+    _show_summary_msg_reset(registry_name, env_registry.get_registry_location(registry_name))
 
 
 def show(venv_name: str = typer.Argument(help="Name of the environment to display.")) -> None:
@@ -452,15 +501,14 @@ def show(venv_name: str = typer.Argument(help="Name of the environment to displa
         typer.secho(f'Environment "{venv_name}" not found in registry.', fg=typer.colors.YELLOW)
         return None
 
-    env_file = ENVS_DIR / f"{venv_name}.toml"
+    env_file = env_registry.get_registry_location(venv_name)
 
     typer.secho(f"───────┬────────────────────────────────────────────────────────", fg=typer.colors.BRIGHT_BLACK)
     typer.secho(f"       │ File: {env_file}", fg=typer.colors.BRIGHT_BLACK)
     typer.secho(f"───────┼────────────────────────────────────────────────────────", fg=typer.colors.BRIGHT_BLACK)
 
     try:
-        with open(env_file, 'r') as f:
-            lines = f.readlines()
+        lines = (env_registry.dump_environment_info(venv_name) or "").splitlines()
 
         for i, line in enumerate(lines, 1):
             line = line.rstrip()
@@ -544,7 +592,13 @@ def _open_editor(path: Path) -> None:
         exit_with_error(error_msg)
 
 
-def _show_summary_msg_reset(registry_name: str) -> None:
+def _show_summary_msg_reset(registry_name: str, registry_location: str) -> None:
     """Function to show the summary message of the reset command."""
     typer.echo(f'\n🎉 Environment "{registry_name}" reset successfully!')
-    typer.echo(f'📖 Registry updated at: {ENVS_DIR / f"{registry_name}.toml"}')
+    typer.echo(f'📖 Registry updated at: {registry_location}')
+
+
+def _prune_freezes_cache() -> None:
+    """Function to remove the cached freezes of the environments that no longer exist."""
+    typer.echo("\n- Removing the cached freezes of deleted environments...", nl=False)
+    typer.echo(f"{prune_freezes_cache()} removed ✅")
@@ -112,5 +112,7 @@ def init(
 
     # 9. Summary message
     show_summary_message(
-        registry_name=registry_name, repo_path=target_dir_, venv_path=Path(venv_path), backend=backend
+        registry_name=registry_name,
+        registry_location=env_registry.get_registry_location(registry_name),
+        repo_path=target_dir_, venv_path=Path(venv_path), backend=backend
     )
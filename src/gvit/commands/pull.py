@@ -8,11 +8,15 @@ import typer
 
 from gvit.env_registry import EnvRegistry
 from gvit.utils.utils import load_local_config, load_repo_config, get_verbose, get_extra_deps, get_package_manager
-from gvit.backends.common import install_dependencies
+from gvit.backends.common import (
+    install_dependencies, install_extra_dependencies, record_packages_cache_use, sync_dependencies
+)
 from gvit.utils.schemas import RegistryFile, RepoConfig
 from gvit.utils.validators import validate_directory, validate_git_repo, validate_package_manager
 from gvit.git import Git
 from gvit.utils.globals import SUPPORTED_PACKAGE_MANAGERS
+from gvit.utils.freeze import get_required_packages
+from gvit.utils.requirements import get_requirements_includes, get_requirements_delta, get_requirement_name
 
 
 def pull(
@@ -23,6 +27,7 @@ def pull(
     extra_deps: str = typer.Option(None, "--extra-deps", help="Extra dependency groups (e.g. 'dev,test' or 'dev:path.txt,test:path2.txt')."),
     no_deps: bool = typer.Option(False, "--no-deps", help="Skip dependency reinstallation even if changes detected."),
     force_deps: bool = typer.Option(False, "--force-deps", "-f", help="Force reinstall all dependencies even if no changes detected."),
+    prune: bool = typer.Option(False, "--prune", help="Uninstall the packages removed from the dependency files."),
     verbose: bool = typer.Option(False, "--verbose", "-v", is_flag=True, help="Show verbose output.")
 ) -> None:
     """
@@ -30,6 +35,10 @@ def pull(
 
     Runs `git pull` and then checks if dependency files have changed.
     If changes are detected, automatically reinstalls the affected dependencies.
+    Dependency files (and the files they include with -r/-c) untouched according to git are not checked.
+    Changed requirements files and pyproject.toml extras are synced package by package: only the added or
+    changed requirements are installed (and the removed ones uninstalled with --prune). The project is only
+    built again when its base dependencies or build configuration change.
 
     Any extra options will be passed directly to `git pull`.
     """
@@ -47,22 +56,21 @@ def pull(
     # 4. Get environment from registry (search by repo path)
     typer.echo("- Searching for the environment in the registry...", nl=False)
     env_registry = EnvRegistry()
-    envs = [env for env in env_registry.get_environments() if Path(env['repository']['path']) == target_dir_]
-    if envs:
-        env = envs[0]
+    env = env_registry.find_by_repo(target_dir_)
+    if env:
         registry_name = env["environment"]["name"]
         venv_name = Path(env["environment"]["path"]).name
         typer.secho(f'environment found: "{registry_name}". ✅', fg=typer.colors.GREEN)
     else:
-        env = None
         typer.secho(
             "⚠️  No tracked environment found for this repository (run `gvit setup`).",
             fg=typer.colors.YELLOW
         )
 
     # 5. Run git pull
+    git = Git()
     typer.echo("\n- Running git pull...", nl=False)
-    Git().pull(str(target_dir_), ctx.args, verbose)
+    git.pull(str(target_dir_), ctx.args, verbose)
 
     # 6. Skip dependency check if --no-deps
     if no_deps:
@@ -85,7 +93,11 @@ def pull(
         to_reinstall = current_deps
     else:
         typer.echo("\n- Searching for changes in dependencies...", nl=False)
-        modified_deps_groups = env_registry.get_modified_deps_groups(registry_name, current_deps)
+        modified_deps_groups = (
+            env_registry.get_modified_deps_groups(registry_name, current_deps)
+            if _deps_may_have_changed(git, target_dir_, env, current_deps)
+            else []
+        )
         to_reinstall = {k: v for k, v in current_deps.items() if k in modified_deps_groups}
         if not to_reinstall:
             typer.secho("environment is up to date ✅", fg=typer.colors.GREEN)
@@ -94,28 +106,53 @@ def pull(
             return None
         typer.echo("✅")
 
-    # 9. Reinstall changed dependencies
-    if "_base" not in to_reinstall:
-        to_reinstall["_base"] = current_deps["_base"]
     package_manager = package_manager or get_package_manager(local_config)
     validate_package_manager(package_manager)
+
+    # 9. Sync changed requirements files and extras package by package (only added, changed or removed requirements)
+    if not force_deps:
+        to_reinstall = _sync_changed_requirements(
+            env,
+            venv_name,
+            to_reinstall,
+            env_registry.get_deps_requirements(target_dir_, current_deps),
+            target_dir_,
+            package_manager,
+            prune,
+            verbose,
+        )
+
+    # 10. Reinstall the rest of changed dependencies (the base deps only if they changed)
     # I do not care about the resolved_base_deps and resolved_extra_deps returned by the install_dependencies
     # function because there might be some extra deps which are not reinstalled, so we have to pass to
     # the save_venv_info function the current_deps, to keep track of all the groups, not just the ones
     # that have been modified and, therefore, reinstalled.
-    install_dependencies(
-        venv_name=venv_name,
-        backend=env['environment']['backend'],
-        package_manager=package_manager,
-        repo_path=str(target_dir_),
-        base_deps=to_reinstall["_base"],
-        extra_deps=_get_parsed_extra_deps(to_reinstall),
-        repo_config=repo_config,
-        local_config=local_config,
-        verbose=verbose
-    )
+    if to_reinstall and "_base" not in to_reinstall:
+        install_extra_dependencies(
+            venv_name=venv_name,
+            backend=env['environment']['backend'],
+            package_manager=package_manager,
+            repo_path=str(target_dir_),
+            extra_deps=to_reinstall,
+            verbose=verbose
+        )
+    elif to_reinstall:
+        install_dependencies(
+            venv_name=venv_name,
+            backend=env['environment']['backend'],
+            package_manager=package_manager,
+            repo_path=str(target_dir_),
+            base_deps=to_reinstall["_base"],
+            extra_deps=_get_parsed_extra_deps(to_reinstall),
+            repo_config=repo_config,
+            local_config=local_config,
+            verbose=verbose
+        )
+    else:
+        # Everything was synced (the installs above record the use of the package cache themselves)
+        record_packages_cache_use(venv_name, env['environment']['backend'], str(target_dir_))
 
-    # 10. Update registry with new hashes
+    # 11. Update registry with new hashes
     env_registry.save_venv_info(
         registry_name=registry_name,
         venv_name=venv_name,
@@ -131,6 +168,104 @@ def pull(
     typer.echo("\n🎉 Repository and environment updated successfully!")
 
 
+def _deps_may_have_changed(git: Git, repo_path: Path, env: RegistryFile, current_deps: dict[str, str]) -> bool:
+    """
+    Function to check with git whether any dependency file (or any file it includes via -r/-c)
+    changed since the commit the dependencies were installed at (_commit in the registry): pulled,
+    committed, checked out, reset or modified locally.
+    If git cannot tell (unknown commit or not an ancestor of HEAD, files outside the repository or
+    untracked), it returns True so that the dependency files are hashed.
+    """
+    installed_commit = env.get("deps", {}).get("installed", {}).get("_commit")
+    if not installed_commit or not git.is_ancestor(str(repo_path), installed_commit):
+        return True
+    dep_files = set()
+    for dep_path in current_deps.values():
+        dep_file = (repo_path / dep_path).resolve()
+        dep_files.add(dep_file)
+        if dep_file.name != "pyproject.toml":
+            dep_files.update(get_requirements_includes(dep_file, repo_path))
+    try:
+        paths = sorted(dep_file.relative_to(repo_path).as_posix() for dep_file in dep_files)
+    except ValueError:
+        return True
+    tracked_files = git.get_tracked_files(str(repo_path), paths)
+    if tracked_files is None or set(paths) - tracked_files:
+        return True
+    changed_files = git.get_changed_files(str(repo_path), installed_commit, paths)
+    return changed_files is None or bool(changed_files)
+
+
+def _sync_changed_requirements(
+    env: RegistryFile,
+    venv_name: str,
+    to_reinstall: dict[str, str],
+    current_requirements: dict[str, list[str] | None],
+    repo_path: Path,
+    package_manager: str,
+    prune: bool,
+    verbose: bool,
+) -> dict[str, str]:
+    """
+    Function to sync the changed dependency groups package by package, comparing the requirements
+    stored in the registry when they were installed with the current ones (all the current ones are
+    installed if none were stored).
+    Packages removed from a group are only uninstalled with prune, and never if another group or any
+    package left in the environment requires them. Nothing is uninstalled if the requirements of another
+    group are unknown (pyproject.toml base, or files with options such as -e or -c).
+    Returns the groups that could not be synced this way (to be reinstalled as a whole).
+    """
+    installed = env.get("deps", {}).get("installed", {})
+    deltas = {
+        dep_name: get_requirements_delta(installed.get(f"{dep_name}_requirements", []), requirements)
+        for dep_name in to_reinstall
+        if (requirements := current_requirements.get(dep_name)) is not None
+    }
+    if not deltas:
+        return to_reinstall
+
+    typer.echo(f"\n- Syncing changed requirements with {package_manager}...")
+    pending = dict(to_reinstall)
+    for dep_name, (to_install, removed) in deltas.items():
+        to_uninstall = _get_packages_to_prune(env, dep_name, removed, current_requirements) if prune else []
+        if sync_dependencies(
+            venv_name=venv_name,
+            backend=env["environment"]["backend"],
+            package_manager=package_manager,
+            repo_path=str(repo_path),
+            deps_group_name=dep_name,
+            to_install=to_install,
+            to_uninstall=to_uninstall,
+            verbose=verbose,
+        ):
+            pending.pop(dep_name)
+    return pending
+
+
+def _get_packages_to_prune(
+    env: RegistryFile, dep_name: str, removed: list[str], current_requirements: dict[str, list[str] | None]
+) -> list[str]:
+    """
+    Function to get the packages removed from a group that can be uninstalled: not required by another group
+    nor by any other package installed in the environment (pip uninstall does not check the dependents).
+    Returns none if the requirements of another group or the installed packages cannot be known.
+    """
+    if not removed:
+        return []
+    other_requirements = [requirements for name, requirements in current_requirements.items() if name != dep_name]
+    if any(requirements is None for requirements in other_requirements):
+        typer.secho(
+            f'  ⚠️  Not pruning "{dep_name}": the requirements of the other groups are unknown.', fg=typer.colors.YELLOW
+        )
+        return []
+    required_elsewhere = {get_requirement_name(spec) for requirements in other_requirements for spec in requirements or []}
+    env_path = env["environment"].get("path")
+    required_installed = get_required_packages(Path(env_path), set(removed)) if env_path else None
+    if required_installed is None:
+        return []
+    return [name for name in removed if name not in required_elsewhere and name not in required_installed]
+
+
 def _get_parsed_extra_deps(to_reinstall: dict[str, str]) -> str:
     """Function to get the correct extra_deps format for the installation."""
     return (
@@ -61,24 +61,24 @@ def status(
     typer.secho("═══════════════════════════════════════════════════════════", fg=typer.colors.MAGENTA, bold=True)
 
     env_registry = EnvRegistry()
-    envs = [env for env in env_registry.get_environments() if Path(env['repository']['path']) == target_dir_]
+    env = env_registry.find_by_repo(target_dir_)
 
-    if not envs:
+    if not env:
         typer.secho("\n  ⚠️  No tracked environment found for this repository.", fg=typer.colors.YELLOW)
         typer.echo("  Run `gvit setup` to track this repository.\n")
         return None
 
-    env = envs[0]
     venv_name = Path(env["environment"]["path"]).name
     backend = env["environment"]["backend"]
     repo_path = Path(env["repository"]["path"])
-    stored_freeze = env.get("deps", {}).get("installed", {}).get("_freeze", "")
+    installed = env.get("deps", {}).get("installed", {})
+    stored_freeze_hash = installed.get("_freeze_hash")
 
     typer.echo(f'\n  Environment: {env["environment"]["name"]}')
     typer.echo(f"  Backend: {backend}")
     typer.echo(f"  Path: {env['environment']['path']}")
 
-    if not stored_freeze:
+    if not stored_freeze_hash and not installed.get("_freeze"):
         typer.echo("\n  ⚠️  No freeze snapshot found in registry.")
         typer.echo("  Dependencies were installed without tracking.\n")
         return None
@@ -90,7 +90,15 @@ def status(
         typer.echo("  The environment may not exist or be corrupted.\n")
         return None
 
-    added, removed, changed = get_freeze_diff(stored_freeze, current_freeze)
+    # Compare hashes first, the stored snapshot is only loaded if the environment changed
+    if current_freeze.hash == stored_freeze_hash or env_registry.restamp_legacy_freeze(env, current_freeze):
+        added, removed, changed = {}, {}, {}
+    elif stored_freeze := env_registry.load_freeze(env):
+        added, removed, changed = get_freeze_diff(stored_freeze, current_freeze)
+    else:
+        typer.echo("\n  ⚠️  Freeze snapshot not found in the freeze store.")
+        typer.echo("  Run `gvit pull` or `gvit envs reset` to track the environment again.\n")
+        return None
 
     typer.echo()
     show_freeze_diff(added, removed, changed)
@@ -5,6 +5,8 @@ Module for the "gvit tree" command.
 import typer
 from click import Group
 
+from gvit.git import Git
+
 
 def tree(ctx: typer.Context) -> None:
     """Display all available commands in a tree structure."""
@@ -14,17 +16,34 @@ def tree(ctx: typer.Context) -> None:
     # Type check to satisfy Pylance
     if not isinstance(root, Group):
         return None
-    commands = sorted(root.commands.items())
+    # Use list_commands/get_command so lazily loaded commands are resolved too
+    commands = [(name, root.get_command(ctx, name)) for name in root.list_commands(ctx)]
+    git_aliases = _get_git_aliases_by_command([name for name, _ in commands])
     for i, (name, cmd) in enumerate(commands):
         is_last = i == len(commands) - 1
         prefix = "└──" if is_last else "├──"
         if not isinstance(cmd, Group):
-            typer.echo(f"{prefix} {name}")
+            typer.echo(f"{prefix} {name}", nl=False)
+        else:
+            typer.secho(f"{prefix} {name}", fg=typer.colors.CYAN, bold=True, nl=False)
+        if aliases := git_aliases.get(name):
+            typer.secho(f" (git aliases: {', '.join(aliases)})", dim=True, nl=False)
+        typer.echo()
+        if not isinstance(cmd, Group):
             continue
-        typer.secho(f"{prefix} {name}", fg=typer.colors.CYAN, bold=True)
-        subcommands = sorted(cmd.commands.items())
-        for j, (sub_name, _) in enumerate(subcommands):
+        subcommands = sorted(cmd.list_commands(ctx))
+        for j, sub_name in enumerate(subcommands):
             is_last_sub = j == len(subcommands) - 1
             continuation = "    " if is_last else "│   "
             sub_prefix = "└──" if is_last_sub else "├──"
             typer.echo(f"{continuation}{sub_prefix} {sub_name}")
+
+
+def _get_git_aliases_by_command(commands: list[str]) -> dict[str, list[str]]:
+    """Function to get the git aliases that resolve to each gvit command."""
+    git = Git()
+    aliases_by_command: dict[str, list[str]] = {}
+    for alias in sorted(git.get_aliases()):
+        if (resolved := git.resolve_alias(alias)) in commands:
+            aliases_by_command.setdefault(resolved, []).append(alias)
+    return aliases_by_command
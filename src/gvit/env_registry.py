@@ -5,24 +5,50 @@ Module for managing environment registry and persistence.
 from pathlib import Path
 from datetime import datetime
 import hashlib
+import json
 from typing import cast, Any
 
-import toml
 import typer
 
-from gvit.backends.common import get_freeze, get_freeze_hash
-from gvit.utils.globals import ENVS_DIR
+from gvit.backends.common import get_freeze
+from gvit.freeze_store import FreezeStore
+from gvit.git import Git
+from gvit.storages.common import get_storage
+from gvit.utils.files import file_lock, get_file_stat
+from gvit.utils.freeze import FREEZE_FORMAT, FreezeSnapshot
+from gvit.utils.globals import REGISTRY_LOCK_FILE
+from gvit.utils.requirements import (
+    PROJECT_FILES,
+    canonicalize_name,
+    get_requirement_name,
+    get_requirements_includes,
+    get_requirements_specifiers,
+    get_normalized_requirements,
+    normalize_requirement,
+)
+from gvit.utils.utils import load_local_config, load_toml, get_registry_storage
 from gvit.utils.schemas import RegistryFile, RegistryDeps
 
 
+# Dependency file hashes computed during this invocation -> {(path, normalize): (stat, hash)}
+_FILE_HASHES: dict[tuple[str, bool], tuple[list[int], str]] = {}
+
+
 class EnvRegistry:
     """
     Class for managing environment registry and persistence.
-    Stores information about created environments in ~/.config/gvit/envs/ folder.
+    The environments are persisted by a storage engine, selected in the local config
+    ([registry] storage): one TOML file per environment in ~/.config/gvit/envs/ (default)
+    or a SQLite database in ~/.config/gvit/envs.db.
+    The pip freeze snapshots are kept in a deduplicated FreezeStore and only referenced by hash
+    from the registry files, they are loaded on demand.
+    Writes are serialized between processes with an advisory lock on ~/.config/gvit/registry.lock.
     """
 
-    def __init__(self) -> None:
-        self._ensure_envs_dir()
+    def __init__(self, storage: str | None = None) -> None:
+        self.storage_name = storage or get_registry_storage(load_local_config())
+        self.storage = get_storage(self.storage_name)
+        self.freeze_store = FreezeStore(self._get_freeze_references)
 
     def save_venv_info(
         self,
@@ -39,8 +65,8 @@ class EnvRegistry:
     ) -> None:
         """Save environment information to registry."""
         typer.echo("\n- Saving environment info to registry...", nl=False)
-        env_file = ENVS_DIR / f"{registry_name}.toml"
         repo_abs_path = Path(repo_path).resolve()
+        freeze = None
 
         venv_info: RegistryFile = {
             "environment": {
@@ -61,24 +87,37 @@ class EnvRegistry:
                 **({"_base": base_deps} if base_deps else {}),
                 **extra_deps,
             }
-            # Add installed info
+            # Add installed info (the freeze snapshot is stored apart, referenced by its hash)
+            freeze = get_freeze(venv_name, Path(repo_path), repo_url, backend)
             deps_dict["installed"] = {
                 **self._get_deps_hashes(base_deps, extra_deps, repo_abs_path),
-                "_freeze_hash": get_freeze_hash(venv_name, Path(repo_path), repo_url, backend),
-                "_freeze": get_freeze(venv_name, Path(repo_path), repo_url, backend),
+                **self._get_deps_stats(base_deps, extra_deps, repo_abs_path),
+                "_freeze_hash": freeze.hash if freeze else None,
+                "_freeze_format": FREEZE_FORMAT,
+                "_commit": Git().get_head(str(repo_abs_path)),
                 "installed_at": datetime.now().isoformat(),
             }
             venv_info["deps"] = cast(RegistryDeps, deps_dict)
 
-        with open(env_file, "w") as f:
-            toml.dump(venv_info, f)
+        with file_lock(REGISTRY_LOCK_FILE):
+            if freeze:
+                self.freeze_store.put(registry_name, freeze.text)
+            self._save_environment_info(registry_name, venv_info)
 
         typer.echo("✅")
 
+    def save_environment_info(self, registry_name: str, venv_info: RegistryFile) -> None:
+        """Save (create or replace) the registry entry of an environment."""
+        with file_lock(REGISTRY_LOCK_FILE):
+            self._save_environment_info(registry_name, venv_info)
+
     def get_modified_deps_groups(self, venv_name: str, current_deps: dict[str, str]) -> list[str]:
         """
         Check if dependency files have changed since installation.            
         Returns a list of dependency group names that have changed.
+        For requirements files, the files they include (-r/-c/-e) are also taken into account.
+        Hashes are semantic: reordering requirements, comments or whitespace do not count as changes.
+        Files whose stat (mtime_ns, size, inode) is unchanged since installation are not hashed.
         """
         venv_info = self.load_environment_info(venv_name)
         if not venv_info:
@@ -97,45 +136,177 @@ class EnvRegistry:
             if installed_dep_name not in installed:
                 continue
             base_file = repo_path / dep_path
-            if not base_file.exists():
+            if (stat := get_file_stat(base_file)) is None:
                 continue
-            current_hash = (
-                self._hash_pyproject_deps(base_file, None if dep_name == "_base" else dep_name)
-                if base_file.name == "pyproject.toml"
-                else self._hash_file(base_file)
-            )
-            if current_hash != installed[installed_dep_name]:
+            if stat == installed.get(f"{dep_name}_stat") and (
+                base_file.name == "pyproject.toml"
+                or self._includes_unchanged(installed.get(f"{dep_name}_includes"), repo_path)
+            ):
+                continue
+            installed_hash = installed[installed_dep_name]
+            if self._hash_deps_group(base_file, dep_name, repo_path)[0] != installed_hash and (
+                # Registries written by older versions (without includes) store raw hashes
+                (base_file.name != "pyproject.toml" and f"{dep_name}_includes" in installed)
+                or self._hash_deps_group(base_file, dep_name, repo_path, normalize=False)[0] != installed_hash
+            ):
                 modified_deps_groups.append(dep_name)
 
         return modified_deps_groups
 
-    def get_environments(self) -> list[RegistryFile]:
-        """Method to get all the environments in the registry."""
-        envs = [self.load_environment_info(env_name) for env_name in self.list_environments()]
-        return [env for env in envs if env]
+    def get_deps_requirements(self, repo_path: str | Path, deps: dict[str, str]) -> dict[str, list[str] | None]:
+        """
+        Method to get the normalized requirement specifiers of every dependency group {name: path}.
+        Only requirements files (with their -r includes) and pyproject.toml extras can be installed
+        requirement by requirement, other groups map to None: the pyproject.toml base deps (they require
+        building the project), extras referencing the project itself, and files with options,
+        constraints or editable installs.
+        """
+        return {name: self._get_group_requirements(Path(repo_path) / path, name) for name, path in deps.items()}
+
+    def find_donor_env(
+        self, repo_path: str | Path, backend: str, python: str | None, deps: dict[str, str]
+    ) -> RegistryFile | None:
+        """
+        Method to find an environment of another repository that can be copied instead of installing the
+        dependency groups {name: path} of repo_path: same backend, python (if given) and dependency groups, the same
+        hash for every group, and not modified since they were installed (its freeze matches the stored one).
+        Returns None if there is no such environment.
+        """
+        repo_abs_path = Path(repo_path).resolve()
+        extra_deps = {name: path for name, path in deps.items() if name != "_base"}
+        deps_hashes = self._get_deps_hashes(deps.get("_base"), extra_deps, repo_abs_path)
+        hashes = {name: deps_hashes.get(f"{name}_hash") for name in deps}
+        if not hashes or None in hashes.values():
+            return None
+        for env in self.get_environments(backend=backend, python=python):
+            env_deps = env.get("deps", {})
+            installed = env_deps.get("installed", {})
+            env_path = Path(env["environment"]["path"])
+            if (
+                Path(env["repository"]["path"]).resolve() == repo_abs_path
+                or {name for name in env_deps if name != "installed"} != set(deps)
+                or any(installed.get(f"{name}_hash") != hash_ for name, hash_ in hashes.items())
+                or not installed.get("_freeze_hash")
+                or not env_path.exists()
+            ):
+                continue
+            freeze = get_freeze(env_path.name, Path(env["repository"]["path"]), env["repository"]["url"], backend)
+            if freeze is not None and (
+                freeze.hash == installed["_freeze_hash"] or self.restamp_legacy_freeze(env, freeze)
+            ):
+                return env
+        return None
+
+    def restamp_legacy_freeze(self, venv_info: RegistryFile, freeze: FreezeSnapshot) -> bool:
+        """
+        Re-stamp the freeze of an environment registered by older versions (without _freeze_format), whose
+        hash was computed from the output of the package manager instead of the site-packages scan.
+        The package manager is run once: if its freeze still matches the stored hash the environment did
+        not change, and the registry entry is updated with the current freeze (returns True).
+        Returns False if the entry is not legacy or the environment changed.
+        """
+        installed = venv_info.get("deps", {}).get("installed", {})
+        if installed.get("_freeze_format") or not installed.get("_freeze_hash"):
+            return False
+        legacy_freeze = get_freeze(
+            Path(venv_info["environment"]["path"]).name,
+            Path(venv_info["repository"]["path"]),
+            venv_info["repository"]["url"],
+            venv_info["environment"]["backend"],
+            scan=False,
+        )
+        if legacy_freeze is None or legacy_freeze.hash != installed["_freeze_hash"]:
+            return False
+        installed["_freeze_hash"] = freeze.hash
+        installed["_freeze_format"] = FREEZE_FORMAT
+        installed.pop("_freeze", None)
+        registry_name = venv_info["environment"]["name"]
+        with file_lock(REGISTRY_LOCK_FILE):
+            self.freeze_store.put(registry_name, freeze.text)
+            self._save_environment_info(registry_name, venv_info)
+        return True
+
+    def load_freeze(self, venv_info: RegistryFile) -> FreezeSnapshot | None:
+        """
+        Load the pip freeze snapshot of an environment from the freeze store.
+        Registry files written by older versions keep the snapshot inline in "_freeze".
+        """
+        installed = venv_info.get("deps", {}).get("installed", {})
+        if installed.get("_freeze"):
+            return FreezeSnapshot(installed["_freeze"])
+        freeze_hash = installed.get("_freeze_hash")
+        freeze = self.freeze_store.get(freeze_hash) if freeze_hash else None
+        return FreezeSnapshot(freeze) if freeze is not None else None
+
+    def collect_freezes_garbage(self) -> int:
+        """
+        Delete the freeze snapshots not referenced by any registry file.
+        Returns the number of deleted snapshots.
+        """
+        with file_lock(REGISTRY_LOCK_FILE):
+            return self.freeze_store.collect_garbage(self._get_freeze_references())
+
+    def find_by_repo(self, repo_path: str | Path) -> RegistryFile | None:
+        """
+        Find the environment of a repository (indexed lookup by repository path).
+        If several environments track the same repository, the first one (by name) is returned.
+        """
+        envs = self.storage.find_by_repo(str(Path(repo_path).resolve()))
+        return envs[0] if envs else None
+
+    def reindex(self) -> int:
+        """Rebuild the index of the registry storage. Returns the number of indexed environments."""
+        with file_lock(REGISTRY_LOCK_FILE):
+            return self.storage.reindex()
+
+    def migrate(self, storage: str) -> int:
+        """
+        Copy every environment to another storage engine, removing from it the environments not in
+        this registry. Returns the number of migrated environments.
+        """
+        target = get_storage(storage)
+        with file_lock(REGISTRY_LOCK_FILE):
+            names = self.list_environments()
+            for name in set(target.list_names()) - set(names):
+                target.delete(name)
+            for name in names:
+                if (venv_info := self.load_environment_info(name)) is not None:
+                    target.save(name, venv_info)
+        return len(names)
+
+    def get_environments(self, backend: str | None = None, python: str | None = None) -> list[RegistryFile]:
+        """Method to get all the environments in the registry, optionally filtered by backend and python."""
+        return self.storage.load_all(backend=backend, python=python)
 
     def load_environment_info(self, venv_name: str) -> RegistryFile | None:
         """Load environment information from registry."""
-        env_file = ENVS_DIR / f"{venv_name}.toml"
-        return cast(RegistryFile, toml.load(env_file)) if env_file.exists() else None
+        return self.storage.load(venv_name)
+
+    def dump_environment_info(self, venv_name: str) -> str | None:
+        """Method to get the environment information as TOML text."""
+        return self.storage.dump(venv_name)
+
+    def get_registry_location(self, venv_name: str) -> str:
+        """Method to get where the environment information is stored (for display)."""
+        return self.storage.get_location(venv_name)
 
     def list_environments(self) -> list[str]:
         """List all registered environments."""
-        return sorted([f.stem for f in ENVS_DIR.glob("*.toml")]) if ENVS_DIR.exists() else []
+        return self.storage.list_names()
 
     def venv_exists_in_registry(self, venv_name: str) -> bool:
         """Check if environment is registered."""
-        env_file = ENVS_DIR / f"{venv_name}.toml"
-        return env_file.exists()
+        return self.storage.exists(venv_name)
 
     def delete_environment_registry(self, venv_name: str) -> bool:
         """
         Delete environment information from registry.
         Returns True if deleted, False if not found.
         """
-        if (env_file := ENVS_DIR / f"{venv_name}.toml").exists():
-            env_file.unlink()
-            return True
+        with file_lock(REGISTRY_LOCK_FILE):
+            if self.storage.delete(venv_name):
+                self.freeze_store.release(venv_name)
+                return True
         return False
 
     def get_orphaned_envs(self) -> list[RegistryFile]:
@@ -144,47 +315,163 @@ class EnvRegistry:
             env for env in self.get_environments() if not Path(env['repository']['path']).exists()
         ]
 
-    def _ensure_envs_dir(self) -> None:
-        """Create environments directory if it does not exist."""
-        ENVS_DIR.mkdir(parents=True, exist_ok=True)
+    def _get_freeze_references(self) -> dict[str, list[str]]:
+        """Method to get the registry names referencing every freeze snapshot {freeze_hash: [registry_names]}."""
+        referenced: dict[str, list[str]] = {}
+        for env in self.get_environments():
+            if freeze_hash := env.get("deps", {}).get("installed", {}).get("_freeze_hash"):
+                referenced.setdefault(freeze_hash, []).append(env["environment"]["name"])
+        return referenced
+
+    def _save_environment_info(self, registry_name: str, venv_info: RegistryFile) -> None:
+        """Save the registry entry (lock already held), releasing its freeze snapshot if no longer tracked."""
+        if not venv_info.get("deps", {}).get("installed", {}).get("_freeze_hash"):
+            self.freeze_store.release(registry_name)
+        self.storage.save(registry_name, venv_info)
 
     def _get_deps_hashes(
         self, base_deps: str | None, extra_deps: dict[str, str], repo_abs_path: Path
-    ) -> dict[str, str]:
-        """Method to get the dictionary mapping the dependency group with its hash."""
-        deps_hashes = {}
-        if base_deps:
-            base_file = repo_abs_path / base_deps
-            if base_file.exists():
-                hash_ = self._hash_pyproject_deps(base_file) if base_file.name == "pyproject.toml" else self._hash_file(base_file)
-                if hash_:
-                    deps_hashes["_base_hash"] = hash_
-        for name, path in extra_deps.items():
+    ) -> dict[str, Any]:
+        """
+        Method to get the dictionary mapping the dependency group with its hash.
+        For requirements files it also maps {dep_name}_includes with the hash and stat of every included file
+        and, for requirements files and pyproject.toml extras, {dep_name}_requirements with its normalized
+        requirement specifiers (used to sync only what changes).
+        """
+        deps_hashes: dict[str, Any] = {}
+        for name, path in {**({"_base": base_deps} if base_deps else {}), **extra_deps}.items():
             dep_file = repo_abs_path / path
-            if dep_file.exists():
-                hash_ = self._hash_pyproject_deps(dep_file, name) if dep_file.name == "pyproject.toml" else self._hash_file(dep_file)
-                if hash_:
-                    deps_hashes[f"{name}_hash"] = hash_
+            if not dep_file.exists():
+                continue
+            hash_, includes = self._hash_deps_group(dep_file, name, repo_abs_path)
+            if includes is not None:
+                deps_hashes[f"{name}_includes"] = includes
+            if (requirements := self._get_group_requirements(dep_file, name)) is not None:
+                deps_hashes[f"{name}_requirements"] = requirements
+            if hash_:
+                deps_hashes[f"{name}_hash"] = hash_
         return deps_hashes
 
-    def _hash_file(self, file_path: Path) -> str | None:
-        """Calculate SHA256 hash of a file and return first 16 characters."""
-        return hashlib.sha256(file_path.read_bytes()).hexdigest()[:16] if file_path.exists() else None
+    def _get_deps_stats(
+        self, base_deps: str | None, extra_deps: dict[str, str], repo_abs_path: Path
+    ) -> dict[str, list[int]]:
+        """Method to get the dictionary mapping the dependency group with its file stat [mtime_ns, size, inode]."""
+        deps_stats = {}
+        for name, path in {**({"_base": base_deps} if base_deps else {}), **extra_deps}.items():
+            if (stat := get_file_stat(repo_abs_path / path)) is not None:
+                deps_stats[f"{name}_stat"] = stat
+        return deps_stats
+
+    def _hash_deps_group(
+        self, dep_file: Path, dep_name: str, repo_abs_path: Path, normalize: bool = True
+    ) -> tuple[str | None, dict[str, dict] | None]:
+        """
+        Hash the dependencies of a group, either a pyproject.toml section or a requirements file (with its includes).
+        Returns the hash and, for requirements files, the included files (None for pyproject.toml).
+        """
+        if dep_file.name == "pyproject.toml":
+            return self._hash_pyproject_deps(dep_file, None if dep_name == "_base" else dep_name, normalize), None
+        return self._hash_requirements(dep_file, repo_abs_path, normalize)
+
+    def _get_group_requirements(self, dep_file: Path, dep_name: str) -> list[str] | None:
+        """Method to get the normalized requirement specifiers of a dependency group (see get_deps_requirements)."""
+        if dep_file.name != "pyproject.toml":
+            return get_requirements_specifiers(dep_file)
+        if dep_name == "_base" or not dep_file.exists():
+            return None
+        try:
+            project = load_toml(dep_file).get("project", {})
+        except Exception:
+            return None
+        deps = project.get("optional-dependencies", {}).get(dep_name)
+        if deps is None:
+            return None
+        requirements = sorted({normalize_requirement(dep) for dep in deps})
+        project_name = canonicalize_name(project.get("name", ""))
+        if any(get_requirement_name(requirement) == project_name for requirement in requirements):
+            return None  # e.g. "myproject[test]"
+        return requirements
+
+    def _hash_file(self, file_path: Path, normalize: bool = True) -> str | None:
+        """
+        Calculate SHA256 hash of a file and return first 16 characters.
+        If normalize is True, requirements files are hashed by their normalized requirements (project
+        files such as setup.py are always hashed raw).
+        The hash is computed at most once per invocation while the file is not modified.
+        """
+        if (stat := get_file_stat(file_path)) is None:
+            return None
+        cache_key = (str(file_path.resolve()), normalize)
+        cached = _FILE_HASHES.get(cache_key)
+        if cached is None or cached[0] != stat:
+            content = file_path.read_bytes()
+            if normalize and file_path.name not in PROJECT_FILES:
+                content = "\n".join(get_normalized_requirements(content.decode(errors="replace"))).encode()
+            cached = (stat, hashlib.sha256(content).hexdigest()[:16])
+            _FILE_HASHES[cache_key] = cached
+        return cached[1]
+
+    def _hash_requirements(
+        self, req_file: Path, repo_abs_path: Path, normalize: bool = True
+    ) -> tuple[str | None, dict[str, dict]]:
+        """
+        Hash a requirements file together with all the files it includes (-r/-c recursively and the
+        project files of -e local paths). Without includes the hash is the hash of the file itself.
+        Returns the hash and {include_path: {"hash": ..., "stat": [...]}}, paths relative to the repository
+        when inside it (missing files get an empty hash and stat).
+        """
+        if (req_hash := self._hash_file(req_file, normalize)) is None:
+            return None, {}
+        includes = {}
+        for include in get_requirements_includes(req_file, repo_abs_path):
+            includes[self._get_include_key(include, repo_abs_path)] = {
+                "hash": self._hash_file(include, normalize) or "",
+                "stat": get_file_stat(include) or [],
+            }
+        if not includes:
+            return req_hash, includes
+        closure = "\n".join([req_hash, *(f"{path} {entry['hash']}" for path, entry in sorted(includes.items()))])
+        return hashlib.sha256(closure.encode()).hexdigest()[:16], includes
+
+    def _includes_unchanged(self, includes: dict[str, dict] | None, repo_path: Path) -> bool:
+        """Check if the stat of every recorded included file is unchanged (False if none were recorded)."""
+        if includes is None:
+            return False
+        return all(
+            (get_file_stat(repo_path / path) or []) == entry.get("stat") for path, entry in includes.items()
+        )
+
+    def _get_include_key(self, include: Path, repo_abs_path: Path) -> str:
+        """Method to get the registry key of an included file (relative to the repository if inside it)."""
+        try:
+            return include.relative_to(repo_abs_path.resolve()).as_posix()
+        except ValueError:
+            return str(include)
 
-    def _hash_pyproject_deps(self, pyproject_path: Path, extra_dep: str | None = None) -> str | None:
+    def _hash_pyproject_deps(
+        self, pyproject_path: Path, extra_dep: str | None = None, normalize: bool = True
+    ) -> str | None:
         """
         Hash only a dependency section of pyproject.toml.
         If extra_dep is provided it hashes those deps [project.optional-dependencies.<extra_dep>].
-        If no extra_dep is provided it hashes the base deps [project.dependencies].
+        If no extra_dep is provided it hashes the base deps [project.dependencies] and the build
+        configuration [build-system], as both require building the project again when they change.
+        If normalize is True, the requirements are normalized before hashing (older versions
+        hashed the raw base deps only).
         """
         if not pyproject_path.exists():
             return None
         try:
-            content = toml.load(pyproject_path)
+            content = load_toml(pyproject_path)
             deps = (
                 content.get("project", {}).get("optional-dependencies", {}).get(extra_dep)
                 if extra_dep else content.get("project", {}).get("dependencies")
             )
-            return hashlib.sha256(str(sorted(deps)).encode()).hexdigest()[:16] if deps else None
+            if not normalize:
+                return hashlib.sha256(str(sorted(deps)).encode()).hexdigest()[:16] if deps else None
+            lines = sorted(normalize_requirement(dep) for dep in deps or [])
+            if not extra_dep and (build_system := content.get("build-system")):
+                lines.append(f"[build-system] {json.dumps(build_system, sort_keys=True)}")
+            return hashlib.sha256("\n".join(lines).encode()).hexdigest()[:16] if lines else None
         except Exception:
             return None
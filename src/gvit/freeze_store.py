@@ -0,0 +1,120 @@
+"""
+Module for the content-addressed store of pip freeze snapshots.
+"""
+
+import hashlib
+import json
+import lzma
+import zlib
+from pathlib import Path
+from typing import Callable
+
+from gvit.utils.cache import save_cache
+from gvit.utils.globals import FREEZES_DIR, FREEZES_REFS_FILE
+
+
+class FreezeStore:
+    """
+    Class for managing the pip freeze snapshots of the environments.
+    Each distinct freeze is stored once in ~/.config/gvit/freezes/<freeze_hash>.xz (lzma compressed),
+    and ~/.config/gvit/freezes/refs.json keeps the registry names referencing every snapshot, so
+    that snapshots are deleted as soon as no environment references them.
+    If refs.json is missing or unreadable it is rebuilt with get_references (the {freeze_hash: [registry_names]}
+    of the registry); snapshots are never deleted from references that could not be loaded.
+    """
+
+    def __init__(self, get_references: Callable[[], dict[str, list[str]]] | None = None) -> None:
+        self.get_references = get_references
+
+    def put(self, registry_name: str, freeze: str) -> str:
+        """
+        Store a freeze snapshot (if not already stored) and reference it from an environment.
+        The snapshot previously referenced by the environment is released. Returns the freeze hash.
+        """
+        freeze_hash = hash_freeze(freeze)
+        refs = self._load_refs()  # Before storing the snapshot, a new store has no references to rebuild
+        if not any(snapshot_file.exists() for snapshot_file, _ in self._get_snapshot_files(freeze_hash)):
+            snapshot_file = FREEZES_DIR / f"{freeze_hash}.xz"
+            FREEZES_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = snapshot_file.with_name(f".{snapshot_file.name}.tmp")
+            tmp_file.write_bytes(lzma.compress(freeze.encode()))
+            tmp_file.replace(snapshot_file)
+        if refs is None:
+            return freeze_hash
+        refs = self._release(refs, registry_name, keep=freeze_hash)
+        refs[freeze_hash] = sorted({*refs.get(freeze_hash, []), registry_name})
+        save_cache(FREEZES_REFS_FILE, refs)
+        return freeze_hash
+
+    def get(self, freeze_hash: str) -> str | None:
+        """Load a freeze snapshot by its hash. Returns None if it is not stored."""
+        for snapshot_file, decompress in self._get_snapshot_files(freeze_hash):
+            try:
+                return decompress(snapshot_file.read_bytes()).decode()
+            except FileNotFoundError:
+                continue
+            except (OSError, lzma.LZMAError, zlib.error):
+                return None
+        return None
+
+    def release(self, registry_name: str) -> None:
+        """Drop the references of an environment, deleting the snapshots no longer referenced."""
+        if (refs := self._load_refs()) is not None:
+            save_cache(FREEZES_REFS_FILE, self._release(refs, registry_name))
+
+    def collect_garbage(self, referenced: dict[str, list[str]]) -> int:
+        """
+        Rebuild the references from the registry {freeze_hash: [registry_names]} and delete every
+        stored snapshot not referenced. Returns the number of deleted snapshots.
+        """
+        save_cache(FREEZES_REFS_FILE, {freeze_hash: sorted(names) for freeze_hash, names in referenced.items()})
+        n_deleted = 0
+        if not FREEZES_DIR.exists():
+            return n_deleted
+        for snapshot_file in [*FREEZES_DIR.glob("*.xz"), *FREEZES_DIR.glob("*.zlib")]:
+            if snapshot_file.stem not in referenced:
+                snapshot_file.unlink(missing_ok=True)
+                n_deleted += 1
+        return n_deleted
+
+    def _load_refs(self) -> dict | None:
+        """
+        Method to load the references, rebuilt from the registry if refs.json is missing (with snapshots
+        stored) or unreadable. Returns None if they cannot be rebuilt, so nothing is deleted or saved.
+        """
+        try:
+            refs = json.loads(FREEZES_REFS_FILE.read_text())
+            if isinstance(refs, dict):
+                return refs
+        except FileNotFoundError:
+            if not any(FREEZES_DIR.glob("*.xz")) and not any(FREEZES_DIR.glob("*.zlib")):
+                return {}
+        except (OSError, ValueError):
+            pass
+        if self.get_references is None:
+            return None
+        return {freeze_hash: sorted(names) for freeze_hash, names in self.get_references().items()}
+
+    def _release(self, refs: dict, registry_name: str, keep: str | None = None) -> dict:
+        """Remove an environment from the references and delete the snapshots left unreferenced."""
+        for freeze_hash in list(refs):
+            if freeze_hash == keep or registry_name not in refs[freeze_hash]:
+                continue
+            refs[freeze_hash] = [name for name in refs[freeze_hash] if name != registry_name]
+            if not refs[freeze_hash]:
+                del refs[freeze_hash]
+                for snapshot_file, _ in self._get_snapshot_files(freeze_hash):
+                    snapshot_file.unlink(missing_ok=True)
+        return refs
+
+    def _get_snapshot_files(self, freeze_hash: str) -> list[tuple[Path, Callable[[bytes], bytes]]]:
+        """Method to get the possible snapshot files of a hash with their decompress function."""
+        return [
+            (FREEZES_DIR / f"{freeze_hash}.xz", lzma.decompress),
+            (FREEZES_DIR / f"{freeze_hash}.zlib", zlib.decompress),  # Written by older versions
+        ]
+
+
+def hash_freeze(freeze: str) -> str:
+    """Calculate SHA256 hash (first 16 chars) of a pip freeze output, as stored in the registry."""
+    return hashlib.sha256(freeze.encode()).hexdigest()[:16]
@@ -2,13 +2,24 @@
 Module with the Git class.
 """
 
+import os
 import sys
+import shutil
+import platform
 import subprocess
 from pathlib import Path
 
 import typer
 
 from gvit.error_handler import exit_with_error
+from gvit.utils.cache import load_cache, save_cache
+from gvit.utils.globals import (
+    GIT_COMMANDS_CACHE_FILE,
+    GIT_ALIASES_CACHE_FILE,
+    GIT_ALIASES_CACHE_MAX_ENTRIES,
+    GIT_LIST_CMDS_CATEGORIES,
+    GIT_SYSTEM_CONFIG_CANDIDATES
+)
 
 
 class Git:
@@ -29,8 +40,36 @@ class Git:
             typer.secho(f"\nError executing git command: {e}", fg=typer.colors.RED, err=True)
             sys.exit(1)
 
+    def passthrough(self, args: list[str]) -> None:
+        """
+        Replace the current process with git (os.execvp), inheriting stdin/stdout/stderr.
+        No Python process stays resident during the git session (pagers, interactive rebase,
+        long logs...), and git's exit code is returned directly to the shell.
+        On Windows exec does not really replace the process, so it falls back to run.
+        """
+        if platform.system() == "Windows":
+            self.run(args)
+        # Anything buffered would be lost after exec
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execvp("git", ["git"] + args)
+        except FileNotFoundError:
+            typer.secho("\nError: git is not installed or not in PATH.", fg=typer.colors.RED, err=True)
+            sys.exit(1)
+        except OSError as e:
+            typer.secho(f"\nError executing git command: {e}", fg=typer.colors.RED, err=True)
+            sys.exit(1)
+
     def command_exists(self, command: str) -> bool:
-        """Method to check if a Git command exists (exit code 0) or not."""
+        """
+        Method to check if a Git command exists or not.
+        It looks it up in the cached catalogue of git commands and in PATH (external git-<command>
+        executables, which are not cached). If the catalogue is not available,
+        it falls back to running `git <command> --help` (exit code 0).
+        """
+        if (commands := self.get_commands()) is not None:
+            return command in commands or shutil.which(f"git-{command}") is not None
         result = subprocess.run(
             ["git", command, "--help"],
             capture_output=True,
@@ -38,6 +77,31 @@ class Git:
         )
         return result.returncode == 0
 
+    def get_commands(self) -> set[str] | None:
+        """
+        Get the catalogue of the git commands shipped with git (`git --list-cmds=main,nohelpers`).
+        It is cached in ~/.config/gvit/cache/ keyed by the path, mtime and size of the git binary, and
+        only rebuilt when git changes. The external git-<command> executables and the aliases change
+        without git changing, so they are not cached (see command_exists and get_aliases).
+        Returns None if git is not available or does not support --list-cmds.
+        """
+        if not (git_binary := self._get_git_binary()):
+            return None
+        cache = load_cache(GIT_COMMANDS_CACHE_FILE)
+        if cache.get("git") == git_binary and isinstance(cache.get("commands"), list):
+            return set(cache["commands"])
+        try:
+            result = subprocess.run(
+                ["git", f"--list-cmds={GIT_LIST_CMDS_CATEGORIES}"], capture_output=True, text=True, check=True
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        commands = sorted({line.strip() for line in result.stdout.splitlines() if line.strip()})
+        if not commands:
+            return None
+        save_cache(GIT_COMMANDS_CACHE_FILE, {"git": git_binary, "commands": commands})
+        return set(commands)
+
     def clone(
         self, repo_url: str, target_dir: str, extra_args: list[str] | None = None, verbose: bool = False
     ) -> None:
@@ -76,6 +140,42 @@ class Git:
             typer.secho(error_msg, fg=typer.colors.RED)
             exit_with_error(error_msg)
 
+    def get_head(self, repo_dir: str) -> str | None:
+        """Get the commit hash of HEAD (None if the repository has no commits yet)."""
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", "HEAD"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        return (result.stdout.strip() or None) if result.returncode == 0 else None
+
+    def get_changed_files(self, repo_dir: str, since: str, paths: list[str]) -> set[str] | None:
+        """
+        Get which of the given paths changed between a commit and the working tree
+        (`git diff --name-only <since> -- <paths>`): both the changes brought by a pull and local
+        modifications. Paths are relative to the repository root. Returns None if git fails.
+        """
+        return self._get_file_names(repo_dir, ["diff", "--name-only", "-z", since, "--", *paths])
+
+    def is_ancestor(self, repo_dir: str, commit: str, descendant: str = "HEAD") -> bool:
+        """Check if a commit exists and is an ancestor of (or the same as) another one (HEAD by default)."""
+        try:
+            result = subprocess.run(
+                ["git", "merge-base", "--is-ancestor", commit, descendant],
+                cwd=repo_dir,
+                capture_output=True,
+                check=False,
+            )
+        except FileNotFoundError:
+            return False
+        return result.returncode == 0
+
+    def get_tracked_files(self, repo_dir: str, paths: list[str]) -> set[str] | None:
+        """Get which of the given paths are tracked by git. Returns None if git fails."""
+        return self._get_file_names(repo_dir, ["ls-files", "-z", "--", *paths])
+
     def commit(self, repo_dir: str, extra_args: list[str] | None = None, verbose: bool = False) -> None:
         """Run git commit command."""
         try:
@@ -171,19 +271,61 @@ class Git:
 
     def resolve_alias(self, alias: str) -> str:
         """Resolve a git alias to its underlying command."""
+        if resolved := self.get_aliases().get(alias):
+            # Return the resolved alias (just the first word if it's a compound command)
+            return resolved.split()[0]
+        return alias
+
+    def get_aliases(self) -> dict[str, str]:
+        """
+        Get all the git aliases {alias: expansion} with a single `git config --show-origin --list` call.
+        They are cached per repository in ~/.config/gvit/cache/ (up to GIT_ALIASES_CACHE_MAX_ENTRIES) and
+        invalidated when the mtime of any of the system, global, repo-local or included gitconfig files
+        changes, or when the environment variables selecting the config (GIT_DIR, GIT_CONFIG_*) change.
+        """
+        repo_config_file = self._get_repo_config_file()
+        cache_key = str(repo_config_file or "")
+        git_env = {name: value for name, value in os.environ.items() if name == "GIT_DIR" or name.startswith("GIT_CONFIG")}
+        cache = load_cache(GIT_ALIASES_CACHE_FILE)
+        entry = cache.get(cache_key, {})
+        if (
+            entry.get("env") == git_env
+            and isinstance(entry.get("mtimes"), dict)
+            and entry["mtimes"] == self._get_config_mtimes(repo_config_file, list(entry["mtimes"]))
+            and isinstance(entry.get("aliases"), dict)
+        ):
+            return entry["aliases"]
         try:
             result = subprocess.run(
-                ["git", "config", "--get", f"alias.{alias}"],
+                ["git", "config", "-z", "--show-origin", "--list"],
                 capture_output=True,
                 text=True,
                 check=False
             )
-            if result.returncode == 0 and result.stdout.strip():
-                # Return the resolved alias (just the first word if it's a compound command)
-                return result.stdout.strip().split()[0]
-        except Exception:
-            pass
-        return alias
+        except FileNotFoundError:
+            return {}
+        aliases, config_files = {}, []
+        items = result.stdout.split("\0")
+        for origin, item in zip(items[::2], items[1::2]):
+            key, _, value = item.partition("\n")
+            config_file = Path(origin.removeprefix("file:")).absolute() if origin.startswith("file:") else None
+            if config_file is not None:
+                config_files.append(str(config_file))
+            if key.startswith("alias.") and value.strip():
+                aliases[key.removeprefix("alias.")] = value.strip()
+            elif key.startswith(("include.", "includeif.")) and key.endswith(".path") and value and config_file:
+                # Included files are tracked even if they do not define anything (yet)
+                config_files.append(str(config_file.parent / Path(value).expanduser()))
+        cache.pop(cache_key, None)
+        cache[cache_key] = {
+            "env": git_env,
+            "mtimes": self._get_config_mtimes(repo_config_file, config_files),
+            "aliases": aliases,
+        }
+        for stale_key in list(cache)[:-GIT_ALIASES_CACHE_MAX_ENTRIES]:
+            del cache[stale_key]
+        save_cache(GIT_ALIASES_CACHE_FILE, cache)
+        return aliases
 
     def add_remote(self, target_dir: str, remote_url: str, verbose: bool = False) -> None:
         """Add remote origin to the Git repository."""
@@ -216,3 +358,73 @@ class Git:
             return result.stdout.strip()
         except subprocess.CalledProcessError:
             return ""
+
+    def _get_file_names(self, repo_dir: str, args: list[str]) -> set[str] | None:
+        """Run a git command that outputs NUL-separated file names and return them as a set."""
+        try:
+            result = subprocess.run(
+                ["git"] + args, cwd=repo_dir, capture_output=True, text=True, check=True
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        return {name for name in result.stdout.split("\0") if name}
+
+    def _get_git_binary(self) -> dict | None:
+        """
+        Get the identity of the git binary in PATH: resolved path, mtime and size.
+        The stat info changes whenever git is upgraded, so it identifies the git version
+        without spawning `git --version` on every call.
+        """
+        if not (git_path := shutil.which("git")):
+            return None
+        try:
+            resolved_path = Path(git_path).resolve()
+            stat = resolved_path.stat()
+        except OSError:
+            return None
+        return {"path": str(resolved_path), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    def _get_config_mtimes(self, repo_config_file: Path | None, extra_files: list[str] | None = None) -> dict[str, int | None]:
+        """
+        Get the mtime of the system, global and repo-local gitconfig files and of extra_files
+        (e.g. included files), None if missing.
+        """
+        home = Path.home()
+        xdg_config_home = Path(os.environ.get("XDG_CONFIG_HOME", home / ".config"))
+        system_files = (
+            [os.environ["GIT_CONFIG_SYSTEM"]] if "GIT_CONFIG_SYSTEM" in os.environ else GIT_SYSTEM_CONFIG_CANDIDATES
+        )
+        global_files = (
+            [os.environ["GIT_CONFIG_GLOBAL"]] if "GIT_CONFIG_GLOBAL" in os.environ
+            else [str(home / ".gitconfig"), str(xdg_config_home / "git" / "config")]
+        )
+        config_files = [*system_files, *global_files, *([str(repo_config_file)] if repo_config_file else [])]
+        mtimes = {}
+        for config_file in [*config_files, *(extra_files or [])]:
+            if config_file in mtimes:
+                continue
+            try:
+                mtimes[config_file] = os.stat(config_file).st_mtime_ns
+            except OSError:
+                mtimes[config_file] = None
+        return mtimes
+
+    def _get_repo_config_file(self) -> Path | None:
+        """Get the config file of the repository containing the current directory, or of GIT_DIR (if any)."""
+        if git_dir := os.environ.get("GIT_DIR"):
+            return (Path(git_dir) / "config").absolute()
+        cwd = Path.cwd()
+        for directory in [cwd, *cwd.parents]:
+            git_path = directory / ".git"
+            if git_path.is_dir():
+                return git_path / "config"
+            if git_path.is_file():
+                # Worktrees and submodules: .git is a file with "gitdir: <path>"
+                content = git_path.read_text().strip()
+                if not content.startswith("gitdir:"):
+                    return None
+                git_dir = (directory / content.removeprefix("gitdir:").strip()).resolve()
+                if (commondir_file := git_dir / "commondir").exists():
+                    git_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+                return git_dir / "config"
+        return None
@@ -0,0 +1,13 @@
+"""
+Module with the common functions of the registry storage engines.
+"""
+
+from gvit.storages.toml_storage import TomlStorage
+from gvit.storages.sqlite_storage import SqliteStorage
+
+
+def get_storage(storage: str) -> TomlStorage | SqliteStorage:
+    """Function to get the registry storage engine."""
+    if storage == "sqlite":
+        return SqliteStorage()
+    return TomlStorage()
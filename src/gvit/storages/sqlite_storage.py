@@ -0,0 +1,112 @@
+"""
+Module with the SQLite storage engine of the environment registry.
+"""
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import cast
+
+import toml
+
+from gvit.utils.globals import REGISTRY_DB_FILE
+from gvit.utils.schemas import RegistryFile
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS envs (
+    name TEXT PRIMARY KEY,
+    repo_path TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    python TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS envs_repo_path ON envs (repo_path);
+CREATE INDEX IF NOT EXISTS envs_backend ON envs (backend);
+CREATE INDEX IF NOT EXISTS envs_python ON envs (python);
+CREATE INDEX IF NOT EXISTS envs_created_at ON envs (created_at);
+"""
+
+
+class SqliteStorage:
+    """
+    Class for the SQLite storage engine: all the environments in ~/.config/gvit/envs.db.
+    The fields used for lookups are indexed columns, the complete registry entry is kept as JSON.
+    Every operation runs in its own transaction.
+    """
+
+    def __init__(self) -> None:
+        REGISTRY_DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def load(self, registry_name: str) -> RegistryFile | None:
+        """Load an environment from the database."""
+        rows = self._execute("SELECT data FROM envs WHERE name = ?", (registry_name,))
+        return cast(RegistryFile, json.loads(rows[0][0])) if rows else None
+
+    def load_all(self, backend: str | None = None, python: str | None = None) -> list[RegistryFile]:
+        """Load all the environments (sorted by name), optionally filtered by backend and python."""
+        rows = self._execute(
+            "SELECT data FROM envs WHERE (?1 IS NULL OR backend = ?1) AND (?2 IS NULL OR python = ?2) ORDER BY name",
+            (backend, python),
+        )
+        return [cast(RegistryFile, json.loads(data)) for data, in rows]
+
+    def save(self, registry_name: str, venv_info: RegistryFile) -> None:
+        """Insert or replace an environment in the database."""
+        self._execute(
+            "INSERT OR REPLACE INTO envs (name, repo_path, backend, python, created_at, data) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                registry_name,
+                str(Path(venv_info["repository"]["path"]).resolve()),
+                venv_info["environment"]["backend"],
+                venv_info["environment"]["python"],
+                venv_info["environment"]["created_at"],
+                json.dumps(venv_info),
+            ),
+        )
+
+    def delete(self, registry_name: str) -> bool:
+        """Delete an environment from the database. Returns True if deleted, False if not found."""
+        with closing(self._connect()) as conn, conn:
+            return conn.execute("DELETE FROM envs WHERE name = ?", (registry_name,)).rowcount > 0
+
+    def exists(self, registry_name: str) -> bool:
+        """Check if an environment is in the database."""
+        return bool(self._execute("SELECT 1 FROM envs WHERE name = ?", (registry_name,)))
+
+    def list_names(self) -> list[str]:
+        """List the names of all the environments (sorted)."""
+        return [name for name, in self._execute("SELECT name FROM envs ORDER BY name")]
+
+    def find_by_repo(self, repo_path: str) -> list[RegistryFile]:
+        """Find the environments of a (resolved) repository path."""
+        rows = self._execute("SELECT data FROM envs WHERE repo_path = ? ORDER BY name", (repo_path,))
+        return [cast(RegistryFile, json.loads(data)) for data, in rows]
+
+    def reindex(self) -> int:
+        """Rebuild the indexes of the database. Returns the number of indexed environments."""
+        self._execute("REINDEX envs")
+        return self._execute("SELECT COUNT(*) FROM envs")[0][0]
+
+    def get_location(self, registry_name: str) -> str:
+        """Method to get the location of the registry of an environment."""
+        return f"{REGISTRY_DB_FILE} ({registry_name})"
+
+    def dump(self, registry_name: str) -> str | None:
+        """Method to get the registry of an environment as TOML text."""
+        venv_info = self.load(registry_name)
+        return toml.dumps(venv_info) if venv_info is not None else None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Method to open a connection to the database."""
+        return sqlite3.connect(REGISTRY_DB_FILE, timeout=30)
+
+    def _execute(self, query: str, params: tuple = ()) -> list[tuple]:
+        """Run a query in its own transaction and return all its rows."""
+        with closing(self._connect()) as conn, conn:
+            return conn.execute(query, params).fetchall()
@@ -0,0 +1,220 @@
+"""
+Module with the TOML storage engine of the environment registry.
+"""
+
+import copy
+from contextlib import suppress
+from pathlib import Path
+from typing import cast
+
+import toml
+
+from gvit.utils.cache import load_cache, save_cache
+from gvit.utils.files import atomic_write_text, file_lock, get_file_stat
+from gvit.utils.globals import ENVS_DIR, ENVS_INDEX_FILE, ENVS_CACHE_DIR, REGISTRY_LOCK_FILE
+from gvit.utils.schemas import RegistryFile
+
+
+# Parsed registry entries already loaded in this process -> {cache_file: {"stat": [...], "data": {...}}}
+_PARSED_ENTRIES: dict[str, dict] = {}
+
+
+class TomlStorage:
+    """
+    Class for the TOML storage engine (default): one file per environment in ~/.config/gvit/envs/.
+    Keeps an index in ~/.config/gvit/envs_index.json mapping each repository path to its
+    environments, so that path-based lookups do not need to parse every registry file.
+    Parsed entries are cached in memory and in ~/.config/gvit/cache/envs/<name>.json (one file per
+    environment, so a lookup only reads the entries it loads), validated by the (st_mtime_ns, st_size, st_ino)
+    of each registry file, so an unchanged file is never parsed twice.
+    """
+
+    def __init__(self) -> None:
+        self._ensure_envs_dir()
+
+    def load(self, registry_name: str) -> RegistryFile | None:
+        """Load an environment from its registry file (None if it does not exist or was just deleted)."""
+        return self._load_many([registry_name]).get(registry_name)
+
+    def load_all(self, backend: str | None = None, python: str | None = None) -> list[RegistryFile]:
+        """Load all the environments (sorted by name), optionally filtered by backend and python."""
+        envs = list(self._load_many(self.list_names()).values())
+        return [
+            env for env in envs
+            if (backend is None or env.get("environment", {}).get("backend") == backend)
+            and (python is None or env.get("environment", {}).get("python") == python)
+        ]
+
+    def save(self, registry_name: str, venv_info: RegistryFile) -> None:
+        """
+        Save an environment to its registry file and update the index.
+        The file is replaced atomically, so concurrent readers never see a partially written file.
+        """
+        envs_dir_mtime = self._get_envs_dir_mtime()
+        atomic_write_text(ENVS_DIR / f"{registry_name}.toml", toml.dumps(venv_info))
+        self._update_index(registry_name, venv_info, envs_dir_mtime)
+        self._forget_parsed_entry(registry_name)
+
+    def delete(self, registry_name: str) -> bool:
+        """Delete the registry file of an environment. Returns True if deleted, False if not found."""
+        envs_dir_mtime = self._get_envs_dir_mtime()
+        try:
+            (ENVS_DIR / f"{registry_name}.toml").unlink()
+        except FileNotFoundError:
+            return False
+        self._update_index(registry_name, None, envs_dir_mtime)
+        self._forget_parsed_entry(registry_name)
+        return True
+
+    def exists(self, registry_name: str) -> bool:
+        """Check if the registry file of an environment exists."""
+        return (ENVS_DIR / f"{registry_name}.toml").exists()
+
+    def list_names(self) -> list[str]:
+        """List the names of all the environments (sorted)."""
+        return sorted([f.stem for f in ENVS_DIR.glob("*.toml")]) if ENVS_DIR.exists() else []
+
+    def find_by_repo(self, repo_path: str) -> list[RegistryFile]:
+        """Find the environments of a (resolved) repository path using the index."""
+        envs = [self.load(entry["name"]) for entry in self._load_index().get(repo_path, [])]
+        return [env for env in envs if env]
+
+    def reindex(self) -> int:
+        """
+        Rebuild the repository-path index from the registry files (registry lock held by the caller).
+        Returns the number of indexed environments.
+        """
+        # Taken before listing, so a file added meanwhile leaves the index stale instead of missing it
+        envs_dir_mtime = self._get_envs_dir_mtime()
+        repos: dict[str, list[dict]] = {}
+        for env in self.load_all():
+            if "environment" not in env or "repository" not in env:
+                continue
+            repo_key = str(Path(env["repository"]["path"]).resolve())
+            repos.setdefault(repo_key, []).append(self._get_index_entry(env))
+        self._save_index(repos, envs_dir_mtime)
+        # Parsed entries of the registry files deleted outside gvit
+        for cache_file in ENVS_CACHE_DIR.glob("*.json"):
+            if not (ENVS_DIR / f"{cache_file.stem}.toml").exists():
+                self._forget_parsed_entry(cache_file.stem)
+        return sum(len(entries) for entries in repos.values())
+
+    def get_location(self, registry_name: str) -> str:
+        """Method to get the location of the registry of an environment."""
+        return str(ENVS_DIR / f"{registry_name}.toml")
+
+    def dump(self, registry_name: str) -> str | None:
+        """Method to get the registry of an environment as TOML text."""
+        try:
+            return (ENVS_DIR / f"{registry_name}.toml").read_text()
+        except FileNotFoundError:
+            return None
+
+    def _ensure_envs_dir(self) -> None:
+        """Create environments directory if it does not exist."""
+        ENVS_DIR.mkdir(parents=True, exist_ok=True)
+
+    def _load_many(self, registry_names: list[str]) -> dict[str, RegistryFile]:
+        """
+        Load several environments through the parsed entries cache: a file is only parsed if its
+        stat changed since it was cached. Returns {name: venv_info} for the existing files.
+        """
+        envs: dict[str, RegistryFile] = {}
+        for registry_name in registry_names:
+            env_file = ENVS_DIR / f"{registry_name}.toml"
+            if (stat := get_file_stat(env_file)) is None:
+                self._forget_parsed_entry(registry_name)
+                continue
+            entry = self._get_parsed_entry(registry_name)
+            if entry.get("stat") != stat:
+                try:
+                    entry = {"stat": stat, "data": toml.load(env_file)}
+                except FileNotFoundError:
+                    continue
+                cache_file = ENVS_CACHE_DIR / f"{registry_name}.json"
+                _PARSED_ENTRIES[str(cache_file)] = entry
+                save_cache(cache_file, entry)
+            # Copy, so that callers modifying the entry do not alter the cache
+            envs[registry_name] = cast(RegistryFile, copy.deepcopy(entry["data"]))
+        return envs
+
+    def _get_parsed_entry(self, registry_name: str) -> dict:
+        """Method to get the parsed entry of an environment ({} if not cached), read from disk once per process."""
+        cache_file = ENVS_CACHE_DIR / f"{registry_name}.json"
+        if str(cache_file) not in _PARSED_ENTRIES:
+            _PARSED_ENTRIES[str(cache_file)] = load_cache(cache_file)
+        return _PARSED_ENTRIES[str(cache_file)]
+
+    def _forget_parsed_entry(self, registry_name: str) -> None:
+        """Drop an entry from the parsed entries cache after its file was written or deleted."""
+        cache_file = ENVS_CACHE_DIR / f"{registry_name}.json"
+        _PARSED_ENTRIES.pop(str(cache_file), None)
+        with suppress(OSError):
+            cache_file.unlink(missing_ok=True)
+
+    def _load_index(self) -> dict[str, list[dict]]:
+        """
+        Load the repository-path index {repo_path: [entries]}.
+        It is rebuilt if it does not exist or if the registry directory changed since it was
+        written (environments added or removed outside gvit), holding the registry lock so that it
+        is not rebuilt from a directory being written by another process.
+        """
+        index = load_cache(ENVS_INDEX_FILE)
+        if not self._is_index_valid(index):
+            with file_lock(REGISTRY_LOCK_FILE):
+                # Another process may have rebuilt it while waiting for the lock
+                if not self._is_index_valid(index := load_cache(ENVS_INDEX_FILE)):
+                    self.reindex()
+                    index = load_cache(ENVS_INDEX_FILE)
+        return index.get("repos", {})
+
+    def _is_index_valid(self, index: dict) -> bool:
+        """Method to check that the index exists and the registry directory did not change since it was written."""
+        return index.get("envs_dir_mtime_ns") == self._get_envs_dir_mtime() and isinstance(index.get("repos"), dict)
+
+    def _save_index(self, repos: dict[str, list[dict]], envs_dir_mtime: int | None = None) -> None:
+        """
+        Save the repository-path index atomically, stamped with the registry directory mtime
+        (envs_dir_mtime if given, taken before reading the registry files).
+        """
+        if envs_dir_mtime is None:
+            envs_dir_mtime = self._get_envs_dir_mtime()
+        save_cache(ENVS_INDEX_FILE, {"envs_dir_mtime_ns": envs_dir_mtime, "repos": repos})
+
+    def _update_index(
+        self, registry_name: str, venv_info: RegistryFile | None, previous_envs_dir_mtime: int | None
+    ) -> None:
+        """
+        Update (or remove if venv_info is None) the index entry of an environment after writing its
+        registry file. If the index was already stale before the write, it is fully rebuilt instead.
+        """
+        index = load_cache(ENVS_INDEX_FILE)
+        repos = index.get("repos")
+        if index.get("envs_dir_mtime_ns") != previous_envs_dir_mtime or not isinstance(repos, dict):
+            self.reindex()
+            return None
+        repos = {
+            repo: [entry for entry in entries if entry["name"] != registry_name]
+            for repo, entries in repos.items()
+        }
+        if venv_info is not None:
+            repo_key = str(Path(venv_info["repository"]["path"]).resolve())
+            repos.setdefault(repo_key, []).append(self._get_index_entry(venv_info))
+            repos[repo_key].sort(key=lambda entry: entry["name"])
+        self._save_index({repo: entries for repo, entries in repos.items() if entries})
+
+    def _get_index_entry(self, venv_info: RegistryFile) -> dict:
+        """Method to get the index entry of an environment."""
+        return {
+            "name": venv_info["environment"]["name"],
+            "backend": venv_info["environment"]["backend"],
+            "python": venv_info["environment"]["python"],
+            "path": venv_info["environment"]["path"],
+        }
+
+    def _get_envs_dir_mtime(self) -> int | None:
+        """Method to get the mtime of the registry directory (changes when files are added or removed)."""
+        try:
+            return ENVS_DIR.stat().st_mtime_ns
+        except OSError:
+            return None
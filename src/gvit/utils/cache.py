@@ -0,0 +1,37 @@
+"""
+Module with helpers for the gvit on-disk caches.
+
+Caches are plain JSON files under ~/.config/gvit/cache/. They are always optional: a missing,
+corrupted or unwritable cache must never break a command, it just means the value is recomputed.
+"""
+
+import os
+import json
+import tempfile
+from pathlib import Path
+
+
+def load_cache(cache_file: Path) -> dict:
+    """Load a JSON cache file. Returns an empty dict if it does not exist or cannot be read."""
+    try:
+        data = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_cache(cache_file: Path, data: dict) -> None:
+    """
+    Save a JSON cache file atomically (write to a temp file and replace).
+    Errors (including data that is not JSON serializable) are ignored.
+    """
+    tmp_path = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.name}.")
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_file)
+    except (OSError, TypeError, ValueError):
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
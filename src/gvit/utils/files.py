@@ -0,0 +1,62 @@
+"""
+Module with file helpers: safe writes shared between concurrent gvit processes and change detection.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+@contextmanager
+def file_lock(lock_file: Path) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock (fcntl.flock) on a lock file for the duration of the block.
+    The lock is not reentrant: do not nest blocks on the same lock file. No-op on Windows.
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file, "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def get_file_stat(file_path: Path) -> list[int] | None:
+    """
+    Function to get the [mtime_ns, size, inode] of a file (None if it does not exist), used to
+    detect whether a file changed without reading it.
+    """
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write a text file atomically: write to a temp file in the same directory, fsync it and
+    replace the target. Readers see either the previous or the new content, never a partial file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,280 @@
+"""
+Module to get the pip freeze of an environment by reading the metadata of its installed distributions
+(*.dist-info and *.egg-info in site-packages), without running the interpreter of the environment.
+The result is cached in ~/.config/gvit/cache/freezes/<env hash>.json (one file per environment) until
+site-packages changes.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import re
+from email.parser import HeaderParser
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from gvit.freeze_store import hash_freeze
+from gvit.utils.cache import load_cache, save_cache
+from gvit.utils.globals import FREEZES_CACHE_DIR
+from gvit.utils.requirements import canonicalize_name
+from gvit.utils.venv_copy import read_pyvenv_cfg
+
+
+# Version of the freeze format, recorded in the registry (_freeze_format). Entries without it were
+# hashed from the output of the package manager (see EnvRegistry.restamp_legacy_freeze)
+FREEZE_FORMAT = 2
+# Packages left out of the freeze (as pip freeze does)
+EXCLUDED_PACKAGES = ("pip", "python", "wsgiref", "argparse")
+# Build backends also left out of the freeze by pip freeze, only before Python 3.12
+BUILD_BACKEND_PACKAGES = ("setuptools", "wheel", "distribute")
+# Directories of the version control systems detected by pip in the editable installs
+VCS_DIRS = (".git", ".hg", ".svn", ".bzr")
+
+
+class FreezeSnapshot:
+    """
+    Class for the pip freeze of an environment, parsed once and shared by the registry, diff and display layers:
+        - text: the freeze output, as stored in the FreezeStore.
+        - hash: its hash, as stored in the registry (_freeze_hash).
+        - packages: {package: version} (version None for the direct URL entries, keyed by the whole line).
+        - direct_urls: the editable (-e) and direct URL/VCS (name @ url) entries.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.hash = hash_freeze(text)
+        self.packages: dict[str, str | None] = {}
+        self.direct_urls: list[str] = []
+        for line in text.strip().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "==" in line:
+                package, version = line.split("==", 1)
+                self.packages[package.lower()] = version
+            else:
+                # Non-standard lines (editable installs or VCS)
+                self.packages[line.lower()] = None
+                self.direct_urls.append(line)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FreezeSnapshot) and other.hash == self.hash
+
+    def __repr__(self) -> str:
+        return f"FreezeSnapshot(hash={self.hash!r}, packages={len(self.packages)})"
+
+
+def get_site_packages_dirs(env_path: Path) -> list[Path]:
+    """Function to get the site-packages directories of an environment (POSIX and Windows layouts)."""
+    candidates = [*sorted(env_path.glob("lib/python*/site-packages")), env_path / "Lib" / "site-packages"]
+    site_packages_dirs: list[Path] = []
+    for candidate in candidates:
+        if candidate.is_dir() and candidate.resolve() not in [d.resolve() for d in site_packages_dirs]:
+            site_packages_dirs.append(candidate)
+    return site_packages_dirs
+
+
+def scan_freeze(env_path: Path, exclude_paths: list[Path] | None = None) -> str | None:
+    """
+    Function to get the pip freeze output of an environment reading its site-packages directories, with
+    the same lines and order as pip freeze: "name==version", "name @ url" for direct URL installs and
+    "-e path" (after a comment) for editable installs, skipping the editable installs of exclude_paths
+    (e.g. the repository itself), sorted case-insensitively by name.
+    Returns None if it cannot be listed as pip would (no site-packages directory, unknown Python version,
+    system site-packages, or editable installs under version control, listed by pip from the VCS),
+    so the caller can fall back to pip freeze.
+    The result is reused while the fingerprint of site-packages (see _get_fingerprint) does not change.
+    """
+    pyvenv_cfg = read_pyvenv_cfg(env_path)
+    site_packages_dirs = get_site_packages_dirs(env_path)
+    python_version = _get_python_version(env_path, site_packages_dirs, pyvenv_cfg)
+    if not site_packages_dirs or python_version is None:
+        return None
+    if pyvenv_cfg.get("include-system-site-packages", "false").lower() == "true":
+        return None
+    if not pyvenv_cfg and (user_site_packages := _get_user_site_packages(python_version)):
+        # The user site-packages comes first in sys.path outside virtual environments (conda)
+        site_packages_dirs.insert(0, user_site_packages)
+    excluded_dirs = {path.resolve() for path in exclude_paths or []}
+    fingerprint = _get_fingerprint(site_packages_dirs)
+    cache_file = _get_cache_file(env_path)
+    cached = load_cache(cache_file)
+    if (
+        cached.get("format") == FREEZE_FORMAT
+        and cached.get("fingerprint") == fingerprint
+        and cached.get("exclude") == sorted(map(str, excluded_dirs))
+    ):
+        return cached["freeze"]
+
+    excluded_packages = (
+        EXCLUDED_PACKAGES + BUILD_BACKEND_PACKAGES if python_version < (3, 12) else EXCLUDED_PACKAGES
+    )
+    lines: dict[str, tuple[str, str]] = {}
+    supported = True
+    for site_packages_dir, _, dist_names in fingerprint:
+        for dist_name in dist_names:
+            entry = _read_distribution(Path(site_packages_dir) / dist_name, excluded_dirs)
+            if entry is None or entry[0] in lines or entry[0] in excluded_packages:
+                continue
+            supported = supported and entry[2] is not None
+            lines[entry[0]] = (entry[1].lower(), entry[2] or "")
+    freeze = "".join(f"{line}\n" for _, line in sorted(lines.values())) if supported else None
+
+    save_cache(cache_file, {
+        "env": str(env_path.resolve()),
+        "format": FREEZE_FORMAT,
+        "fingerprint": fingerprint,
+        "exclude": sorted(map(str, excluded_dirs)),
+        "freeze": freeze,
+    })
+    return freeze
+
+
+def prune_freezes_cache() -> int:
+    """Function to delete the cached freezes of the environments that no longer exist. Returns the number deleted."""
+    n_deleted = 0
+    for cache_file in FREEZES_CACHE_DIR.glob("*.json") if FREEZES_CACHE_DIR.exists() else []:
+        env = load_cache(cache_file).get("env")
+        if not env or not Path(env).exists():
+            cache_file.unlink(missing_ok=True)
+            n_deleted += 1
+    return n_deleted
+
+
+def get_required_packages(env_path: Path, exclude: set[str]) -> set[str] | None:
+    """
+    Function to get the canonical names of the packages required (Requires-Dist, whatever the markers) by
+    the distributions installed in an environment, except by the ones in exclude (canonical names).
+    Returns None if the environment has no site-packages directory.
+    """
+    site_packages_dirs = get_site_packages_dirs(env_path)
+    if not site_packages_dirs:
+        return None
+    required = set()
+    for site_packages_dir in site_packages_dirs:
+        for dist_path in site_packages_dir.glob("*.dist-info"):
+            try:
+                with open(dist_path / "METADATA", encoding="utf-8", errors="replace") as f:
+                    metadata = HeaderParser().parse(f)
+            except OSError:
+                continue
+            if canonicalize_name(metadata.get("Name", "")) in exclude:
+                continue
+            for requirement in metadata.get_all("Requires-Dist") or []:
+                if match := re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement):
+                    required.add(canonicalize_name(match[1]))
+    return required
+
+
+def _get_cache_file(env_path: Path) -> Path:
+    """Function to get the freeze cache file of an environment (keyed by the hash of its resolved path)."""
+    return FREEZES_CACHE_DIR / f"{hashlib.sha256(str(env_path.resolve()).encode()).hexdigest()[:16]}.json"
+
+
+def _get_fingerprint(site_packages_dirs: list[Path]) -> list[list]:
+    """
+    Function to get a cheap fingerprint of the installed distributions: for every site-packages directory,
+    its mtime_ns (changes when anything is installed or removed) and the sorted names of its
+    *.dist-info, *.egg-info and *.egg-link entries (they include the versions).
+    """
+    fingerprint = []
+    for site_packages_dir in site_packages_dirs:
+        try:
+            mtime_ns = site_packages_dir.stat().st_mtime_ns
+            dist_names = sorted(
+                entry.name for entry in os.scandir(site_packages_dir) if entry.name.endswith((".dist-info", ".egg-info", ".egg-link"))
+            )
+        except OSError:
+            mtime_ns, dist_names = None, []
+        fingerprint.append([str(site_packages_dir), mtime_ns, dist_names])
+    return fingerprint
+
+
+def _read_distribution(dist_path: Path, excluded_dirs: set[Path]) -> tuple[str, str, str | None] | None:
+    """
+    Function to get the canonical name, the name and the freeze line of an installed distribution, as
+    pip freeze lists it. The line is None if only pip can list it (editable installs under version control).
+    Returns None if it cannot be read or it is an editable install of excluded_dirs.
+    """
+    if dist_path.suffix == ".egg-link":
+        # Legacy editable install (setup.py develop), the metadata is in the project directory
+        try:
+            project_path = Path(dist_path.read_text().splitlines()[0].strip()).resolve()
+        except (OSError, IndexError):
+            return None
+        if project_path in excluded_dirs:
+            return None
+        return canonicalize_name(dist_path.stem), dist_path.stem, None
+    metadata_file = (
+        dist_path / "METADATA" if dist_path.suffix == ".dist-info"
+        else dist_path / "PKG-INFO" if dist_path.is_dir()
+        else dist_path  # Single file .egg-info
+    )
+    try:
+        with open(metadata_file, encoding="utf-8", errors="replace") as f:
+            metadata = HeaderParser().parse(f)
+    except OSError:
+        return None
+    name, version = metadata.get("Name"), metadata.get("Version")
+    if not name or not version:
+        return None
+    name, version = name.strip(), version.strip()
+    try:
+        direct_url = json.loads((dist_path / "direct_url.json").read_text())
+    except (OSError, ValueError):
+        return canonicalize_name(name), name, f"{name}=={version}"
+    url = direct_url.get("url", "")
+    if direct_url.get("dir_info", {}).get("editable"):
+        if not url.startswith("file:"):
+            return canonicalize_name(name), name, None
+        project_path = Path(unquote(urlparse(url).path))
+        if project_path.resolve() in excluded_dirs:
+            return None
+        if any((path / vcs_dir).exists() for path in (project_path, *project_path.parents) for vcs_dir in VCS_DIRS):
+            return canonicalize_name(name), name, None
+        location = os.path.normcase(os.path.abspath(project_path))
+        return canonicalize_name(name), name, f"# Editable install with no version control ({name}=={version})\n-e {location}"
+    fragments = []
+    if vcs_info := direct_url.get("vcs_info"):
+        line = f"{name} @ {vcs_info['vcs']}+{url}@{vcs_info.get('commit_id', '')}"
+    else:
+        line = f"{name} @ {url}"
+        if archive_hash := direct_url.get("archive_info", {}).get("hash"):
+            fragments.append(archive_hash)
+    if subdirectory := direct_url.get("subdirectory"):
+        fragments.append(f"subdirectory={subdirectory}")
+    return canonicalize_name(name), name, f"{line}#{'&'.join(fragments)}" if fragments else line
+
+
+def _get_python_version(env_path: Path, site_packages_dirs: list[Path], pyvenv_cfg: dict[str, str]) -> tuple[int, int] | None:
+    """
+    Function to get the Python version (major, minor) of an environment without running its interpreter:
+    from the lib/pythonX.Y directory, its pyvenv.cfg or its conda-meta python package (Windows layouts).
+    """
+    for site_packages_dir in site_packages_dirs:
+        if match := re.fullmatch(r"python(\d+)\.(\d+)t?", site_packages_dir.parent.name):
+            return int(match[1]), int(match[2])
+    versions = [
+        pyvenv_cfg.get("version_info", pyvenv_cfg.get("version", "")),
+        *(path.name.removeprefix("python-") for path in env_path.glob("conda-meta/python-[0-9]*.json")),
+    ]
+    for version in versions:
+        if match := re.match(r"(\d+)\.(\d+)", version):
+            return int(match[1]), int(match[2])
+    return None
+
+
+def _get_user_site_packages(python_version: tuple[int, int]) -> Path | None:
+    """Function to get the user site-packages directory of a Python version (None if disabled or missing)."""
+    if os.environ.get("PYTHONNOUSERSITE"):
+        return None
+    major, minor = python_version
+    if platform.system() == "Windows":
+        user_base = Path(os.environ.get("PYTHONUSERBASE") or Path(os.environ.get("APPDATA", "~")) / "Python")
+        user_site_packages = user_base / f"Python{major}{minor}" / "site-packages"
+    else:
+        user_base = Path(os.environ.get("PYTHONUSERBASE", "~/.local"))
+        user_site_packages = user_base / "lib" / f"python{major}.{minor}" / "site-packages"
+    user_site_packages = user_site_packages.expanduser()
+    return user_site_packages if user_site_packages.is_dir() else None
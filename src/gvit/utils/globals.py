@@ -13,11 +13,29 @@ else:
     LOCAL_CONFIG_DIR = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "gvit"
 LOCAL_CONFIG_FILE = LOCAL_CONFIG_DIR / "config.toml"
 ENVS_DIR = LOCAL_CONFIG_DIR / "envs"
+ENVS_INDEX_FILE = LOCAL_CONFIG_DIR / "envs_index.json"
+REGISTRY_DB_FILE = LOCAL_CONFIG_DIR / "envs.db"
+REGISTRY_LOCK_FILE = LOCAL_CONFIG_DIR / "registry.lock"
+FREEZES_DIR = LOCAL_CONFIG_DIR / "freezes"
+FREEZES_REFS_FILE = FREEZES_DIR / "refs.json"
+PACKAGES_CACHE_DIR = LOCAL_CONFIG_DIR / "packages"
 LOGS_DIR = LOCAL_CONFIG_DIR / "logs"
 LOG_FILE = LOGS_DIR / "commands.csv"
+CACHE_DIR = LOCAL_CONFIG_DIR / "cache"
+GIT_COMMANDS_CACHE_FILE = CACHE_DIR / "git_commands.json"
+GIT_ALIASES_CACHE_FILE = CACHE_DIR / "git_aliases.json"
+ENVS_CACHE_DIR = CACHE_DIR / "envs"
+FREEZES_CACHE_DIR = CACHE_DIR / "freezes"
 REPO_CONFIG_FILE = ".gvit.toml"
 FAKE_SLEEP_TIME = 0.75
 MIN_PYTHON_VERSION = "3.10"
+GIT_LIST_CMDS_CATEGORIES = "main,nohelpers"
+GIT_SYSTEM_CONFIG_CANDIDATES = [
+    "/etc/gitconfig",
+    "/usr/local/etc/gitconfig",
+    "/opt/homebrew/etc/gitconfig",
+]
+GIT_ALIASES_CACHE_MAX_ENTRIES = 64  # Repositories kept in the git aliases cache (least recently written dropped)
 
 DEFAULT_BACKEND = "venv"
 DEFAULT_VENV_NAME = ".venv"
@@ -25,14 +43,19 @@ DEFAULT_PYTHON = "3.11"
 DEFAULT_PACKAGE_MANAGER = "uv"
 DEFAULT_BASE_DEPS = "requirements.txt"
 DEFAULT_VERBOSE = False
+DEFAULT_REGISTRY_STORAGE = "toml"
 DEFAULT_LOG_ENABLED = True
 DEFAULT_LOG_MAX_ENTRIES = 1_000
 DEFAULT_LOG_SHOW_LIMIT = 50
+DEFAULT_PACKAGES_CACHE_ENABLED = True
+DEFAULT_PACKAGES_CACHE_MAX_SIZE_MB = 10_000
 DEFAULT_LOG_IGNORED_COMMANDS = [
+    "cache.stats",
     "config.add-extra-deps",
     "config.remove-extra-deps",
     "config.show",
     "envs.list",
+    "envs.reindex",
     "envs.show",
     "envs.show-activate",
     "envs.show-deactivate",
@@ -54,6 +77,11 @@ SUPPORTED_PACKAGE_MANAGERS = [
     "pip"
 ]
 
+SUPPORTED_REGISTRY_STORAGES = [
+    "toml",
+    "sqlite"
+]
+
 ASCII_LOGO = r"""
                       ░██   ░██    
                             ░██    
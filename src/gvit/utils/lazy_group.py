@@ -0,0 +1,58 @@
+"""
+Module with the lazy command group used by the gvit CLI.
+"""
+
+import importlib
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+class LazyGroup(TyperGroup):
+    """
+    Typer group that imports the command modules only when a command is actually invoked.
+
+    Subclasses declare the commands in two class attributes:
+        - lazy_commands: {name: ("module:function", context_settings)}
+        - lazy_groups: {name: (help, {subcommand_name: "module:function"})}
+    """
+
+    lazy_commands: dict[str, tuple[str, dict]] = {}
+    lazy_groups: dict[str, tuple[str, dict[str, str]]] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return the eager and the lazy command names, without importing anything."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands, *self.lazy_groups})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the requested command, importing and building it on first access."""
+        if cmd_name not in self.commands:
+            if cmd_name in self.lazy_commands:
+                self.commands[cmd_name] = self._load_command(cmd_name)
+            elif cmd_name in self.lazy_groups:
+                self.commands[cmd_name] = self._load_group(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import a single command and build its click command."""
+        import_path, context_settings = self.lazy_commands[cmd_name]
+        command_app = typer.Typer(add_completion=False)
+        command_app.command(name=cmd_name, context_settings=context_settings)(_import_function(import_path))
+        return typer.main.get_command(command_app)
+
+    def _load_group(self, group_name: str) -> click.Command:
+        """Import the subcommands of a group and build its click group."""
+        help_, subcommands = self.lazy_groups[group_name]
+        group_app = typer.Typer(help=help_, add_completion=False)
+        for subcommand_name, import_path in subcommands.items():
+            group_app.command(name=subcommand_name)(_import_function(import_path))
+        group = typer.main.get_group(group_app)
+        group.name = group_name
+        return group
+
+
+def _import_function(import_path: str):
+    """Import a function given its "module:function" path."""
+    module_path, function_name = import_path.split(":")
+    return getattr(importlib.import_module(module_path), function_name)
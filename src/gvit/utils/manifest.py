@@ -0,0 +1,72 @@
+"""
+Module with the manifest of the gvit commands.
+
+It is the single source of truth for the CLI structure: the lazy group builds the commands
+from it, and the dispatcher and the logger check command names against it without
+constructing any Typer/Click object.
+"""
+
+GIT_PASSTHROUGH_SETTINGS = {"allow_extra_args": True, "ignore_unknown_options": True}
+
+# Top-level commands -> {name: ("module:function", context_settings)}
+COMMANDS: dict[str, tuple[str, dict]] = {
+    "clone": ("gvit.commands.clone:clone", GIT_PASSTHROUGH_SETTINGS),
+    "commit": ("gvit.commands.commit:commit", GIT_PASSTHROUGH_SETTINGS),
+    "init": ("gvit.commands.init:init", GIT_PASSTHROUGH_SETTINGS),
+    "pull": ("gvit.commands.pull:pull", GIT_PASSTHROUGH_SETTINGS),
+    "status": ("gvit.commands.status:status", GIT_PASSTHROUGH_SETTINGS),
+    "setup": ("gvit.commands.setup:setup", {}),
+    "tree": ("gvit.commands.tree:tree", {}),
+}
+
+# Groups of commands -> {name: (help, {subcommand_name: "module:function"})}
+GROUPS: dict[str, tuple[str, dict[str, str]]] = {
+    "cache": (
+        "Shared package cache management commands.",
+        {
+            "stats": "gvit.commands.cache:stats",
+            "prune": "gvit.commands.cache:prune",
+        },
+    ),
+    "config": (
+        "Configuration management commands.",
+        {
+            "setup": "gvit.commands.config:setup",
+            "add-extra-deps": "gvit.commands.config:add_extra_deps",
+            "remove-extra-deps": "gvit.commands.config:remove_extra_deps",
+            "show": "gvit.commands.config:show",
+        },
+    ),
+    "envs": (
+        "Environments management commands.",
+        {
+            "list": "gvit.commands.envs:list_",
+            "manage": "gvit.commands.envs:manage",
+            "delete": "gvit.commands.envs:delete",
+            "reset": "gvit.commands.envs:reset",
+            "show": "gvit.commands.envs:show",
+            "prune": "gvit.commands.envs:prune",
+            "reindex": "gvit.commands.envs:reindex",
+            "migrate": "gvit.commands.envs:migrate",
+            "show-activate": "gvit.commands.envs:show_activate",
+            "show-deactivate": "gvit.commands.envs:show_deactivate",
+        },
+    ),
+    "logs": (
+        "Log management commands.",
+        {
+            "show": "gvit.commands.logs:show",
+            "clear": "gvit.commands.logs:clear",
+            "stats": "gvit.commands.logs:stats",
+            "enable": "gvit.commands.logs:enable",
+            "disable": "gvit.commands.logs:disable",
+            "config": "gvit.commands.logs:config",
+        },
+    ),
+}
+
+# Command names generated from the manifest, for O(1) membership checks
+GVIT_COMMANDS: frozenset[str] = frozenset({*COMMANDS, *GROUPS})
+GROUP_SUBCOMMANDS: dict[str, frozenset[str]] = {
+    name: frozenset(subcommands) for name, (_, subcommands) in GROUPS.items()
+}
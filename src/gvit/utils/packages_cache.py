@@ -0,0 +1,195 @@
+"""
+Module with the package cache shared by all the environments managed by gvit.
+
+pip (PIP_CACHE_DIR) and uv (UV_CACHE_DIR) are pointed to ~/.config/gvit/packages/{pip,uv} (configurable
+in the [cache] section of the config), so the wheels downloaded or built for a repository are reused
+by every other one. The cache is kept under a maximum size by evicting the least recently used entries.
+Access times are not reliable (noatime/relatime mounts), so gvit records the use of the uv entries itself
+by touching the ones linked into every environment it installs (see touch_packages_cache_entries).
+"""
+
+import os
+import platform
+import shutil
+import time
+from pathlib import Path
+
+from gvit.utils.freeze import get_site_packages_dirs
+from gvit.utils.globals import PACKAGES_CACHE_DIR, DEFAULT_PACKAGES_CACHE_ENABLED, DEFAULT_PACKAGES_CACHE_MAX_SIZE_MB
+from gvit.utils.schemas import LocalConfig
+from gvit.utils.utils import load_local_config
+
+
+# Package managers with a directory in the shared cache -> environment variable of their cache directory
+CACHE_DIR_VARIABLES = {"pip": "PIP_CACHE_DIR", "uv": "UV_CACHE_DIR"}
+# Files of the cache itself, never evicted
+CACHE_CONTROL_FILES = (".lock", ".gitignore", "CACHEDIR.TAG", "selfcheck.json")
+
+
+def get_packages_cache_dir(config: LocalConfig | None = None) -> Path | None:
+    """Function to get the directory of the shared package cache from the config (None if it is disabled)."""
+    cache_config = (load_local_config() if config is None else config).get("cache", {})
+    if not cache_config.get("enabled", DEFAULT_PACKAGES_CACHE_ENABLED):
+        return None
+    return Path(cache_config["dir"]).expanduser() if cache_config.get("dir") else PACKAGES_CACHE_DIR
+
+
+def get_packages_cache_max_size(config: LocalConfig | None = None) -> int:
+    """Function to get the maximum size (bytes) of the shared package cache from the config."""
+    cache_config = (load_local_config() if config is None else config).get("cache", {})
+    return int(cache_config.get("max_size_mb", DEFAULT_PACKAGES_CACHE_MAX_SIZE_MB) * 1_000_000)
+
+
+def get_install_env(venv_path: Path | None = None) -> dict[str, str] | None:
+    """
+    Function to get the environment variables of the install commands, with the pip and uv caches in the
+    shared package cache. If the cache and the environment (venv_path) are in the same filesystem, uv links
+    the files from the cache instead of copying them (UV_LINK_MODE: clone on macOS, hardlink elsewhere),
+    otherwise it copies them straight away. pip always copies (it has no link mode).
+    The variables already set by the user are kept. Returns None (inherit the environment) if the cache is disabled.
+    """
+    if (cache_dir := get_packages_cache_dir()) is None:
+        return None
+    env = os.environ.copy()
+    for package_manager, variable in CACHE_DIR_VARIABLES.items():
+        env.setdefault(variable, str(cache_dir / package_manager))
+    if venv_path is not None and "UV_LINK_MODE" not in env:
+        env["UV_LINK_MODE"] = _get_link_mode(Path(env["UV_CACHE_DIR"]), venv_path)
+    return env
+
+
+def get_packages_cache_stats(cache_dir: Path) -> dict[str, dict]:
+    """Function to get the statistics of each package manager in the shared cache: {name: {path, entries, size_bytes}}."""
+    stats = {}
+    for package_manager in CACHE_DIR_VARIABLES:
+        entries = _get_cache_entries(cache_dir / package_manager)
+        stats[package_manager] = {
+            "path": str(cache_dir / package_manager),
+            "entries": len(entries),
+            "size_bytes": sum(size for _, size, _, _ in entries),
+        }
+    return stats
+
+
+def prune_packages_cache(cache_dir: Path, max_size_bytes: int, dry_run: bool = False) -> tuple[int, int]:
+    """
+    Function to evict the least recently used entries of the shared cache until it fits in max_size_bytes.
+    An entry is a file of the cache, or a whole unpacked wheel for uv (archive-v*/<id>, which the
+    environments link to). Files hardlinked elsewhere (st_nlink > 1, e.g. into an environment) free
+    no space when evicted, so they are not counted as freed and the entries made only of them are kept.
+    Returns the number of evicted entries and the freed bytes.
+    """
+    entries = [entry for package_manager in CACHE_DIR_VARIABLES for entry in _get_cache_entries(cache_dir / package_manager)]
+    total_size = sum(size for _, size, _, _ in entries)
+    evicted, freed = 0, 0
+    for path, size, freeable_size, _ in sorted(entries, key=lambda entry: entry[3]):
+        if total_size - freed <= max_size_bytes:
+            break
+        if size and not freeable_size:
+            continue
+        if not dry_run:
+            try:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+            except OSError:
+                continue
+        evicted += 1
+        freed += freeable_size
+    return evicted, freed
+
+
+def touch_packages_cache_entries(venv_path: Path) -> int:
+    """
+    Function to record the use of the uv cache entries (archive-v*/<id>) an environment was installed from:
+    the entries whose *.dist-info/METADATA is hardlinked into its site-packages are touched (mtime),
+    which the eviction takes as their last use. pip copies the files, its entries keep their own times.
+    Only the METADATA files of the cache with the name of a linked *.dist-info are checked. It is meant
+    to be called once per command (see record_packages_cache_use in backends/common.py).
+    Returns the number of touched entries.
+    """
+    if (cache_dir := get_packages_cache_dir()) is None:
+        return 0
+    linked = {}
+    for site_packages_dir in get_site_packages_dirs(venv_path):
+        for metadata_file in site_packages_dir.glob("*.dist-info/METADATA"):
+            try:
+                stat = metadata_file.stat()
+            except OSError:
+                continue
+            if stat.st_nlink > 1:
+                linked.setdefault(metadata_file.parent.name, set()).add((stat.st_dev, stat.st_ino))
+    if not linked:
+        return 0
+    touched, now = 0, time.time()
+    for archive_dir in (cache_dir / "uv").glob("archive-v*"):
+        for dist_info_dir in archive_dir.glob("*/*.dist-info"):
+            if dist_info_dir.name not in linked:
+                continue
+            metadata_file = dist_info_dir / "METADATA"
+            try:
+                stat = metadata_file.stat()
+                if (stat.st_dev, stat.st_ino) in linked[dist_info_dir.name]:
+                    os.utime(metadata_file.parent.parent, (now, now))
+                    touched += 1
+            except OSError:
+                continue
+    return touched
+
+
+def _get_cache_entries(cache_dir: Path) -> list[tuple[Path, int, int, float]]:
+    """
+    Function to get the entries of a cache directory as (path, size in bytes, bytes freed if evicted,
+    last use timestamp).
+    """
+    entries = []
+    for root, dirs, files in os.walk(cache_dir):
+        if Path(root).name.startswith("archive-v"):
+            entries.extend(_get_dir_entry(Path(root) / name) for name in dirs)
+            dirs.clear()
+        for name in files:
+            if name in CACHE_CONTROL_FILES:
+                continue
+            try:
+                stat = (Path(root) / name).stat()
+            except OSError:
+                continue
+            freeable_size = stat.st_size if stat.st_nlink == 1 else 0
+            entries.append((Path(root) / name, stat.st_size, freeable_size, max(stat.st_atime, stat.st_mtime)))
+    return entries
+
+
+def _get_dir_entry(path: Path) -> tuple[Path, int, int, float]:
+    """
+    Function to get the size, the bytes freed if evicted and the last use of a directory entry: the mtime
+    of the directory (touched by gvit when used, see touch_packages_cache_entries) or of its files.
+    """
+    try:
+        last_used = path.stat().st_mtime
+    except OSError:
+        last_used = 0.0
+    size, freeable_size = 0, 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                stat = (Path(root) / name).lstat()
+            except OSError:
+                continue
+            size += stat.st_size
+            freeable_size += stat.st_size if stat.st_nlink == 1 else 0
+            last_used = max(last_used, stat.st_mtime)
+    return path, size, freeable_size, last_used
+
+
+def _get_link_mode(cache_dir: Path, venv_path: Path) -> str:
+    """Function to get the uv link mode: link (clone or hardlink) if possible, copy across filesystems."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        venv_dir = next(path for path in (venv_path, *venv_path.parents) if path.exists())
+        same_filesystem = cache_dir.stat().st_dev == venv_dir.stat().st_dev
+    except (OSError, StopIteration):
+        return "copy"
+    if not same_filesystem:
+        return "copy"
+    return "clone" if platform.system() == "Darwin" else "hardlink"
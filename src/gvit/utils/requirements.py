@@ -0,0 +1,179 @@
+"""
+Module with helpers to parse requirements files.
+"""
+
+import re
+from pathlib import Path
+
+
+# Options that include another requirements file -> pip resolves them relative to the including file
+INCLUDE_OPTIONS = ("-r", "--requirement", "-c", "--constraint")
+# Options that install a local project -> pip resolves them relative to the working directory
+EDITABLE_OPTIONS = ("-e", "--editable")
+# Files of a local project that define its dependencies
+PROJECT_FILES = ("pyproject.toml", "setup.py", "setup.cfg")
+# Requirement specifier (PEP 508): name, optional [extras] and the rest (version specifiers, url and markers)
+REQUIREMENT_PATTERN = re.compile(r"^(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*(?:\[(?P<extras>[^\]]*)\])?\s*(?P<rest>.*)$")
+
+
+def get_requirements_includes(req_file: Path, base_dir: Path | None = None) -> list[Path]:
+    """
+    Function to get the files included by a requirements file through -r/-c (--requirement/--constraint),
+    recursively and without duplicates (cycles are ignored), plus the project files (pyproject.toml,
+    setup.py, setup.cfg) of the local projects installed with -e (--editable), resolved from base_dir
+    (the directory where pip runs, defaults to the directory of req_file). Remote (URL) includes are skipped.
+    """
+    base_dir = (base_dir or req_file.parent).resolve()
+    includes: list[Path] = []
+    pending = [req_file.resolve()]
+    seen = {req_file.resolve()}
+    while pending:
+        current = pending.pop()
+        req_includes, editable_dirs = _parse_includes(current)
+        for include in req_includes:
+            if include not in seen:
+                seen.add(include)
+                includes.append(include)
+                pending.append(include)
+        for editable_dir in editable_dirs:
+            for project_file in ((base_dir / editable_dir).resolve() / name for name in PROJECT_FILES):
+                if project_file not in seen and project_file.is_file():
+                    seen.add(project_file)
+                    includes.append(project_file)
+    return includes
+
+
+def get_normalized_requirements(text: str) -> list[str]:
+    """
+    Function to get the normalized lines of a requirements file, so that changes which do not alter
+    what gets installed (order, comments, blank lines, whitespace, name spelling) are ignored.
+    Requirements are normalized with normalize_requirement, other lines (options, paths, URLs)
+    only get their whitespace collapsed. The result is sorted.
+    """
+    lines = []
+    for line in re.sub(r"\\\r?\n", " ", text).splitlines():  # Join line continuations
+        line = re.sub(r"(^|\s)#.*$", "", line).strip()
+        if line:
+            lines.append(normalize_requirement(line))
+    return sorted(lines)
+
+
+def normalize_requirement(spec: str) -> str:
+    """
+    Function to normalize a requirement specifier: PEP 503 canonical name, sorted extras, sorted version
+    specifiers without whitespace, and markers and per-requirement options (--hash) preserved.
+    Anything that is not a requirement specifier is returned with its whitespace collapsed.
+    """
+    spec, *options = re.split(r"\s+(?=--)", spec.strip())
+    if (match := _match_requirement(spec)) is None:
+        return " ".join(spec.split() + options)
+    requirement, _, marker = match["rest"].partition(";")
+    normalized = canonicalize_name(match["name"])
+    if match["extras"]:
+        extras = sorted(canonicalize_name(extra) for extra in match["extras"].split(",") if extra.strip())
+        normalized += f"[{','.join(extras)}]"
+    requirement = requirement.strip()
+    if requirement.startswith("@"):
+        normalized += f" @ {requirement[1:].strip()}"
+    elif requirement:
+        normalized += ",".join(sorted("".join(requirement.strip("()").split()).split(",")))
+    if marker.strip():
+        normalized += f"; {' '.join(marker.split())}"
+    return " ".join([normalized, *sorted(" ".join(option.split()) for option in options)])
+
+
+def get_requirements_specifiers(req_file: Path) -> list[str] | None:
+    """
+    Function to get the normalized requirement specifiers of a requirements file and of the files it
+    includes with -r (--requirement), sorted and without duplicates.
+    Returns None if any of them contains something else (options, constraints, editable installs,
+    local paths or per-requirement options such as --hash), as those cannot be installed one by one.
+    """
+    specifiers: set[str] = set()
+    pending = [req_file.resolve()]
+    seen = {req_file.resolve()}
+    while pending:
+        current = pending.pop()
+        try:
+            lines = get_normalized_requirements(current.read_text())
+        except (OSError, UnicodeDecodeError):
+            return None
+        for line in lines:
+            if (path := _get_option_value(line, INCLUDE_OPTIONS[:2])) is not None:
+                if not path or "://" in path:
+                    return None
+                if (include := (current.parent / path).resolve()) not in seen:
+                    seen.add(include)
+                    pending.append(include)
+            elif _match_requirement(line) is None or " --" in line:
+                return None
+            else:
+                specifiers.add(line)
+    return sorted(specifiers)
+
+
+def get_requirements_delta(old: list[str], new: list[str]) -> tuple[list[str], list[str]]:
+    """
+    Function to compare two lists of normalized requirement specifiers.
+    Returns the specifiers to install (added or changed) and the names of the packages no longer required.
+    """
+    old_names = {get_requirement_name(spec) for spec in old}
+    new_names = {get_requirement_name(spec) for spec in new}
+    to_install = sorted(set(new) - set(old))
+    removed = sorted(old_names - new_names)
+    return to_install, removed
+
+
+def get_requirement_name(spec: str) -> str:
+    """Function to get the canonical package name of a requirement specifier (the spec itself if it is not one)."""
+    match = _match_requirement(spec)
+    return canonicalize_name(match["name"]) if match else spec
+
+
+def canonicalize_name(name: str) -> str:
+    """Function to get the canonical form of a package name (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name.strip()).lower()
+
+
+def _parse_includes(req_file: Path) -> tuple[list[Path], list[str]]:
+    """
+    Function to get the requirements files directly included by a requirements file (resolved) and
+    the local project paths it installs in editable mode (as written).
+    """
+    try:
+        lines = req_file.read_text().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return [], []
+    includes, editable_dirs = [], []
+    for line in lines:
+        line = line.split(" #", 1)[0].strip()
+        if (path := _get_option_value(line, INCLUDE_OPTIONS)) is not None:
+            if path and "://" not in path:
+                includes.append((req_file.parent / path).resolve())
+        elif (path := _get_option_value(line, EDITABLE_OPTIONS)) is not None:
+            if path and "://" not in path:
+                editable_dirs.append(path.split("[", 1)[0])  # -e .[dev]
+    return includes, editable_dirs
+
+
+def _get_option_value(line: str, options: tuple[str, ...]) -> str | None:
+    """Function to get the value of a requirements file line using any of the options (None if it does not)."""
+    for option in options:
+        if line.startswith((f"{option} ", f"{option}=")):
+            return line[len(option) + 1:].strip()
+        if len(option) == 2 and line.startswith(option) and len(line) > len(option):
+            return line[len(option):].strip()  # -rfile.txt
+    return None
+
+
+def _match_requirement(spec: str) -> re.Match | None:
+    """Function to match a requirement specifier (None for options, local paths and archives)."""
+    match = REQUIREMENT_PATTERN.match(spec)
+    if (
+        match is None
+        or spec.startswith("-")
+        or (spec.endswith((".whl", ".tar.gz", ".zip")) and "@" not in spec)  # Local archives
+        or match["rest"][:1] not in ("", *"<>=!~@;(")  # Local paths
+    ):
+        return None
+    return match
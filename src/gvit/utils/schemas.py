@@ -44,12 +44,24 @@ class LoggingConfig(TypedDict):
     ignored: NotRequired[list[str]]
 
 
+class RegistryConfig(TypedDict):
+    storage: NotRequired[str]
+
+
+class PackagesCacheConfig(TypedDict):
+    enabled: NotRequired[bool]
+    dir: NotRequired[str]
+    max_size_mb: NotRequired[int]
+
+
 class LocalConfig(TypedDict):
     """Schema for the local configuration of gvit (~/.config/gvit/config.toml)."""
     gvit: NotRequired[GvitLocalConfig]
     deps: NotRequired[DepsLocalConfig]
     backends: NotRequired[BackendsConfig]
     logging: NotRequired[LoggingConfig]
+    registry: NotRequired[RegistryConfig]
+    cache: NotRequired[PackagesCacheConfig]
 
 # ==============================================================
 
@@ -91,9 +103,14 @@ class RegistryRepository(TypedDict):
 class RegistryDepsInstalled(TypedDict):
     _base_hash: str | None  # SHA256 hash (first 16 chars)
     _freeze_hash: str | None  # SHA256 hash (first 16 chars) of pip freeze output
-    _freeze: str | None  # Complete pip freeze output
+    _freeze_format: NotRequired[int]  # Version of the freeze format (missing in legacy entries)
+    _freeze: NotRequired[str]  # Legacy inline pip freeze output (now in ~/.config/gvit/freezes/)
+    _commit: NotRequired[str | None]  # Commit (HEAD) the dependencies were installed at
     installed_at: str  # ISO format datetime string
     # Additional hashes for extra deps: {dep_name}_hash
+    # File stats of every dep group, to skip hashing unchanged files: {dep_name}_stat = [mtime_ns, size, inode]
+    # Files included by requirements files (-r/-c/-e): {dep_name}_includes = {path: {"hash": str, "stat": [...]}}
+    # Normalized requirement specifiers of requirements files: {dep_name}_requirements = [str]
 
 
 class RegistryDeps(TypedDict):
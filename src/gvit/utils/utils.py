@@ -3,12 +3,11 @@ Module with utility functions.
 """
 
 from typing import cast
+import copy
 import importlib.metadata
 from pathlib import Path
 
 import toml
-import typer
-from click import Group
 
 from gvit.utils.globals import (
     LOCAL_CONFIG_DIR,
@@ -19,15 +18,15 @@ from gvit.utils.globals import (
     DEFAULT_PYTHON,
     DEFAULT_PACKAGE_MANAGER,
     DEFAULT_BASE_DEPS,
-    DEFAULT_VERBOSE
+    DEFAULT_VERBOSE,
+    DEFAULT_REGISTRY_STORAGE
 )
+from gvit.utils.files import get_file_stat
 from gvit.utils.schemas import LocalConfig, RepoConfig
 
 
-def get_app_commands(app: typer.Typer) -> set:
-    """Function to get the commands registered in the provided Typer app."""
-    click_app = typer.main.get_command(app)
-    return set(click_app.commands.keys()) if isinstance(click_app, Group) else set()
+# TOML documents parsed during this invocation -> {path: (stat, document)}
+_TOML_DOCUMENTS: dict[str, tuple[list[int], dict]] = {}
 
 
 def get_version() -> str:
@@ -41,7 +40,7 @@ def get_version() -> str:
         pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
         if not pyproject_path.exists():
             raise RuntimeError("Could not determine gvit version.")
-        version = toml.load(pyproject_path).get("project", {}).get("version")
+        version = load_toml(pyproject_path).get("project", {}).get("version")
         if not version:
             raise RuntimeError("Could not determine gvit version.")
         return version
@@ -54,7 +53,7 @@ def ensure_local_config_dir() -> None:
 
 def load_local_config() -> LocalConfig:
     """Method to load the local configuration file."""
-    return cast(LocalConfig, toml.load(LOCAL_CONFIG_FILE) if LOCAL_CONFIG_FILE.exists() else {})
+    return cast(LocalConfig, load_toml(LOCAL_CONFIG_FILE) if LOCAL_CONFIG_FILE.exists() else {})
 
 
 def load_repo_config(repo_path: str) -> RepoConfig:
@@ -65,10 +64,10 @@ def load_repo_config(repo_path: str) -> RepoConfig:
     """
     config_file_path = Path(repo_path) / REPO_CONFIG_FILE
     if config_file_path.exists():
-        return cast(RepoConfig, toml.load(config_file_path))
+        return cast(RepoConfig, load_toml(config_file_path))
     pyproject_path = Path(repo_path) / "pyproject.toml"
     if pyproject_path.exists():
-        content = toml.load(pyproject_path).get("tool", {}).get("gvit", {})
+        content = load_toml(pyproject_path).get("tool", {}).get("gvit", {})
         repo_config = {}
         if gvit := {k: v for k, v in content.items() if k != "deps"}:
             repo_config["gvit"] = gvit
@@ -82,6 +81,30 @@ def save_local_config(config: LocalConfig) -> None:
     """Method to save the local configuration file."""
     with open(LOCAL_CONFIG_FILE, "w") as f:
         toml.dump(config, f)
+    invalidate_toml(LOCAL_CONFIG_FILE)
+
+
+def load_toml(file_path: Path) -> dict:
+    """
+    Function to parse a TOML file at most once per invocation (config files, pyproject.toml...).
+    The parsed document is reused while the file is not modified. A copy is returned, so callers
+    can modify it freely.
+    """
+    stat = get_file_stat(file_path)
+    cache_key = str(file_path.resolve())
+    cached = _TOML_DOCUMENTS.get(cache_key)
+    if cached is None or stat is None or cached[0] != stat:
+        cached = (stat or [], toml.load(file_path))
+        _TOML_DOCUMENTS[cache_key] = cached
+    return copy.deepcopy(cached[1])
+
+
+def invalidate_toml(file_path: Path | None = None) -> None:
+    """Function to drop a file (or every file if None) from the parsed TOML documents cache."""
+    if file_path is None:
+        _TOML_DOCUMENTS.clear()
+    else:
+        _TOML_DOCUMENTS.pop(str(file_path.resolve()), None)
 
 
 def get_backend(config: LocalConfig) -> str:
@@ -120,6 +143,11 @@ def get_venv_name(config: LocalConfig) -> str:
     return config.get("backends", {}).get("venv", {}).get("name", DEFAULT_VENV_NAME)
 
 
+def get_registry_storage(config: LocalConfig) -> str:
+    """Function to get the storage engine of the environment registry from the config."""
+    return config.get("registry", {}).get("storage", DEFAULT_REGISTRY_STORAGE)
+
+
 def extract_repo_name_from_url(repo_url: str) -> str:
     """
     Extract repository name from Git URL.
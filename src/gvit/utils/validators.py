@@ -6,7 +6,9 @@ from pathlib import Path
 
 import typer
 
-from gvit.utils.globals import SUPPORTED_BACKENDS, MIN_PYTHON_VERSION, SUPPORTED_PACKAGE_MANAGERS
+from gvit.utils.globals import (
+    SUPPORTED_BACKENDS, MIN_PYTHON_VERSION, SUPPORTED_PACKAGE_MANAGERS, SUPPORTED_REGISTRY_STORAGES
+)
 from gvit.error_handler import set_error_message, exit_with_error
 
 
@@ -61,6 +63,14 @@ def validate_package_manager(package_manager: str) -> None:
         raise typer.BadParameter(error_msg)
 
 
+def validate_registry_storage(storage: str) -> None:
+    """Function to validate the provided registry storage engine."""
+    if storage not in SUPPORTED_REGISTRY_STORAGES:
+        error_msg = f'Unsupported registry storage "{storage}". Supported: {", ".join(SUPPORTED_REGISTRY_STORAGES)}.'
+        set_error_message(error_msg)
+        raise typer.BadParameter(error_msg)
+
+
 def validate_directory(directory: Path) -> None:
     """Function to validate the provided directory."""
     if not directory.exists():
@@ -0,0 +1,110 @@
+"""
+Module to materialize a virtual environment as a copy of another one (the donor), so that an
+environment with identical dependencies does not have to be installed from scratch.
+Files are cloned (copy-on-write reflinks) or hardlinked when the filesystem supports it, and the
+absolute paths of the donor written in the environment are rewritten.
+"""
+
+import os
+import platform
+import shutil
+from pathlib import Path
+
+from gvit.utils.files import atomic_write_text
+
+
+# ioctl of Linux to clone a file (reflink) in copy-on-write filesystems (btrfs, xfs...)
+FICLONE = 0x40049409
+# Files of the site-packages directory that can contain absolute paths (editable installs, direct URLs)
+SITE_PACKAGES_PATH_FILES = ("*.pth", "*.egg-link", "__editable__*.py", "*.dist-info/direct_url.json")
+
+
+def read_pyvenv_cfg(venv_path: Path) -> dict[str, str]:
+    """Function to read the pyvenv.cfg file of a virtual environment ({} if it does not exist)."""
+    try:
+        lines = (venv_path / "pyvenv.cfg").read_text().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return {}
+    return {
+        key.strip(): value.strip() for key, sep, value in (line.partition("=") for line in lines) if sep
+    }
+
+
+def copy_venv(src_venv: Path, dst_venv: Path, replacements: dict[str, str]) -> str:
+    """
+    Function to copy a virtual environment to dst_venv (which must not exist), rewriting the absolute
+    paths of the donor ({old: new}, applied in order) in pyvenv.cfg, the scripts and activate scripts
+    and the editable installs and direct URLs of site-packages. Files are reflinked if possible,
+    hardlinked otherwise and copied as a last resort; rewritten files are always written as new files,
+    so the donor is never modified. Returns the link mode used (reflink/hardlink/copy).
+    Raises OSError if it cannot be copied or a binary file references the donor paths (e.g. Windows
+    launchers), as those cannot be rewritten.
+    """
+    link_mode = _get_link_mode(src_venv, dst_venv.parent)
+    link_function = {"reflink": _reflink_file, "hardlink": _hardlink_file}.get(link_mode, shutil.copy2)
+
+    def copy_function(src: str, dst: str) -> None:
+        try:
+            link_function(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    shutil.copytree(src_venv, dst_venv, symlinks=True, copy_function=copy_function)
+    scripts_dir = dst_venv / ("Scripts" if platform.system() == "Windows" else "bin")
+    files = [dst_venv / "pyvenv.cfg", *(path for path in scripts_dir.iterdir() if path.is_file())]
+    for site_packages_dir in [*dst_venv.glob("lib/python*/site-packages"), dst_venv / "Lib" / "site-packages"]:
+        files.extend(path for pattern in SITE_PACKAGES_PATH_FILES for path in site_packages_dir.glob(pattern))
+    for path in files:
+        if not path.is_symlink():
+            _rewrite_paths(path, replacements)
+    return link_mode
+
+
+def _rewrite_paths(path: Path, replacements: dict[str, str]) -> None:
+    """Function to replace the paths in a file, written as a new file (it may be a hardlink of the donor)."""
+    content = path.read_bytes()
+    if not any(old.encode() in content for old in replacements):
+        return None
+    try:
+        text = content.decode()
+    except UnicodeDecodeError:
+        raise OSError(f'Cannot rewrite the paths of the binary file "{path}".') from None
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    mode = path.stat().st_mode
+    path.unlink()
+    atomic_write_text(path, text)
+    path.chmod(mode)
+
+
+def _get_link_mode(src_venv: Path, dst_dir: Path) -> str:
+    """Function to get how the files can be copied between two directories: reflink, hardlink or copy."""
+    sample = next((path for path in src_venv.rglob("*") if path.is_file() and not path.is_symlink()), None)
+    if sample is None:
+        return "copy"
+    probe = dst_dir / f".{src_venv.name}.gvit-probe"
+    for link_mode, link_function in (("reflink", _reflink_file), ("hardlink", _hardlink_file)):
+        try:
+            link_function(sample, probe)
+            return link_mode
+        except OSError:
+            continue
+        finally:
+            probe.unlink(missing_ok=True)
+    return "copy"
+
+
+def _reflink_file(src: str | Path, dst: str | Path) -> None:
+    """Function to clone a file (copy-on-write), only supported in some Linux filesystems."""
+    if platform.system() != "Linux":
+        raise OSError("Reflinks are only supported on Linux.")
+    import fcntl
+
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    shutil.copystat(src, dst)
+
+
+def _hardlink_file(src: str | Path, dst: str | Path) -> None:
+    """Function to hardlink a file."""
+    os.link(src, dst)
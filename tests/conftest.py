@@ -146,4 +146,17 @@ def isolate_tests(monkeypatch, tmp_path):
     # Also patch in the utils module since it imports at module level
     monkeypatch.setattr("gvit.utils.utils.LOCAL_CONFIG_FILE", config_file)
     monkeypatch.setattr("gvit.utils.utils.LOCAL_CONFIG_DIR", temp_config)
-    monkeypatch.setattr("gvit.env_registry.ENVS_DIR", temp_envs)
+    monkeypatch.setattr("gvit.storages.toml_storage.ENVS_DIR", temp_envs)
+    monkeypatch.setattr("gvit.storages.toml_storage.ENVS_INDEX_FILE", temp_config / "envs_index.json")
+    monkeypatch.setattr("gvit.storages.toml_storage.ENVS_CACHE_DIR", temp_config / "cache" / "envs")
+    monkeypatch.setattr("gvit.storages.sqlite_storage.REGISTRY_DB_FILE", temp_config / "envs.db")
+    monkeypatch.setattr("gvit.env_registry.REGISTRY_LOCK_FILE", temp_config / "registry.lock")
+    monkeypatch.setattr("gvit.storages.toml_storage.REGISTRY_LOCK_FILE", temp_config / "registry.lock")
+    monkeypatch.setattr("gvit.freeze_store.FREEZES_DIR", temp_config / "freezes")
+    monkeypatch.setattr("gvit.freeze_store.FREEZES_REFS_FILE", temp_config / "freezes" / "refs.json")
+    monkeypatch.setattr("gvit.git.GIT_COMMANDS_CACHE_FILE", temp_config / "cache" / "git_commands.json")
+    monkeypatch.setattr("gvit.git.GIT_ALIASES_CACHE_FILE", temp_config / "cache" / "git_aliases.json")
+    monkeypatch.setattr("gvit.utils.freeze.FREEZES_CACHE_DIR", temp_config / "cache" / "freezes")
+    monkeypatch.setattr("gvit.utils.packages_cache.PACKAGES_CACHE_DIR", temp_config / "packages")
+    # The user site-packages of the machine is not scanned in the freezes of conda-like environments
+    monkeypatch.setenv("PYTHONNOUSERSITE", "1")
@@ -184,6 +184,33 @@ class TestEnvsPruneCommand:
         assert "orphaned-env" in result.output
 
 
+class TestEnvsReindexCommand:
+    """Test cases for 'gvit envs reindex' command."""
+
+    def test_reindex(self, temp_config_dir, temp_repo):
+        """Test rebuilding the registry index."""
+        env_data = {
+            "environment": {
+                "name": "test-env",
+                "backend": "venv",
+                "python": "3.11",
+                "path": str(temp_repo / ".venv"),
+                "created_at": "2025-01-01T00:00:00.000000"
+            },
+            "repository": {
+                "path": str(temp_repo),
+                "url": "https://github.com/test/repo.git"
+            }
+        }
+        with open(temp_config_dir / "envs" / "test-env.toml", "w") as f:
+            toml.dump(env_data, f)
+
+        result = runner.invoke(app, ["envs", "reindex"])
+        assert result.exit_code == 0
+        assert "1 environment(s) indexed" in result.output
+        assert (temp_config_dir / "envs_index.json").exists()
+
+
 class TestEnvsShowActivateCommand:
     """Test cases for 'gvit envs show-activate' command."""
 
@@ -284,3 +311,36 @@ class TestEnvsShowDeactivateCommand:
         result = runner.invoke(app, ["envs", "show-deactivate"])
         assert result.exit_code == 0
         assert "deactivate" in result.output
+
+
+class TestEnvsMigrateCommand:
+    """Test cases for 'gvit envs migrate' command."""
+
+    def test_migrate_to_sqlite(self, temp_config_dir, temp_repo):
+        """Test migrating the registry to SQLite and using it afterwards."""
+        env_data = {
+            "environment": {
+                "name": "test-env",
+                "backend": "venv",
+                "python": "3.11",
+                "path": str(temp_repo / ".venv"),
+                "created_at": "2025-01-01T00:00:00.000000"
+            },
+            "repository": {
+                "path": str(temp_repo),
+                "url": "https://github.com/test/repo.git"
+            }
+        }
+        with open(temp_config_dir / "envs" / "test-env.toml", "w") as f:
+            toml.dump(env_data, f)
+
+        result = runner.invoke(app, ["envs", "migrate", "--to", "sqlite"])
+        assert result.exit_code == 0
+        assert "1 environment(s) migrated" in result.output
+        assert toml.load(temp_config_dir / "config.toml")["registry"]["storage"] == "sqlite"
+
+        (temp_config_dir / "envs" / "test-env.toml").unlink()
+        result = runner.invoke(app, ["envs", "list"])
+        assert result.exit_code == 0
+        assert "test-env" in result.output
+        assert "envs.db" in result.output
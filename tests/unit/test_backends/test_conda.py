@@ -0,0 +1,107 @@
+"""
+Unit tests for CondaBackend class.
+"""
+
+import json
+
+import pytest
+
+from gvit.backends import conda as conda_module
+from gvit.backends.conda import CondaBackend
+
+
+@pytest.fixture
+def conda_root(tmp_path, monkeypatch):
+    """Create a fake conda installation with an environment and a home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.delenv("CONDA_ENVS_PATH", raising=False)
+    monkeypatch.delenv("CONDA_ENVS_DIRS", raising=False)
+    monkeypatch.delenv("CONDARC", raising=False)
+    monkeypatch.setattr(conda_module, "_ENV_PREFIXES", {})
+    monkeypatch.setattr(conda_module.platform, "system", lambda: "Linux")
+    root = tmp_path / "miniconda3"
+    for prefix in (root, root / "envs" / "myenv"):
+        (prefix / "conda-meta").mkdir(parents=True)
+        (prefix / "bin").mkdir()
+        (prefix / "bin" / "python").touch()
+    (root / "bin" / "conda").touch()
+    return root
+
+
+class TestCondaEnvPrefix:
+    """Test cases for the resolution of the environment prefixes without running conda."""
+
+    def test_get_venv_path_from_envs_dir(self, conda_root, mocker):
+        """Test that the environments inside <root>/envs are found without spawning conda."""
+        run = mocker.patch("gvit.backends.conda.subprocess.run")
+        backend = CondaBackend()
+        backend.path = str(conda_root / "bin" / "conda")
+        assert backend.get_venv_path("myenv") == str(conda_root / "envs" / "myenv")
+        assert backend.venv_exists("myenv")
+        run.assert_not_called()
+
+    def test_get_venv_path_from_environments_txt(self, conda_root, tmp_path, mocker):
+        """Test that the environments registered in ~/.conda/environments.txt are found."""
+        run = mocker.patch("gvit.backends.conda.subprocess.run")
+        prefix = tmp_path / "elsewhere" / "otherenv"
+        (prefix / "conda-meta").mkdir(parents=True)
+        environments_file = tmp_path / "home" / ".conda" / "environments.txt"
+        environments_file.parent.mkdir(parents=True)
+        environments_file.write_text(f"{conda_root}\n{prefix}\n")
+        backend = CondaBackend()
+        backend.path = "conda"
+        assert backend.get_venv_path("otherenv") == str(prefix)
+        run.assert_not_called()
+
+    def test_get_venv_path_from_condarc(self, conda_root, tmp_path, mocker):
+        """Test that the envs_dirs of ~/.condarc are scanned."""
+        mocker.patch("gvit.backends.conda.subprocess.run")
+        (tmp_path / "custom" / "customenv" / "conda-meta").mkdir(parents=True)
+        (tmp_path / "home").mkdir()
+        (tmp_path / "home" / ".condarc").write_text(f"channels:\n  - defaults\nenvs_dirs:\n  - {tmp_path / 'custom'}\n")
+        backend = CondaBackend()
+        backend.path = str(conda_root / "bin" / "conda")
+        assert backend.get_venv_path("customenv") == str(tmp_path / "custom" / "customenv")
+
+    def test_get_venv_path_falls_back_to_conda(self, conda_root, tmp_path, mocker):
+        """Test that conda env list is only run when the environment is not found in the known prefixes."""
+        prefix = tmp_path / "hidden" / "hiddenenv"
+        (prefix / "conda-meta").mkdir(parents=True)
+        run = mocker.patch("gvit.backends.conda.subprocess.run")
+        run.return_value.stdout = json.dumps({"envs": [str(prefix)]})
+        backend = CondaBackend()
+        backend.path = str(conda_root / "bin" / "conda")
+        assert backend.get_venv_path("hiddenenv") == str(prefix)
+        assert backend.get_venv_path("hiddenenv") == str(prefix)
+        run.assert_called_once()
+
+    def test_deleted_env_not_cached(self, conda_root, mocker):
+        """Test that a cached prefix is dropped once the environment is deleted."""
+        run = mocker.patch("gvit.backends.conda.subprocess.run")
+        run.return_value.stdout = json.dumps({"envs": []})
+        backend = CondaBackend()
+        backend.path = str(conda_root / "bin" / "conda")
+        assert backend.get_venv_path("myenv")
+        (conda_root / "envs" / "myenv" / "conda-meta").rmdir()
+        assert backend.get_venv_path("myenv") == ""
+
+
+class TestCondaCommands:
+    """Test cases for the commands run in the conda environments."""
+
+    def test_pip_cmd_uses_env_python(self, conda_root, mocker):
+        """Test that pip and uv are called with the python of the environment instead of conda run."""
+        mocker.patch("gvit.backends.conda.subprocess.run")
+        backend = CondaBackend()
+        backend.path = str(conda_root / "bin" / "conda")
+        python_path = str(conda_root / "envs" / "myenv" / "bin" / "python")
+        assert backend._get_pip_cmd("myenv", "pip", "uninstall") == [python_path, "-m", "pip", "uninstall", "-y"]
+        assert backend._get_pip_cmd("myenv", "uv", "install") == ["uv", "pip", "install", "-p", python_path]
+
+    def test_pip_cmd_falls_back_to_conda_run(self, conda_root, mocker):
+        """Test that conda run is used when the environment is not found."""
+        run = mocker.patch("gvit.backends.conda.subprocess.run")
+        run.return_value.stdout = json.dumps({"envs": []})
+        backend = CondaBackend()
+        backend.path = str(conda_root / "bin" / "conda")
+        assert backend._get_pip_cmd("missing", "pip", "install")[:4] == [backend.path, "run", "-n", "missing"]
@@ -0,0 +1,143 @@
+"""
+Unit tests for VenvBackend class.
+"""
+
+import subprocess
+import sys
+
+from gvit.backends import common
+from gvit.backends.common import install_dependencies, install_extra_dependencies, sync_dependencies
+from gvit.env_registry import EnvRegistry
+from gvit.backends.venv import VenvBackend
+
+
+class TestVenvSyncDependencies:
+    """Test cases for the package-level sync of dependencies."""
+
+    def test_sync_dependencies_commands(self, temp_repo, mocker):
+        """Test that only the given packages are installed and uninstalled."""
+        run = mocker.patch("gvit.backends.venv.subprocess.run")
+        touch = mocker.patch("gvit.backends.common.touch_packages_cache_entries")
+        assert sync_dependencies(".venv", "venv", "pip", str(temp_repo), "_base", ["numpy==2.0.0"], ["pandas"])
+        touch.assert_not_called()  # Recorded once per command, after all the groups are synced
+        install_cmd, uninstall_cmd = [call.args[0] for call in run.call_args_list]
+        python_path = VenvBackend()._get_python_executable_path(temp_repo / ".venv")
+        assert install_cmd == [python_path, "-m", "pip", "install", "numpy==2.0.0"]
+        assert uninstall_cmd == [python_path, "-m", "pip", "uninstall", "-y", "pandas"]
+
+    def test_sync_dependencies_uv(self, temp_repo, mocker):
+        """Test that uv pip is used when selected and nothing is uninstalled if not requested."""
+        mocker.patch("gvit.backends.common._is_uv_installed", return_value=True)
+        run = mocker.patch("gvit.backends.venv.subprocess.run")
+        assert sync_dependencies(".venv", "venv", "uv", str(temp_repo), "dev", ["pytest>=8"], [])
+        run.assert_called_once()
+        assert run.call_args.args[0][:3] == ["uv", "pip", "install"]
+
+    def test_sync_dependencies_uv_not_available(self, temp_repo, mocker, capsys):
+        """Test that pip is used, with a warning, when uv is not available."""
+        mocker.patch("gvit.backends.common._is_uv_installed", return_value=False)
+        run = mocker.patch("gvit.backends.venv.subprocess.run")
+        assert sync_dependencies(".venv", "venv", "uv", str(temp_repo), "dev", ["pytest>=8"], [])
+        assert run.call_args.args[0][1:4] == ["-m", "pip", "install"]
+        assert "Package manager uv is not available. Falling back to pip." in capsys.readouterr().out
+
+
+class TestVenvCombinedInstall:
+    """Test cases for the install of several dependency groups with a single resolution."""
+
+    def test_groups_installed_together(self, temp_repo, mocker):
+        """Test that the requirements files are installed with one command."""
+        (temp_repo / "requirements.txt").write_text("requests\n")
+        (temp_repo / "requirements-dev.txt").write_text("pytest\n")
+        run = mocker.patch("gvit.backends.venv.subprocess.run")
+        deps = {"_base": "requirements.txt", "dev": "requirements-dev.txt"}
+        assert install_extra_dependencies(".venv", "venv", "pip", str(temp_repo), deps) == deps
+        run.assert_called_once()
+        assert run.call_args.args[0][-4:] == [
+            "-r", str(temp_repo / "requirements.txt"), "-r", str(temp_repo / "requirements-dev.txt")
+        ]
+
+    def test_groups_retried_one_by_one(self, temp_repo, mocker):
+        """Test that the groups are retried one by one when the combined install fails."""
+        (temp_repo / "requirements.txt").write_text("requests\n")
+        (temp_repo / "requirements-dev.txt").write_text("broken\n")
+
+        def run(cmd, **kwargs):
+            if str(temp_repo / "requirements-dev.txt") in cmd:
+                raise subprocess.CalledProcessError(1, cmd)
+
+        run_mock = mocker.patch("gvit.backends.venv.subprocess.run", side_effect=run)
+        get_install_env = mocker.spy(common, "get_install_env")
+        deps = {"_base": "requirements.txt", "dev": "requirements-dev.txt"}
+        installed = install_extra_dependencies(".venv", "venv", "pip", str(temp_repo), deps)
+        assert installed == {"_base": "requirements.txt"}
+        assert run_mock.call_count == 3
+        assert get_install_env.call_count == 1  # Computed once for all the install commands
+        assert all(call.kwargs["env"] is get_install_env.spy_return for call in run_mock.call_args_list)
+
+
+class TestVenvDonorCopy:
+    """Test cases for the copy of an identical environment instead of installing the dependencies."""
+
+    def _create_repo(self, path, requirements):
+        """Create a repository with a requirements file and an empty venv."""
+        path.mkdir()
+        (path / "requirements.txt").write_text(requirements)
+        subprocess.run([sys.executable, "-m", "venv", "--without-pip", str(path / ".venv")], check=True)
+        return path
+
+    def _install(self, repo_path):
+        """Install the dependencies of a repository (pip only, subprocesses are mocked)."""
+        return install_dependencies(
+            ".venv", "venv", "pip", str(repo_path), "requirements.txt", None, {}, {}
+        )
+
+    def _build_donor(self, tmp_path):
+        """Create and register a donor environment with a package and a script."""
+        donor = self._create_repo(tmp_path / "donor", "requests==2.31.0\n")
+        site_packages = next((donor / ".venv").glob("lib/python*/site-packages"))
+        dist_info = site_packages / "requests-2.31.0.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: requests\nVersion: 2.31.0\n")
+        (donor / ".venv" / "bin" / "requests-cli").write_text(f"#!{donor / '.venv' / 'bin' / 'python'}\nprint()\n")
+        EnvRegistry().save_venv_info(
+            "donor", ".venv", str(donor / ".venv"), str(donor), "https://github.com/org/donor.git", "venv", "3.11", "requirements.txt", {}
+        )
+        return donor
+
+    def test_identical_env_copied(self, tmp_path, mocker):
+        """Test that an environment with the same dependencies is copied and its paths rewritten."""
+        donor = self._build_donor(tmp_path)
+        repo = self._create_repo(tmp_path / "repo", "requests==2.31.0\n")
+        run = mocker.patch("gvit.backends.venv.subprocess.run")
+        assert self._install(repo) == ("requirements.txt", {})
+        run.assert_not_called()
+        assert next((repo / ".venv").glob("lib/python*/site-packages/requests-2.31.0.dist-info")).is_dir()
+        script = (repo / ".venv" / "bin" / "requests-cli").read_text()
+        assert script.startswith(f"#!{repo / '.venv' / 'bin' / 'python'}")
+        assert str(repo / ".venv") in (repo / ".venv" / "bin" / "activate").read_text()
+        assert (donor / ".venv" / "bin" / "requests-cli").read_text().startswith(f"#!{donor}")
+        assert str(donor) not in (repo / ".venv" / "pyvenv.cfg").read_text()
+
+    def test_different_deps_installed(self, tmp_path, mocker):
+        """Test that the dependencies are installed when no environment has the same hashes."""
+        self._build_donor(tmp_path)
+        repo = self._create_repo(tmp_path / "repo", "requests==2.32.0\n")
+        run = mocker.patch("gvit.backends.venv.subprocess.run")
+        assert self._install(repo) == ("requirements.txt", {})
+        run.assert_called_once()
+        assert not list((repo / ".venv").glob("lib/python*/site-packages/requests-*"))
+
+    def test_project_not_copied(self, tmp_path, mocker):
+        """Test that the dependencies are installed when they include the project itself (-e .)."""
+        donor = self._build_donor(tmp_path)
+        (donor / "requirements.txt").write_text("-e .\nrequests==2.31.0\n")
+        (donor / "pyproject.toml").write_text("[project]\nname = 'donor'\n")
+        EnvRegistry().save_venv_info(
+            "donor", ".venv", str(donor / ".venv"), str(donor), "https://github.com/org/donor.git", "venv", "3.11", "requirements.txt", {}
+        )
+        repo = self._create_repo(tmp_path / "repo", "-e .\nrequests==2.31.0\n")
+        (repo / "pyproject.toml").write_text("[project]\nname = 'donor'\n")
+        run = mocker.patch("gvit.backends.venv.subprocess.run")
+        assert self._install(repo) == ("requirements.txt", {})
+        run.assert_called_once()
@@ -0,0 +1,128 @@
+"""
+Unit tests for the gvit CLI entry point.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import typer
+from typer.testing import CliRunner
+
+from gvit.cli import app, gvit_cli, GvitGroup, _parse_command_from_argv
+from gvit.utils.lazy_group import _import_function
+from gvit.utils.manifest import COMMANDS, GROUPS, GVIT_COMMANDS, GROUP_SUBCOMMANDS
+
+
+runner = CliRunner()
+
+HEAVY_MODULES = ["questionary", "pyperclip", "rich", "toml", "gvit.backends", "gvit.commands", "gvit.env_registry"]
+
+
+def _get_import_times(module: str) -> dict[str, int]:
+    """Run `python -X importtime -c "import <module>"` and return {module: cumulative_us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if match := re.match(r"import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)", line):
+            times[match.group(3)] = int(match.group(1))
+    return times
+
+
+def _get_loaded_modules(argv: list[str], home: Path) -> list[str]:
+    """Resolve the command of `gvit <argv>` in a new interpreter (with HOME=home) and return the heavy modules it imported."""
+    code = (
+        "import sys\n"
+        f"sys.argv = {['gvit', *argv]!r}\n"
+        "from gvit.cli import _parse_command_from_argv\n"
+        "_parse_command_from_argv()\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    env = {**os.environ, "HOME": str(home), "XDG_CONFIG_HOME": str(home / ".config")}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    return [
+        name for name in result.stdout.splitlines()
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    ]
+
+
+class TestLazyLoading:
+    """Test cases for the lazy command loading of the CLI."""
+
+    def test_import_does_not_load_heavy_modules(self):
+        """Test that importing the CLI does not import command modules or their dependencies."""
+        times = _get_import_times("gvit.cli")
+        loaded = [
+            name for name in times
+            if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+        ]
+        assert loaded == []
+
+    def test_command_resolution_does_not_load_heavy_modules(self, tmp_path):
+        """Test that resolving the command (help, gvit command or git fallback) does not import heavy modules."""
+        assert _get_loaded_modules(["--help"], tmp_path) == []
+        assert _get_loaded_modules(["envs", "list"], tmp_path) == []
+        assert _get_loaded_modules(["log"], tmp_path) == []
+
+    def test_list_commands_does_not_import(self):
+        """Test that listing the commands does not build the lazy commands."""
+        group = GvitGroup(name="gvit")
+        commands = group.list_commands(None)
+        assert "envs" in commands
+        assert "pull" in commands
+        assert group.commands == {}
+
+    def test_lazy_group_invocation(self, temp_config_dir):
+        """Test that a lazy group subcommand is resolved and invoked."""
+        result = runner.invoke(app, ["envs", "list"])
+        assert result.exit_code == 0
+        assert "No environments in registry" in result.output
+
+    def test_tree_lists_lazy_commands(self):
+        """Test that `gvit tree` shows the lazily loaded commands and subcommands."""
+        result = runner.invoke(app, ["tree"])
+        assert result.exit_code == 0
+        assert "pull" in result.output
+        assert "show-activate" in result.output
+
+
+class TestCommandManifest:
+    """Test cases for the command manifest used by the dispatcher."""
+
+    def test_manifest_import_paths_resolve(self):
+        """Test that every command in the manifest points to an existing function."""
+        for import_path, _ in COMMANDS.values():
+            assert callable(_import_function(import_path))
+        for _, subcommands in GROUPS.values():
+            for import_path in subcommands.values():
+                assert callable(_import_function(import_path))
+
+    def test_manifest_matches_built_app(self):
+        """Test that the built click app exposes exactly the commands in the manifest."""
+        root = typer.main.get_command(app)
+        ctx = typer.Context(root)
+        assert set(root.list_commands(ctx)) == GVIT_COMMANDS
+        for group_name, subcommands in GROUP_SUBCOMMANDS.items():
+            assert set(root.get_command(ctx, group_name).list_commands(ctx)) == subcommands
+
+    def test_parse_command_does_not_build_app(self, monkeypatch, mocker):
+        """Test that dispatching a gvit command does not construct the Typer app."""
+        get_command = mocker.patch("typer.main.get_command")
+        monkeypatch.setattr(sys, "argv", ["gvit", "pull"])
+        command_info = _parse_command_from_argv()
+        assert command_info == {"command": "pull", "is_git_fallback": False, "should_log": True}
+        get_command.assert_not_called()
+
+    def test_git_fallback_uses_passthrough(self, monkeypatch, mocker):
+        """Test that a git command is delegated through the exec-based passthrough."""
+        passthrough = mocker.patch("gvit.cli.Git.passthrough")
+        monkeypatch.setattr(sys, "argv", ["gvit", "log", "-1"])
+        gvit_cli()
+        passthrough.assert_called_once_with(["log", "-1"])
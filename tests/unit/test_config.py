@@ -0,0 +1,24 @@
+"""
+Unit tests for the helpers of the config command.
+"""
+
+import toml
+
+from gvit.commands.config import _get_updated_local_config
+
+
+class TestUpdatedLocalConfig:
+    """Test cases for the local config written by `gvit config setup`."""
+
+    def test_sections_not_in_setup_preserved(self, temp_config_dir):
+        """Test that the registry and shared package cache settings are kept."""
+        existing_config = {
+            "deps": {"_base": "requirements.txt", "dev": "requirements-dev.txt"},
+            "registry": {"storage": "sqlite"},
+            "cache": {"dir": "/shared/gvit-cache", "enabled": True, "max_size_mb": 2000},
+        }
+        (temp_config_dir / "config.toml").write_text(toml.dumps(existing_config))
+        config = _get_updated_local_config("venv", "3.12", "uv", "pyproject.toml", None, None, True)
+        assert config["deps"] == {"_base": "pyproject.toml", "dev": "requirements-dev.txt"}
+        assert config["registry"] == existing_config["registry"]
+        assert config["cache"] == existing_config["cache"]
@@ -5,6 +5,8 @@ Unit tests for EnvRegistry class.
 import toml
 
 from gvit.env_registry import EnvRegistry
+from gvit.storages import toml_storage
+from gvit.utils.freeze import FREEZE_FORMAT, FreezeSnapshot
 
 
 class TestEnvRegistry:
@@ -248,3 +250,294 @@ class TestEnvRegistry:
         non_existent = temp_repo / "non-existent.txt"
         hash_result = env_registry._hash_file(non_existent)
         assert hash_result is None
+
+    def test_find_by_repo(self, env_registry, temp_repo):
+        """Test finding an environment by its repository path through the index."""
+        env_registry.save_venv_info(
+            registry_name="test-env",
+            venv_name=".venv",
+            venv_path=str(temp_repo / ".venv"),
+            repo_path=str(temp_repo),
+            repo_url="https://github.com/test/repo.git",
+            backend="venv",
+            python="3.11",
+            base_deps=None,
+            extra_deps={},
+        )
+        env = env_registry.find_by_repo(temp_repo)
+        assert env is not None
+        assert env["environment"]["name"] == "test-env"
+        assert env_registry.find_by_repo(temp_repo / "other") is None
+
+        env_registry.delete_environment_registry("test-env")
+        assert env_registry.find_by_repo(temp_repo) is None
+
+    def test_find_by_repo_does_not_parse_other_envs(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that a lookup only loads the registry file of the matching environment."""
+        envs_dir = temp_config_dir / "envs"
+        for name, repo_path in [("env1", temp_repo), ("env2", "/tmp/other-repo")]:
+            env_data = {
+                "environment": {"name": name, "backend": "venv", "python": "3.11", "path": f"{repo_path}/.venv"},
+                "repository": {"path": str(repo_path), "url": ""},
+            }
+            with open(envs_dir / f"{name}.toml", "w") as f:
+                toml.dump(env_data, f)
+        env_registry.reindex()
+
+        load = mocker.spy(env_registry.storage, "load")
+        env = env_registry.find_by_repo(temp_repo)
+        assert env["environment"]["name"] == "env1"
+        load.assert_called_once_with("env1")
+
+    def test_index_rebuilt_when_registry_changes(self, env_registry, temp_config_dir, temp_repo):
+        """Test that registry files added outside gvit are picked up by the index."""
+        env_registry.reindex()
+        env_data = {
+            "environment": {"name": "manual-env", "backend": "venv", "python": "3.11", "path": f"{temp_repo}/.venv"},
+            "repository": {"path": str(temp_repo), "url": ""},
+        }
+        with open(temp_config_dir / "envs" / "manual-env.toml", "w") as f:
+            toml.dump(env_data, f)
+        env = env_registry.find_by_repo(temp_repo)
+        assert env is not None
+        assert env["environment"]["name"] == "manual-env"
+
+    def test_index_stale_when_registry_changes_during_rebuild(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that a registry file added while the index is rebuilt is picked up by the next lookup."""
+        env_data = {
+            "environment": {"name": "late-env", "backend": "venv", "python": "3.11", "path": f"{temp_repo}/.venv"},
+            "repository": {"path": str(temp_repo), "url": ""},
+        }
+        load_all = env_registry.storage.load_all
+
+        def load_all_while_writing():
+            envs = load_all()
+            with open(temp_config_dir / "envs" / "late-env.toml", "w") as f:
+                toml.dump(env_data, f)
+            return envs
+
+        mocker.patch.object(env_registry.storage, "load_all", side_effect=load_all_while_writing)
+        assert env_registry.find_by_repo(temp_repo) is None
+        mocker.patch.object(env_registry.storage, "load_all", side_effect=load_all)
+        assert env_registry.find_by_repo(temp_repo)["environment"]["name"] == "late-env"
+
+    def test_freeze_stored_apart_from_registry(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that the freeze snapshot is stored compressed and only referenced by hash."""
+        freeze = "click==8.1.0\nrequests==2.31.0"
+        mocker.patch("gvit.env_registry.get_freeze", return_value=FreezeSnapshot(freeze))
+        (temp_repo / "requirements.txt").write_text("requests==2.31.0\nclick==8.1.0\n")
+        env_registry.save_venv_info(
+            registry_name="test-env",
+            venv_name=".venv",
+            venv_path=str(temp_repo / ".venv"),
+            repo_path=str(temp_repo),
+            repo_url="https://github.com/test/repo.git",
+            backend="venv",
+            python="3.11",
+            base_deps="requirements.txt",
+            extra_deps={},
+        )
+        installed = toml.load(temp_config_dir / "envs" / "test-env.toml")["deps"]["installed"]
+        assert "_freeze" not in installed
+        assert (temp_config_dir / "freezes" / f"{installed['_freeze_hash']}.xz").exists()
+        assert env_registry.load_freeze(env_registry.load_environment_info("test-env")).text == freeze
+
+    def test_load_freeze_legacy_inline(self, env_registry):
+        """Test that registry files with the freeze inline are still supported."""
+        venv_info = {"deps": {"installed": {"_freeze_hash": "abc", "_freeze": "click==8.1.0"}}}
+        assert env_registry.load_freeze(venv_info).text == "click==8.1.0"
+        assert env_registry.load_freeze({"deps": {"installed": {"_freeze_hash": "missing"}}}) is None
+
+    def test_restamp_legacy_freeze(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that legacy entries are re-stamped with the scanned freeze if the package manager still matches."""
+        legacy_freeze = FreezeSnapshot("Click==8.1.0\nsetuptools==69.0.0\n")
+        current_freeze = FreezeSnapshot("Click==8.1.0\n")
+        get_freeze = mocker.patch("gvit.env_registry.get_freeze", return_value=legacy_freeze)
+        venv_info = {
+            "environment": {"name": "legacy-env", "backend": "uv", "path": str(temp_repo / ".venv"), "python": "3.11"},
+            "repository": {"path": str(temp_repo), "url": "https://github.com/test/repo.git"},
+            "deps": {"_base": "requirements.txt", "installed": {"_freeze_hash": legacy_freeze.hash}},
+        }
+        env_registry.save_environment_info("legacy-env", venv_info)
+        assert env_registry.restamp_legacy_freeze(venv_info, current_freeze)
+        assert get_freeze.call_args.kwargs == {"scan": False}
+        installed = env_registry.load_environment_info("legacy-env")["deps"]["installed"]
+        assert installed["_freeze_hash"] == current_freeze.hash and installed["_freeze_format"] == FREEZE_FORMAT
+        assert env_registry.load_freeze(env_registry.load_environment_info("legacy-env")) == current_freeze
+        # Already re-stamped, or changed since it was registered
+        assert not env_registry.restamp_legacy_freeze(venv_info, FreezeSnapshot("Click==8.2.0\n"))
+        del venv_info["deps"]["installed"]["_freeze_format"]
+        assert not env_registry.restamp_legacy_freeze(venv_info, FreezeSnapshot("Click==8.2.0\n"))
+
+    def test_parsed_entries_cached(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that unchanged registry files are not parsed again, in or across processes."""
+        env_data = {
+            "environment": {"name": "env1", "backend": "venv", "python": "3.11", "path": f"{temp_repo}/.venv"},
+            "repository": {"path": str(temp_repo), "url": ""},
+        }
+        env_file = temp_config_dir / "envs" / "env1.toml"
+        with open(env_file, "w") as f:
+            toml.dump(env_data, f)
+        assert env_registry.load_environment_info("env1") == env_data
+        assert (temp_config_dir / "cache" / "envs" / "env1.json").exists()
+
+        toml_load = mocker.spy(toml, "load")
+        mocker.patch.dict("gvit.storages.toml_storage._PARSED_ENTRIES", clear=True)  # New process
+        venv_info = env_registry.load_environment_info("env1")
+        venv_info["environment"]["name"] = "modified"
+        assert env_registry.get_environments() == [env_data]
+        toml_load.assert_not_called()
+
+        env_data["environment"]["python"] = "3.12.4"
+        with open(env_file, "w") as f:
+            toml.dump(env_data, f)
+        assert env_registry.load_environment_info("env1")["environment"]["python"] == "3.12.4"
+        toml_load.assert_called_once()
+
+    def test_parsed_entries_cached_per_environment(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that loading an environment only reads and writes its own parsed entry."""
+        for name in ("env1", "env2"):
+            env_data = {
+                "environment": {"name": name, "backend": "venv", "python": "3.11", "path": f"{temp_repo}/.venv"},
+                "repository": {"path": str(temp_repo), "url": ""},
+            }
+            with open(temp_config_dir / "envs" / f"{name}.toml", "w") as f:
+                toml.dump(env_data, f)
+        env_registry.get_environments()
+        mocker.patch.dict("gvit.storages.toml_storage._PARSED_ENTRIES", clear=True)  # New process
+        load_cache = mocker.spy(toml_storage, "load_cache")
+        save_cache = mocker.spy(toml_storage, "save_cache")
+        assert env_registry.load_environment_info("env2")["environment"]["name"] == "env2"
+        assert [call.args[0].name for call in load_cache.call_args_list] == ["env2.json"]
+        save_cache.assert_not_called()
+        env_registry.delete_environment_registry("env1")
+        assert not (temp_config_dir / "cache" / "envs" / "env1.json").exists()
+
+    def test_modified_deps_skips_hashing_unchanged_files(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that dependency files with the same stat as when installed are not hashed."""
+        mocker.patch("gvit.env_registry.get_freeze", return_value=None)
+        req_file = temp_repo / "requirements.txt"
+        req_file.write_text("requests==2.31.0\n")
+        env_registry.save_venv_info(
+            registry_name="test-env",
+            venv_name=".venv",
+            venv_path=str(temp_repo / ".venv"),
+            repo_path=str(temp_repo),
+            repo_url="https://github.com/test/repo.git",
+            backend="venv",
+            python="3.11",
+            base_deps="requirements.txt",
+            extra_deps={},
+        )
+        installed = toml.load(temp_config_dir / "envs" / "test-env.toml")["deps"]["installed"]
+        assert len(installed["_base_stat"]) == 3
+
+        hash_file = mocker.spy(env_registry, "_hash_file")
+        assert env_registry.get_modified_deps_groups("test-env", {"_base": "requirements.txt"}) == []
+        hash_file.assert_not_called()
+
+        req_file.write_text("requests==2.32.0\n")
+        assert env_registry.get_modified_deps_groups("test-env", {"_base": "requirements.txt"}) == ["_base"]
+        hash_file.assert_called_once()
+
+    def test_modified_deps_follows_includes(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that changes in files included by a requirements file mark its group as modified."""
+        mocker.patch("gvit.env_registry.get_freeze", return_value=None)
+        (temp_repo / "requirements.txt").write_text("-r base.txt\n-c constraints.txt\n")
+        (temp_repo / "base.txt").write_text("requests\n")
+        (temp_repo / "constraints.txt").write_text("requests==2.31.0\n")
+        env_registry.save_venv_info(
+            registry_name="test-env",
+            venv_name=".venv",
+            venv_path=str(temp_repo / ".venv"),
+            repo_path=str(temp_repo),
+            repo_url="https://github.com/test/repo.git",
+            backend="venv",
+            python="3.11",
+            base_deps="requirements.txt",
+            extra_deps={},
+        )
+        installed = toml.load(temp_config_dir / "envs" / "test-env.toml")["deps"]["installed"]
+        assert set(installed["_base_includes"]) == {"base.txt", "constraints.txt"}
+        assert installed["_base_hash"] != env_registry._hash_file(temp_repo / "requirements.txt")
+
+        hash_file = mocker.spy(env_registry, "_hash_file")
+        assert env_registry.get_modified_deps_groups("test-env", {"_base": "requirements.txt"}) == []
+        hash_file.assert_not_called()
+
+        (temp_repo / "constraints.txt").write_text("requests==2.32.0\n")
+        assert env_registry.get_modified_deps_groups("test-env", {"_base": "requirements.txt"}) == ["_base"]
+
+    def test_modified_deps_ignores_cosmetic_changes(self, env_registry, temp_config_dir, temp_repo, mocker):
+        """Test that reordering, comments and whitespace in a requirements file are not reported as changes."""
+        mocker.patch("gvit.env_registry.get_freeze", return_value=None)
+        req_file = temp_repo / "requirements.txt"
+        req_file.write_text("requests==2.31.0\nnumpy==1.26.4\n")
+        env_registry.save_venv_info(
+            registry_name="test-env",
+            venv_name=".venv",
+            venv_path=str(temp_repo / ".venv"),
+            repo_path=str(temp_repo),
+            repo_url="https://github.com/test/repo.git",
+            backend="venv",
+            python="3.11",
+            base_deps="requirements.txt",
+            extra_deps={},
+        )
+        installed = toml.load(temp_config_dir / "envs" / "test-env.toml")["deps"]["installed"]
+        assert installed["_base_requirements"] == ["numpy==1.26.4", "requests==2.31.0"]
+
+        req_file.write_text("# Pinned\nNumPy == 1.26.4\n\nrequests==2.31.0  # http\n")
+        assert env_registry.get_modified_deps_groups("test-env", {"_base": "requirements.txt"}) == []
+        req_file.write_text("numpy==1.26.4\nrequests==2.32.0\n")
+        assert env_registry.get_modified_deps_groups("test-env", {"_base": "requirements.txt"}) == ["_base"]
+
+    def test_modified_deps_accepts_legacy_raw_hashes(self, env_registry, temp_config_dir, temp_repo):
+        """Test that raw hashes stored by older versions do not trigger a reinstall."""
+        req_file = temp_repo / "requirements.txt"
+        req_file.write_text("requests==2.31.0\n")
+        registry_data = {
+            "environment": {"name": "test-env", "backend": "venv", "path": str(temp_repo / ".venv"),
+                            "python": "3.11", "created_at": "2024-01-01T00:00:00"},
+            "repository": {"path": str(temp_repo), "url": "https://github.com/test/repo.git"},
+            "deps": {"_base": "requirements.txt", "installed": {
+                "_base_hash": env_registry._hash_file(req_file, normalize=False),
+                "installed_at": "2024-01-01T00:00:00",
+            }},
+        }
+        env_registry.save_environment_info("test-env", registry_data)
+        assert env_registry.get_modified_deps_groups("test-env", {"_base": "requirements.txt"}) == []
+
+    def test_get_deps_requirements_pyproject(self, env_registry, temp_repo):
+        """Test that pyproject.toml extras can be installed requirement by requirement, but not the base deps."""
+        pyproject_data = {
+            "project": {
+                "name": "My_Project",
+                "dependencies": ["requests"],
+                "optional-dependencies": {"dev": ["pytest>=8", "Ruff"], "all": ["my-project[dev]"]},
+            },
+        }
+        with open(temp_repo / "pyproject.toml", "w") as f:
+            toml.dump(pyproject_data, f)
+        deps = {"_base": "pyproject.toml", "dev": "pyproject.toml", "all": "pyproject.toml"}
+        assert env_registry.get_deps_requirements(temp_repo, deps) == {
+            "_base": None, "dev": ["pytest>=8", "ruff"], "all": None,
+        }
+
+    def test_pyproject_build_config_changes_base(self, env_registry, temp_repo):
+        """Test that a change in [build-system] changes the base deps hash but not the extras hash."""
+        pyproject_data = {
+            "build-system": {"requires": ["setuptools>=61"], "build-backend": "setuptools.build_meta"},
+            "project": {"name": "proj", "dependencies": ["requests"], "optional-dependencies": {"dev": ["pytest"]}},
+        }
+        pyproject_file = temp_repo / "pyproject.toml"
+        with open(pyproject_file, "w") as f:
+            toml.dump(pyproject_data, f)
+        base_hash = env_registry._hash_pyproject_deps(pyproject_file)
+        dev_hash = env_registry._hash_pyproject_deps(pyproject_file, "dev")
+
+        pyproject_data["build-system"]["requires"] = ["hatchling"]
+        with open(pyproject_file, "w") as f:
+            toml.dump(pyproject_data, f)
+        assert env_registry._hash_pyproject_deps(pyproject_file) != base_hash
+        assert env_registry._hash_pyproject_deps(pyproject_file, "dev") == dev_hash
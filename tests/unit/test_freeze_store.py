@@ -0,0 +1,85 @@
+"""
+Unit tests for FreezeStore class.
+"""
+
+import json
+import zlib
+
+from gvit.freeze_store import FreezeStore, hash_freeze
+
+
+FREEZE_A = "click==8.1.0\nrequests==2.31.0"
+FREEZE_B = "click==8.1.7\nrequests==2.31.0"
+
+
+class TestFreezeStore:
+    """Test cases for the content-addressed freeze snapshot store."""
+
+    def test_put_and_get(self, temp_config_dir):
+        """Test that a snapshot is stored compressed by hash and loaded back."""
+        store = FreezeStore()
+        freeze_hash = store.put("env1", FREEZE_A)
+        assert freeze_hash == hash_freeze(FREEZE_A)
+        assert (temp_config_dir / "freezes" / f"{freeze_hash}.xz").exists()
+        assert store.get(freeze_hash) == FREEZE_A
+        assert store.get("not-stored") is None
+
+    def test_identical_freezes_stored_once(self, temp_config_dir):
+        """Test that environments with the same freeze share a single snapshot."""
+        store = FreezeStore()
+        store.put("env1", FREEZE_A)
+        freeze_hash = store.put("env2", FREEZE_A)
+        assert len(list((temp_config_dir / "freezes").glob("*.xz"))) == 1
+        refs = json.loads((temp_config_dir / "freezes" / "refs.json").read_text())
+        assert refs == {freeze_hash: ["env1", "env2"]}
+
+    def test_release_deletes_unreferenced(self, temp_config_dir):
+        """Test that a snapshot is deleted only when its last reference is released."""
+        store = FreezeStore()
+        freeze_hash = store.put("env1", FREEZE_A)
+        store.put("env2", FREEZE_A)
+        store.release("env1")
+        assert store.get(freeze_hash) == FREEZE_A
+        store.release("env2")
+        assert store.get(freeze_hash) is None
+
+    def test_put_releases_previous_snapshot(self, temp_config_dir):
+        """Test that updating the freeze of an environment drops its old snapshot."""
+        store = FreezeStore()
+        old_hash = store.put("env1", FREEZE_A)
+        new_hash = store.put("env1", FREEZE_B)
+        assert store.get(old_hash) is None
+        assert store.get(new_hash) == FREEZE_B
+
+    def test_collect_garbage(self, temp_config_dir):
+        """Test that unreferenced snapshots (including legacy zlib ones) are collected."""
+        store = FreezeStore()
+        kept_hash = store.put("env1", FREEZE_A)
+        store.put("env2", FREEZE_B)
+        (temp_config_dir / "freezes" / "legacy.zlib").write_bytes(zlib.compress(b"six==1.16.0"))
+        assert store.get("legacy") == "six==1.16.0"
+        assert store.collect_garbage({kept_hash: ["env1"]}) == 2
+        assert store.get(kept_hash) == FREEZE_A
+        assert store.get("legacy") is None
+
+    def test_missing_refs_rebuilt_from_registry(self, temp_config_dir):
+        """Test that a missing refs.json is rebuilt from the registry before releasing snapshots."""
+        hash_a = FreezeStore().put("env1", FREEZE_A)
+        hash_b = FreezeStore().put("env2", FREEZE_B)
+        (temp_config_dir / "freezes" / "refs.json").unlink()
+        store = FreezeStore(lambda: {hash_a: ["env1"], hash_b: ["env2"]})
+        store.put("env2", FREEZE_A)
+        assert store.get(hash_a) == FREEZE_A
+        assert store.get(hash_b) is None
+        refs = json.loads((temp_config_dir / "freezes" / "refs.json").read_text())
+        assert refs == {hash_a: ["env1", "env2"]}
+
+    def test_unreadable_refs_never_delete(self, temp_config_dir):
+        """Test that snapshots are not deleted when the references cannot be loaded nor rebuilt."""
+        freeze_hash = FreezeStore().put("env1", FREEZE_A)
+        (temp_config_dir / "freezes" / "refs.json").write_text("{not json")
+        store = FreezeStore()
+        store.put("env2", FREEZE_B)
+        store.release("env1")
+        assert store.get(freeze_hash) == FREEZE_A
+        assert (temp_config_dir / "freezes" / "refs.json").read_text() == "{not json"
@@ -0,0 +1,188 @@
+"""
+Unit tests for Git class.
+"""
+
+import os
+import json
+import subprocess
+
+import pytest
+
+from gvit.git import Git
+
+
+class TestGitCommandCatalogue:
+    """Test cases for the cached catalogue of git commands."""
+
+    def test_command_exists(self, temp_config_dir):
+        """Test that built-in git commands are found and unknown ones are not."""
+        git = Git()
+        assert git.command_exists("log")
+        assert git.command_exists("rebase")
+        assert not git.command_exists("definitely-not-a-git-command")
+
+    def test_catalogue_is_cached(self, temp_config_dir, mocker):
+        """Test that the catalogue is built once and then read from the cache file."""
+        git = Git()
+        commands = git.get_commands()
+        cache_file = temp_config_dir / "cache" / "git_commands.json"
+        assert cache_file.exists()
+        assert set(json.loads(cache_file.read_text())["commands"]) == commands
+
+        run = mocker.patch("gvit.git.subprocess.run")
+        assert git.command_exists("status")
+        run.assert_not_called()
+
+    def test_catalogue_rebuilt_when_git_changes(self, temp_config_dir, mocker):
+        """Test that the catalogue is rebuilt if the git binary (path/version) changed."""
+        git = Git()
+        git.get_commands()
+        cache_file = temp_config_dir / "cache" / "git_commands.json"
+        cache = json.loads(cache_file.read_text())
+        cache["git"]["mtime_ns"] = 0
+        cache["commands"] = ["stale"]
+        cache_file.write_text(json.dumps(cache))
+
+        assert git.command_exists("log")
+        assert "stale" not in json.loads(cache_file.read_text())["commands"]
+
+    def test_external_commands_not_cached(self, temp_config_dir, tmp_path, monkeypatch):
+        """Test that the git-<command> executables in PATH are found without being cached."""
+        git = Git()
+        git.get_commands()
+        external_command = tmp_path / "git-mytool"
+        external_command.write_text("#!/bin/sh\n")
+        external_command.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+        assert git.command_exists("mytool")
+        assert "mytool" not in json.loads((temp_config_dir / "cache" / "git_commands.json").read_text())["commands"]
+
+    def test_fallback_to_help_probe(self, temp_config_dir, mocker):
+        """Test that the `git <command> --help` probe is used if the catalogue is not available."""
+        mocker.patch.object(Git, "get_commands", return_value=None)
+        run = mocker.patch(
+            "gvit.git.subprocess.run", return_value=subprocess.CompletedProcess([], returncode=0)
+        )
+        assert Git().command_exists("log")
+        assert run.call_args.args[0] == ["git", "log", "--help"]
+
+
+class TestGitAliases:
+    """Test cases for the cached git alias resolution."""
+
+    def test_resolve_alias(self, temp_config_dir, tmp_path, monkeypatch):
+        """Test that aliases are resolved to the first word of their expansion."""
+        gitconfig = tmp_path / "gitconfig"
+        gitconfig.write_text('[alias]\n\tco = checkout\n\tlg = log --oneline\n')
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(gitconfig))
+        git = Git()
+        assert git.get_aliases() == {"co": "checkout", "lg": "log --oneline"}
+        assert git.resolve_alias("lg") == "log"
+        assert git.resolve_alias("not-an-alias") == "not-an-alias"
+
+    def test_aliases_cached_until_gitconfig_changes(self, temp_config_dir, tmp_path, monkeypatch, mocker):
+        """Test that aliases are read from the cache until a gitconfig file is modified."""
+        gitconfig = tmp_path / "gitconfig"
+        gitconfig.write_text('[alias]\n\tco = checkout\n')
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(gitconfig))
+        git = Git()
+        git.get_aliases()
+
+        run = mocker.spy(subprocess, "run")
+        assert git.resolve_alias("co") == "checkout"
+        run.assert_not_called()
+
+        gitconfig.write_text('[alias]\n\tco = commit\n')
+        stat = gitconfig.stat()
+        os.utime(gitconfig, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert git.resolve_alias("co") == "commit"
+        assert run.call_count == 1
+
+    def test_aliases_cache_tracks_includes_and_env(self, temp_config_dir, tmp_path, monkeypatch):
+        """Test that the cache is invalidated by changes in included files and in the GIT_CONFIG_* variables."""
+        included = tmp_path / "aliases.gitconfig"
+        included.write_text("")
+        gitconfig = tmp_path / "gitconfig"
+        gitconfig.write_text("[include]\n\tpath = aliases.gitconfig\n")
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(gitconfig))
+        git = Git()
+        assert git.get_aliases() == {}
+
+        included.write_text("[alias]\n\tco = checkout\n")
+        stat = included.stat()
+        os.utime(included, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert git.get_aliases() == {"co": "checkout"}
+
+        monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+        monkeypatch.setenv("GIT_CONFIG_KEY_0", "alias.st")
+        monkeypatch.setenv("GIT_CONFIG_VALUE_0", "status")
+        assert git.get_aliases() == {"co": "checkout", "st": "status"}
+
+    def test_aliases_cache_bounded(self, temp_config_dir, tmp_path, monkeypatch):
+        """Test that the aliases cache keeps a limited number of repositories."""
+        monkeypatch.setattr("gvit.git.GIT_ALIASES_CACHE_MAX_ENTRIES", 2)
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+        for name in ("repo1", "repo2", "repo3"):
+            (tmp_path / name / ".git").mkdir(parents=True)
+            monkeypatch.chdir(tmp_path / name)
+            Git().get_aliases()
+        cache = json.loads((temp_config_dir / "cache" / "git_aliases.json").read_text())
+        assert list(cache) == [str(tmp_path / name / ".git" / "config") for name in ("repo2", "repo3")]
+
+
+class TestGitPassthrough:
+    """Test cases for the exec-based git passthrough."""
+
+    def test_passthrough_execs_git(self, mocker):
+        """Test that the process is replaced with git."""
+        mocker.patch("gvit.git.platform.system", return_value="Linux")
+        execvp = mocker.patch("gvit.git.os.execvp")
+        Git().passthrough(["log", "--oneline"])
+        execvp.assert_called_once_with("git", ["git", "log", "--oneline"])
+
+    def test_passthrough_windows_uses_run(self, mocker):
+        """Test that on Windows the git command is run as a subprocess."""
+        mocker.patch("gvit.git.platform.system", return_value="Windows")
+        run = mocker.patch.object(Git, "run", side_effect=SystemExit(0))
+        execvp = mocker.patch("gvit.git.os.execvp")
+        with pytest.raises(SystemExit):
+            Git().passthrough(["log"])
+        run.assert_called_once_with(["log"])
+        execvp.assert_not_called()
+
+
+class TestGitChangedFiles:
+    """Test cases for the git helpers used to detect changed dependency files."""
+
+    @pytest.fixture
+    def git_repo(self, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for args in (["init", "-q"], ["config", "user.email", "t@t.t"], ["config", "user.name", "t"]):
+            subprocess.run(["git", *args], cwd=repo, check=True)
+        (repo / "requirements.txt").write_text("-r base.txt\n")
+        (repo / "base.txt").write_text("requests==2.31.0\n")
+        subprocess.run(["git", "add", "."], cwd=repo, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repo, check=True)
+        return repo
+
+    def test_get_head(self, git_repo, tmp_path):
+        """Test getting the HEAD commit (None outside a repository)."""
+        assert len(Git().get_head(str(git_repo))) == 40
+        assert Git().get_head(str(tmp_path)) is None
+
+    def test_get_changed_files(self, git_repo):
+        """Test that committed and local changes since a commit are reported."""
+        git = Git()
+        head = git.get_head(str(git_repo))
+        paths = ["requirements.txt", "base.txt"]
+        assert git.get_changed_files(str(git_repo), head, paths) == set()
+        (git_repo / "base.txt").write_text("requests==2.32.0\n")
+        assert git.get_changed_files(str(git_repo), head, paths) == {"base.txt"}
+        assert git.get_changed_files(str(git_repo), "0" * 40, paths) is None
+
+    def test_get_tracked_files(self, git_repo):
+        """Test that only tracked files are reported."""
+        (git_repo / "dev.txt").write_text("pytest\n")
+        tracked = Git().get_tracked_files(str(git_repo), ["requirements.txt", "dev.txt"])
+        assert tracked == {"requirements.txt"}
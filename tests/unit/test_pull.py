@@ -0,0 +1,119 @@
+"""
+Unit tests for the helpers of the pull command.
+"""
+
+import subprocess
+
+from gvit.commands.pull import _deps_may_have_changed, _sync_changed_requirements
+from gvit.git import Git
+
+
+class TestSyncChangedRequirements:
+    """Test cases for the package-level sync of changed dependency groups."""
+
+    def _get_env(self, installed: dict, venv_path=None) -> dict:
+        environment = {"backend": "venv", **({"path": str(venv_path)} if venv_path else {})}
+        return {"environment": environment, "deps": {"installed": installed}}
+
+    def _add_distribution(self, venv_path, name, requires=()):
+        """Create the metadata of a distribution installed in a venv."""
+        dist_path = venv_path / "lib" / "python3.11" / "site-packages" / f"{name}-1.0.dist-info"
+        dist_path.mkdir(parents=True)
+        requires_dist = "".join(f"Requires-Dist: {requirement}\n" for requirement in requires)
+        (dist_path / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n{requires_dist}")
+
+    def test_only_delta_installed(self, temp_repo, mocker):
+        """Test that only the changed requirements are installed and unsyncable groups are returned."""
+        sync = mocker.patch("gvit.commands.pull.sync_dependencies", return_value=True)
+        env = self._get_env({"dev_requirements": ["pytest==7.4.0", "ruff"]})
+        pending = _sync_changed_requirements(
+            env,
+            ".venv",
+            {"_base": "pyproject.toml", "dev": "pyproject.toml"},
+            {"_base": None, "dev": ["pytest==8.0.0", "ruff"]},
+            temp_repo,
+            "pip",
+            False,
+            False,
+        )
+        assert pending == {"_base": "pyproject.toml"}
+        sync.assert_called_once()
+        assert sync.call_args.kwargs["to_install"] == ["pytest==8.0.0"]
+        assert sync.call_args.kwargs["to_uninstall"] == []
+
+    def test_prune_keeps_packages_required_elsewhere(self, temp_repo, mocker):
+        """Test that removed packages are uninstalled with prune unless another group or package requires them."""
+        sync = mocker.patch("gvit.commands.pull.sync_dependencies", return_value=False)
+        venv_path = temp_repo / ".venv"
+        self._add_distribution(venv_path, "black", ["click>=8.0"])
+        self._add_distribution(venv_path, "click")
+        self._add_distribution(venv_path, "mypy", ["typing-extensions"])
+        self._add_distribution(venv_path, "typing_extensions")
+        dev_requirements = ["black", "click", "pytest", "requests", "typing-extensions"]
+        env = self._get_env({"dev_requirements": dev_requirements}, venv_path)
+        pending = _sync_changed_requirements(
+            env,
+            ".venv",
+            {"dev": "requirements-dev.txt"},
+            {"_base": ["requests==2.32.0"], "dev": ["pytest"]},
+            temp_repo,
+            "pip",
+            True,
+            False,
+        )
+        # click is only required by black (uninstalled too), typing-extensions by mypy
+        assert sync.call_args.kwargs["to_uninstall"] == ["black", "click"]
+        assert pending == {"dev": "requirements-dev.txt"}  # Failed syncs are reinstalled as a whole
+
+    def test_prune_skipped_with_pyproject_base(self, temp_repo, mocker):
+        """Test that nothing is uninstalled when another group (the pyproject.toml base) has unknown requirements."""
+        sync = mocker.patch("gvit.commands.pull.sync_dependencies", return_value=True)
+        venv_path = temp_repo / ".venv"
+        self._add_distribution(venv_path, "requests")
+        env = self._get_env({"dev_requirements": ["pytest", "requests"]}, venv_path)
+        _sync_changed_requirements(
+            env,
+            ".venv",
+            {"dev": "requirements-dev.txt"},
+            {"_base": None, "dev": ["pytest"]},
+            temp_repo,
+            "pip",
+            True,
+            False,
+        )
+        assert sync.call_args.kwargs["to_uninstall"] == []
+
+
+class TestDepsMayHaveChanged:
+    """Test cases for the git gate that skips hashing unchanged dependency files."""
+
+    def _git(self, repo, *args):
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    def _get_env(self, commit):
+        return {"deps": {"installed": {"_commit": commit}}}
+
+    def test_unchanged_since_installed_commit(self, temp_repo):
+        """Test that hashing is skipped when nothing changed since the installed commit."""
+        (temp_repo / "requirements.txt").write_text("requests==2.31.0\n")
+        self._git(temp_repo, "add", ".")
+        self._git(temp_repo, "commit", "-q", "-m", "init")
+        env = self._get_env(Git().get_head(str(temp_repo)))
+        assert not _deps_may_have_changed(Git(), temp_repo, env, {"_base": "requirements.txt"})
+        assert _deps_may_have_changed(Git(), temp_repo, self._get_env(None), {"_base": "requirements.txt"})
+
+    def test_branch_switched_before_pull(self, temp_repo):
+        """Test that a dependency change brought by a checkout (not by the pull) is detected."""
+        (temp_repo / "requirements.txt").write_text("requests==2.31.0\n")
+        self._git(temp_repo, "add", ".")
+        self._git(temp_repo, "commit", "-q", "-m", "init")
+        installed_commit = Git().get_head(str(temp_repo))
+        self._git(temp_repo, "checkout", "-q", "-b", "feature")
+        (temp_repo / "requirements.txt").write_text("requests==2.32.0\n")
+        self._git(temp_repo, "commit", "-q", "-am", "bump")
+        feature_commit = Git().get_head(str(temp_repo))
+        deps = {"_base": "requirements.txt"}
+        assert _deps_may_have_changed(Git(), temp_repo, self._get_env(installed_commit), deps)
+        # Installed on the feature branch, then switched back: not an ancestor of HEAD
+        self._git(temp_repo, "checkout", "-q", "-")
+        assert _deps_may_have_changed(Git(), temp_repo, self._get_env(feature_commit), deps)
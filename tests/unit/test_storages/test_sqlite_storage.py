@@ -0,0 +1,73 @@
+"""
+Unit tests for SqliteStorage class.
+"""
+
+import sqlite3
+from contextlib import closing
+
+from gvit.env_registry import EnvRegistry
+from gvit.storages.sqlite_storage import SqliteStorage
+
+
+def _get_env(name: str, repo_path: str, backend: str = "venv", python: str = "3.11") -> dict:
+    """Build a registry entry."""
+    return {
+        "environment": {
+            "name": name,
+            "backend": backend,
+            "python": python,
+            "path": f"{repo_path}/.venv",
+            "created_at": "2025-01-01T00:00:00.000000",
+        },
+        "repository": {"path": repo_path, "url": "https://github.com/test/repo.git"},
+    }
+
+
+class TestSqliteStorage:
+    """Test cases for the SQLite storage engine of the registry."""
+
+    def test_save_load_delete(self, temp_config_dir, temp_repo):
+        """Test the basic operations on an environment."""
+        storage = SqliteStorage()
+        env = _get_env("env1", str(temp_repo))
+        storage.save("env1", env)
+        assert storage.exists("env1")
+        assert storage.load("env1") == env
+        assert storage.list_names() == ["env1"]
+        assert storage.delete("env1")
+        assert not storage.delete("env1")
+        assert storage.load("env1") is None
+
+    def test_filters_and_repo_lookup(self, temp_config_dir, temp_repo):
+        """Test listing with filters and looking up by repository path."""
+        storage = SqliteStorage()
+        storage.save("env1", _get_env("env1", str(temp_repo), backend="venv", python="3.11"))
+        storage.save("env2", _get_env("env2", "/tmp/other-repo", backend="uv", python="3.12"))
+        assert [env["environment"]["name"] for env in storage.load_all()] == ["env1", "env2"]
+        assert [env["environment"]["name"] for env in storage.load_all(backend="uv")] == ["env2"]
+        assert [env["environment"]["name"] for env in storage.load_all(python="3.11")] == ["env1"]
+        assert [env["environment"]["name"] for env in storage.find_by_repo(str(temp_repo.resolve()))] == ["env1"]
+        assert storage.reindex() == 2
+
+    def test_lookup_columns_are_indexed(self, temp_config_dir):
+        """Test that the lookup columns have an index."""
+        SqliteStorage()
+        with closing(sqlite3.connect(temp_config_dir / "envs.db")) as conn:
+            indexed = [
+                sql for sql, in conn.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")
+            ]
+            plan = conn.execute("EXPLAIN QUERY PLAN SELECT data FROM envs WHERE repo_path = ?", ("x",)).fetchall()
+        for column in ["repo_path", "backend", "python", "created_at"]:
+            assert any(f"({column})" in sql for sql in indexed)
+        assert "USING INDEX envs_repo_path" in plan[0][-1]
+
+    def test_migrate_from_toml(self, temp_config_dir, temp_repo):
+        """Test migrating the registry from the TOML storage to SQLite."""
+        toml_registry = EnvRegistry("toml")
+        toml_registry.save_environment_info("env1", _get_env("env1", str(temp_repo)))
+        toml_registry.save_environment_info("env2", _get_env("env2", "/tmp/other-repo"))
+        assert toml_registry.migrate("sqlite") == 2
+
+        sqlite_registry = EnvRegistry("sqlite")
+        assert sqlite_registry.list_environments() == ["env1", "env2"]
+        assert sqlite_registry.find_by_repo(temp_repo)["environment"]["name"] == "env1"
@@ -0,0 +1,85 @@
+"""
+Unit tests for the safe file write helpers.
+"""
+
+import fcntl
+import multiprocessing
+
+import pytest
+
+from gvit.env_registry import EnvRegistry
+from gvit.utils.files import atomic_write_text, file_lock
+
+
+def _try_lock(lock_file, queue) -> None:
+    """Try to take the lock without blocking (run in another process)."""
+    with open(lock_file, "a") as f:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            queue.put(True)
+        except BlockingIOError:
+            queue.put(False)
+
+
+def _save_envs(n_envs: int, offset: int) -> None:
+    """Save several environments to the registry (run in another process)."""
+    env_registry = EnvRegistry()
+    for i in range(n_envs):
+        name = f"env{offset + i}"
+        env_registry.save_environment_info(name, {
+            "environment": {"name": name, "backend": "venv", "python": "3.11", "path": f"/tmp/{name}/.venv", "created_at": ""},
+            "repository": {"path": f"/tmp/{name}", "url": ""},
+        })
+
+
+class TestAtomicWrite:
+    """Test cases for atomic_write_text."""
+
+    def test_replaces_content(self, tmp_path):
+        """Test that the file is replaced and no temp file is left behind."""
+        (tmp_path / "envs").mkdir()
+        target = tmp_path / "envs" / "env.toml"
+        target.write_text("old")
+        atomic_write_text(target, "new")
+        assert target.read_text() == "new"
+        assert list(target.parent.iterdir()) == [target]
+
+    def test_failed_write_keeps_previous_content(self, tmp_path, mocker):
+        """Test that an interrupted write leaves the previous file untouched."""
+        (tmp_path / "envs").mkdir()
+        target = tmp_path / "envs" / "env.toml"
+        target.write_text("old")
+        mocker.patch("gvit.utils.files.os.fsync", side_effect=OSError("disk full"))
+        with pytest.raises(OSError):
+            atomic_write_text(target, "new")
+        assert target.read_text() == "old"
+        assert list(target.parent.iterdir()) == [target]
+
+
+class TestFileLock:
+    """Test cases for the advisory file lock."""
+
+    def test_lock_excludes_other_processes(self, tmp_path):
+        """Test that another process cannot take the lock while it is held."""
+        lock_file = tmp_path / "registry.lock"
+        queue = multiprocessing.Queue()
+        with file_lock(lock_file):
+            process = multiprocessing.Process(target=_try_lock, args=(lock_file, queue))
+            process.start()
+            process.join()
+            assert queue.get() is False
+        process = multiprocessing.Process(target=_try_lock, args=(lock_file, queue))
+        process.start()
+        process.join()
+        assert queue.get() is True
+
+    def test_concurrent_registry_writers(self, temp_config_dir):
+        """Test that concurrent writers keep every registry file and the index consistent."""
+        processes = [multiprocessing.Process(target=_save_envs, args=(10, i * 10)) for i in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        env_registry = EnvRegistry()
+        assert len(env_registry.get_environments()) == 40
+        assert env_registry.find_by_repo("/tmp/env25")["environment"]["name"] == "env25"
@@ -0,0 +1,167 @@
+"""
+Unit tests for the in-process freeze engine.
+"""
+
+import json
+import shutil
+
+from gvit.utils import freeze as freeze_module
+from gvit.utils.freeze import FreezeSnapshot, prune_freezes_cache, scan_freeze
+from gvit.backends.common import get_freeze_diff
+from gvit.backends.venv import VenvBackend
+from gvit.freeze_store import hash_freeze
+
+
+def _add_distribution(site_packages, name, version, direct_url=None, suffix=".dist-info"):
+    """Create the metadata of an installed distribution."""
+    dist_path = site_packages / f"{name.replace('-', '_')}-{version}{suffix}"
+    dist_path.mkdir(parents=True)
+    metadata_file = "METADATA" if suffix == ".dist-info" else "PKG-INFO"
+    (dist_path / metadata_file).write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n\nLong description\n")
+    if direct_url is not None:
+        (dist_path / "direct_url.json").write_text(json.dumps(direct_url))
+
+
+class TestScanFreeze:
+    """Test cases for scan_freeze."""
+
+    def test_scan_freeze(self, tmp_path):
+        """Test that installed distributions are listed like pip freeze does."""
+        site_packages = tmp_path / "venv" / "lib" / "python3.11" / "site-packages"
+        _add_distribution(site_packages, "requests", "2.31.0")
+        _add_distribution(site_packages, "Django", "5.0.1")
+        _add_distribution(site_packages, "pip", "24.0")
+        _add_distribution(site_packages, "legacy-pkg", "1.0", suffix=".egg-info")
+        _add_distribution(
+            site_packages, "mylib", "0.1.0",
+            direct_url={"url": "https://github.com/org/mylib.git", "vcs_info": {"vcs": "git", "commit_id": "abc123"}},
+        )
+        _add_distribution(site_packages, "localpkg", "0.2.0", direct_url={"url": "file:///tmp/localpkg.whl", "archive_info": {}})
+        assert scan_freeze(tmp_path / "venv") == (
+            "Django==5.0.1\n"
+            "legacy-pkg==1.0\n"
+            "localpkg @ file:///tmp/localpkg.whl\n"
+            "mylib @ git+https://github.com/org/mylib.git@abc123\n"
+            "requests==2.31.0\n"
+        )
+
+    def test_scan_freeze_editable(self, tmp_path):
+        """Test that editable installs are listed as pip does, except the excluded ones (the repository itself)."""
+        repo_path = tmp_path / "repo"
+        other_path = tmp_path / "other"
+        (tmp_path / "venv").mkdir()
+        (tmp_path / "venv" / "pyvenv.cfg").write_text("home = C:\\Python311\nversion = 3.11.4\n")
+        site_packages = tmp_path / "venv" / "Lib" / "site-packages"
+        _add_distribution(site_packages, "repo", "1.0", direct_url={"url": repo_path.as_uri(), "dir_info": {"editable": True}})
+        _add_distribution(site_packages, "Other", "1.0", direct_url={"url": other_path.as_uri(), "dir_info": {"editable": True}})
+        assert scan_freeze(tmp_path / "venv", exclude_paths=[repo_path]) == (
+            f"# Editable install with no version control (Other==1.0)\n-e {other_path}\n"
+        )
+
+    def test_scan_freeze_vcs_editable_falls_back(self, tmp_path):
+        """Test that None is returned for editable installs under version control, listed by pip from the VCS."""
+        other_path = tmp_path / "other"
+        (other_path / ".git").mkdir(parents=True)
+        site_packages = tmp_path / "venv" / "lib" / "python3.11" / "site-packages"
+        _add_distribution(site_packages, "other", "1.0", direct_url={"url": other_path.as_uri(), "dir_info": {"editable": True}})
+        assert scan_freeze(tmp_path / "venv") is None
+
+    def test_scan_freeze_sorted_like_pip(self, tmp_path):
+        """Test that the packages are sorted by their lowercase name (not the canonical one), as pip does."""
+        site_packages = tmp_path / "venv" / "lib" / "python3.11" / "site-packages"
+        _add_distribution(site_packages, "foo_bar", "1.0")
+        _add_distribution(site_packages, "foo-baz", "1.0")
+        assert scan_freeze(tmp_path / "venv") == "foo-baz==1.0\nfoo_bar==1.0\n"
+
+    def test_scan_freeze_build_backends_since_python_312(self, tmp_path):
+        """Test that setuptools and wheel are only left out before Python 3.12, as pip does."""
+        for python in ("python3.11", "python3.12"):
+            site_packages = tmp_path / python / "lib" / python / "site-packages"
+            for name in ("pip", "setuptools", "wheel"):
+                _add_distribution(site_packages, name, "1.0")
+        assert scan_freeze(tmp_path / "python3.11") == ""
+        assert scan_freeze(tmp_path / "python3.12") == "setuptools==1.0\nwheel==1.0\n"
+
+    def test_scan_freeze_conda_packages(self, tmp_path):
+        """Test that packages installed by conda are listed with their direct URL, as pip does."""
+        site_packages = tmp_path / "env" / "lib" / "python3.11" / "site-packages"
+        _add_distribution(
+            site_packages, "numpy", "1.26.4",
+            direct_url={"url": "file:///home/conda/feedstock_root/build_artifacts/numpy_1/work", "dir_info": {}},
+        )
+        (site_packages / "numpy-1.26.4.dist-info" / "INSTALLER").write_text("conda\n")
+        assert scan_freeze(tmp_path / "env") == "numpy @ file:///home/conda/feedstock_root/build_artifacts/numpy_1/work\n"
+
+    def test_scan_freeze_without_site_packages(self, tmp_path):
+        """Test that None is returned when the environment has no site-packages directory."""
+        assert scan_freeze(tmp_path / "missing") is None
+
+    def test_backend_freeze_does_not_spawn(self, temp_repo, mocker):
+        """Test that the backend reads the freeze without running pip."""
+        site_packages = temp_repo / ".venv" / "lib" / "python3.11" / "site-packages"
+        _add_distribution(site_packages, "requests", "2.31.0")
+        run = mocker.patch("gvit.backends.venv.subprocess.run")
+        freeze = VenvBackend().get_freeze(".venv", temp_repo, "https://github.com/test/repo.git")
+        assert freeze == "requests==2.31.0\n"
+        run.assert_not_called()
+
+
+class TestFreezeCache:
+    """Test cases for the freeze cache keyed on the state of site-packages."""
+
+    def test_freeze_cached_until_site_packages_changes(self, tmp_path, mocker):
+        """Test that distributions are not read again until something is installed or removed."""
+        site_packages = tmp_path / "venv" / "lib" / "python3.11" / "site-packages"
+        _add_distribution(site_packages, "requests", "2.31.0")
+        read_distribution = mocker.spy(freeze_module, "_read_distribution")
+        assert scan_freeze(tmp_path / "venv") == "requests==2.31.0\n"
+        assert scan_freeze(tmp_path / "venv") == "requests==2.31.0\n"
+        assert read_distribution.call_count == 1
+
+        _add_distribution(site_packages, "six", "1.16.0")
+        assert scan_freeze(tmp_path / "venv") == "requests==2.31.0\nsix==1.16.0\n"
+        assert read_distribution.call_count == 3
+
+    def test_freeze_cache_depends_on_excluded_paths(self, tmp_path):
+        """Test that a cached freeze is not reused with different excluded paths."""
+        repo_path = tmp_path / "repo"
+        site_packages = tmp_path / "venv" / "lib" / "python3.11" / "site-packages"
+        _add_distribution(site_packages, "repo", "1.0", direct_url={"url": repo_path.as_uri(), "dir_info": {"editable": True}})
+        assert scan_freeze(tmp_path / "venv") == f"# Editable install with no version control (repo==1.0)\n-e {repo_path}\n"
+        assert scan_freeze(tmp_path / "venv", exclude_paths=[repo_path]) == ""
+
+    def test_freeze_cache_per_environment(self, tmp_path, temp_config_dir):
+        """Test that each environment has its own cache file, removed once the environment is deleted."""
+        for name, package in (("venv1", "requests"), ("venv2", "six")):
+            site_packages = tmp_path / name / "lib" / "python3.11" / "site-packages"
+            _add_distribution(site_packages, package, "1.0")
+            scan_freeze(tmp_path / name)
+        cache_dir = temp_config_dir / "cache" / "freezes"
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+        shutil.rmtree(tmp_path / "venv1")
+        assert prune_freezes_cache() == 1
+        assert [json.loads(f.read_text())["env"] for f in cache_dir.glob("*.json")] == [str((tmp_path / "venv2").resolve())]
+
+
+class TestFreezeSnapshot:
+    """Test cases for FreezeSnapshot."""
+
+    def test_snapshot_parsed_once(self):
+        """Test that the packages, direct URL entries and hash are available without parsing again."""
+        text = "Django==5.0.1\n-e file:///tmp/mylib\nmylib @ git+https://github.com/org/mylib.git@abc123\n"
+        snapshot = FreezeSnapshot(text)
+        assert snapshot.hash == hash_freeze(text)
+        assert snapshot.packages["django"] == "5.0.1"
+        assert snapshot.direct_urls == ["-e file:///tmp/mylib", "mylib @ git+https://github.com/org/mylib.git@abc123"]
+        assert snapshot == FreezeSnapshot(text)
+
+    def test_freeze_diff(self):
+        """Test the diff between two snapshots."""
+        added, removed, changed = get_freeze_diff(
+            FreezeSnapshot("click==8.1.0\nrequests==2.31.0\n"),
+            FreezeSnapshot("requests==2.32.0\nsix==1.16.0\n"),
+        )
+        assert added == {"six": "1.16.0"}
+        assert removed == {"click": "8.1.0"}
+        assert changed == {"requests": ("2.31.0", "2.32.0")}
@@ -0,0 +1,109 @@
+"""
+Unit tests for the shared package cache.
+"""
+
+import os
+
+import toml
+
+from gvit.utils import packages_cache
+from gvit.utils.packages_cache import (
+    get_install_env,
+    get_packages_cache_dir,
+    get_packages_cache_stats,
+    prune_packages_cache,
+    touch_packages_cache_entries,
+)
+
+
+def _add_file(path, size, last_used):
+    """Create a cache file of the given size and last use timestamp."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (last_used, last_used))
+
+
+class TestInstallEnv:
+    """Test cases for the environment variables of the install commands."""
+
+    def test_cache_dirs_injected(self, tmp_path, monkeypatch):
+        """Test that pip and uv are pointed to the shared cache and uv links when possible."""
+        for variable in ("PIP_CACHE_DIR", "UV_CACHE_DIR", "UV_LINK_MODE"):
+            monkeypatch.delenv(variable, raising=False)
+        monkeypatch.setattr(packages_cache.platform, "system", lambda: "Linux")
+        env = get_install_env(tmp_path / "repo" / ".venv")
+        cache_dir = packages_cache.PACKAGES_CACHE_DIR
+        assert env["PIP_CACHE_DIR"] == str(cache_dir / "pip")
+        assert env["UV_CACHE_DIR"] == str(cache_dir / "uv")
+        assert env["UV_LINK_MODE"] == "hardlink"
+
+    def test_user_variables_kept(self, tmp_path, monkeypatch):
+        """Test that the cache variables already set by the user are not overridden."""
+        monkeypatch.setenv("UV_CACHE_DIR", str(tmp_path / "my-uv-cache"))
+        monkeypatch.setenv("UV_LINK_MODE", "symlink")
+        env = get_install_env(tmp_path)
+        assert env["UV_CACHE_DIR"] == str(tmp_path / "my-uv-cache")
+        assert env["UV_LINK_MODE"] == "symlink"
+
+    def test_cache_disabled_or_moved(self, tmp_path, temp_config_dir):
+        """Test that the cache directory can be configured and disabled."""
+        config_file = temp_config_dir / "config.toml"
+        config_file.write_text(toml.dumps({"cache": {"dir": str(tmp_path / "shared")}}))
+        assert get_packages_cache_dir() == tmp_path / "shared"
+        config_file.write_text(toml.dumps({"cache": {"enabled": False}}))
+        assert get_packages_cache_dir() is None
+        assert get_install_env(tmp_path) is None
+
+
+class TestPrunePackagesCache:
+    """Test cases for the size-based LRU eviction of the shared cache."""
+
+    def test_stats(self, tmp_path):
+        """Test that the entries and sizes of each package manager are reported."""
+        _add_file(tmp_path / "pip" / "http-v2" / "a" / "entry", 100, 1_000)
+        _add_file(tmp_path / "uv" / "archive-v0" / "abc" / "pkg" / "__init__.py", 50, 1_000)
+        _add_file(tmp_path / "uv" / "archive-v0" / "abc" / "pkg" / "core.py", 50, 1_000)
+        _add_file(tmp_path / "uv" / "CACHEDIR.TAG", 10, 1_000)
+        stats = get_packages_cache_stats(tmp_path)
+        assert stats["pip"]["entries"] == 1 and stats["pip"]["size_bytes"] == 100
+        assert stats["uv"]["entries"] == 1 and stats["uv"]["size_bytes"] == 100
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        """Test that the oldest entries are evicted until the cache fits in the maximum size."""
+        _add_file(tmp_path / "pip" / "wheels" / "old.whl", 100, 1_000)
+        _add_file(tmp_path / "uv" / "archive-v0" / "mid" / "pkg.py", 100, 2_000)
+        os.utime(tmp_path / "uv" / "archive-v0" / "mid", (2_000, 2_000))
+        _add_file(tmp_path / "pip" / "wheels" / "new.whl", 100, 3_000)
+        assert prune_packages_cache(tmp_path, 150, dry_run=True) == (2, 200)
+        assert (tmp_path / "pip" / "wheels" / "old.whl").exists()
+        assert prune_packages_cache(tmp_path, 150) == (2, 200)
+        assert not (tmp_path / "pip" / "wheels" / "old.whl").exists()
+        assert not (tmp_path / "uv" / "archive-v0" / "mid").exists()
+        assert (tmp_path / "pip" / "wheels" / "new.whl").exists()
+
+    def test_hardlinked_archive_not_freed(self, tmp_path):
+        """Test that an unpacked wheel hardlinked into an environment is kept, as evicting it frees nothing."""
+        archive = tmp_path / "uv" / "archive-v0" / "linked"
+        _add_file(archive / "pkg" / "__init__.py", 100, 1_000)
+        os.utime(archive, (1_000, 1_000))
+        (tmp_path / "venv").mkdir()
+        os.link(archive / "pkg" / "__init__.py", tmp_path / "venv" / "__init__.py")
+        _add_file(tmp_path / "pip" / "wheels" / "new.whl", 100, 3_000)
+        assert prune_packages_cache(tmp_path, 0) == (1, 100)
+        assert (archive / "pkg" / "__init__.py").exists()
+        assert not (tmp_path / "pip" / "wheels" / "new.whl").exists()
+
+    def test_entries_touched_on_install(self, tmp_path):
+        """Test that the unpacked wheels linked into an environment are recorded as used, not evicted first."""
+        archive_dir = packages_cache.PACKAGES_CACHE_DIR / "uv" / "archive-v0"
+        for entry in ("used", "unused"):
+            _add_file(archive_dir / entry / f"{entry}-1.0.dist-info" / "METADATA", 100, 1_000)
+            os.utime(archive_dir / entry, (1_000, 1_000))
+        site_packages = tmp_path / "venv" / "lib" / "python3.11" / "site-packages"
+        (site_packages / "used-1.0.dist-info").mkdir(parents=True)
+        os.link(archive_dir / "used" / "used-1.0.dist-info" / "METADATA", site_packages / "used-1.0.dist-info" / "METADATA")
+        assert touch_packages_cache_entries(tmp_path / "venv") == 1
+        (site_packages / "used-1.0.dist-info" / "METADATA").unlink()  # Environment deleted
+        assert prune_packages_cache(packages_cache.PACKAGES_CACHE_DIR, 100) == (1, 100)
+        assert (archive_dir / "used").exists()
+        assert not (archive_dir / "unused").exists()
@@ -0,0 +1,96 @@
+"""
+Unit tests for requirements parsing helpers.
+"""
+
+from gvit.utils.requirements import (
+    get_requirements_includes,
+    get_normalized_requirements,
+    get_requirements_specifiers,
+    get_requirements_delta,
+    normalize_requirement,
+)
+
+
+class TestRequirementsIncludes:
+    """Test cases for get_requirements_includes."""
+
+    def test_includes_followed_recursively(self, tmp_path):
+        """Test that -r/-c includes are followed relative to the including file."""
+        (tmp_path / "reqs").mkdir()
+        (tmp_path / "requirements.txt").write_text(
+            "-r reqs/base.txt\n--constraint=constraints.txt  # pins\nrequests\n"
+        )
+        (tmp_path / "reqs" / "base.txt").write_text("-rcommon.txt\n")
+        (tmp_path / "reqs" / "common.txt").write_text("-r ../requirements.txt\n")
+        (tmp_path / "constraints.txt").write_text("urllib3<3\n")
+        includes = get_requirements_includes(tmp_path / "requirements.txt")
+        assert set(includes) == {
+            (tmp_path / "reqs" / "base.txt").resolve(),
+            (tmp_path / "reqs" / "common.txt").resolve(),
+            (tmp_path / "constraints.txt").resolve(),
+        }
+
+    def test_remote_and_missing_files(self, tmp_path):
+        """Test that URL includes are skipped and missing files do not fail."""
+        (tmp_path / "requirements.txt").write_text("-r https://example.com/reqs.txt\n-r missing.txt\n")
+        includes = get_requirements_includes(tmp_path / "requirements.txt")
+        assert includes == [(tmp_path / "missing.txt").resolve()]
+        assert get_requirements_includes(tmp_path / "nope.txt") == []
+
+    def test_editable_project_files(self, tmp_path):
+        """Test that the project files of local editable installs are included, relative to base_dir."""
+        (tmp_path / "reqs").mkdir()
+        (tmp_path / "libs" / "core").mkdir(parents=True)
+        (tmp_path / "libs" / "core" / "pyproject.toml").write_text("[project]\nname = 'core'\n")
+        (tmp_path / "reqs" / "requirements.txt").write_text(
+            "-e ./libs/core[dev]\n-e git+https://example.com/repo.git#egg=repo\n"
+        )
+        includes = get_requirements_includes(tmp_path / "reqs" / "requirements.txt", tmp_path)
+        assert includes == [(tmp_path / "libs" / "core" / "pyproject.toml").resolve()]
+
+
+class TestNormalizedRequirements:
+    """Test cases for the requirements normalization."""
+
+    def test_normalize_requirement(self):
+        """Test that names, extras and specifiers are canonicalized and markers preserved."""
+        assert normalize_requirement("Requests_Toolbelt [Socks, security] >= 1.0 , <2") == (
+            "requests-toolbelt[security,socks]<2,>=1.0"
+        )
+        assert normalize_requirement('numpy==1.26.4 ;  python_version < "3.12"') == 'numpy==1.26.4; python_version < "3.12"'
+        assert normalize_requirement("torch==2.1 --hash=sha256:b --hash=sha256:a") == "torch==2.1 --hash=sha256:a --hash=sha256:b"
+        assert normalize_requirement("My.Pkg @ https://example.com/pkg.whl") == "my-pkg @ https://example.com/pkg.whl"
+        assert normalize_requirement("--index-url   https://example.com") == "--index-url https://example.com"
+        assert normalize_requirement("./libs/Core") == "./libs/Core"
+
+    def test_cosmetic_changes_ignored(self):
+        """Test that order, comments, blank lines and continuations do not change the result."""
+        original = "numpy==1.26.4\nrequests>=2.31\n"
+        edited = "# Core deps\n\nRequests >= 2.31  # http\nnumpy==1.26.4 \\\n\n"
+        assert get_normalized_requirements(original) == get_normalized_requirements(edited)
+        assert get_normalized_requirements(original) != get_normalized_requirements("numpy==1.26.4\nrequests>=2.32\n")
+
+
+class TestRequirementsDelta:
+    """Test cases for the package-level comparison of requirements."""
+
+    def test_specifiers_follow_requirement_includes(self, tmp_path):
+        """Test that the specifiers of -r includes are collected and normalized."""
+        (tmp_path / "requirements.txt").write_text("-r base.txt\nNumPy==1.26.4\n")
+        (tmp_path / "base.txt").write_text("requests>=2.31  # http\n-r requirements.txt\n")
+        assert get_requirements_specifiers(tmp_path / "requirements.txt") == ["numpy==1.26.4", "requests>=2.31"]
+
+    def test_specifiers_unsupported(self, tmp_path):
+        """Test that files with options, constraints or editable installs cannot be synced package by package."""
+        for content in ("-c constraints.txt\n", "-e .\n", "--index-url https://example.com\n", "torch --hash=sha256:a\n"):
+            (tmp_path / "requirements.txt").write_text(f"requests\n{content}")
+            assert get_requirements_specifiers(tmp_path / "requirements.txt") is None
+
+    def test_delta(self):
+        """Test that added and changed specifiers are installed and removed packages reported."""
+        to_install, removed = get_requirements_delta(
+            ["numpy==1.26.4", "pandas==2.1.0", "requests>=2.31"],
+            ["numpy==2.0.0", "requests>=2.31", "scipy"],
+        )
+        assert to_install == ["numpy==2.0.0", "scipy"]
+        assert removed == ["pandas"]
@@ -14,8 +14,11 @@ from gvit.utils.utils import (
     load_local_config,
     load_repo_config,
     save_local_config,
-    ensure_local_config_dir
+    ensure_local_config_dir,
+    load_toml,
+    _TOML_DOCUMENTS
 )
+from gvit.env_registry import EnvRegistry
 
 
 class TestExtractRepoName:
@@ -225,3 +228,43 @@ class TestConfigFileOperations:
         # Directory already exists from fixture, but test the function
         ensure_local_config_dir()
         assert temp_config_dir.exists()
+
+
+class TestParsedDocumentsCache:
+    """Test cases for the per-invocation cache of parsed TOML documents."""
+
+    def test_file_parsed_once(self, temp_repo, mocker):
+        """Test that the repo config and the dependency hashing share a single parse of pyproject.toml."""
+        pyproject_data = {
+            "project": {"dependencies": ["requests"], "optional-dependencies": {"dev": ["pytest"]}},
+            "tool": {"gvit": {"deps": {"_base": "pyproject.toml", "dev": "pyproject.toml"}}},
+        }
+        with open(temp_repo / "pyproject.toml", "w") as f:
+            toml.dump(pyproject_data, f)
+
+        toml_load = mocker.spy(toml, "load")
+        load_repo_config(str(temp_repo))
+        env_registry = EnvRegistry()
+        env_registry._hash_pyproject_deps(temp_repo / "pyproject.toml")
+        env_registry._hash_pyproject_deps(temp_repo / "pyproject.toml", "dev")
+        assert [call.args[0] for call in toml_load.call_args_list].count(temp_repo / "pyproject.toml") == 1
+
+    def test_modified_file_parsed_again(self, temp_repo):
+        """Test that a modified file is parsed again and returned copies are independent."""
+        config_file = temp_repo / ".gvit.toml"
+        config_file.write_text('[gvit]\npython = "3.11"\n')
+        config = load_toml(config_file)
+        config["gvit"]["python"] = "modified"
+        assert load_toml(config_file)["gvit"]["python"] == "3.11"
+
+        config_file.write_text('[gvit]\npython = "3.12.4"\n')
+        assert load_toml(config_file)["gvit"]["python"] == "3.12.4"
+
+    def test_save_local_config_invalidates(self, temp_config_dir):
+        """Test that saving the local config invalidates its cached document."""
+        save_local_config({"gvit": {"backend": "venv"}})
+        assert load_local_config()["gvit"]["backend"] == "venv"
+        assert str((temp_config_dir / "config.toml").resolve()) in _TOML_DOCUMENTS
+        save_local_config({"gvit": {"backend": "uv"}})
+        assert str((temp_config_dir / "config.toml").resolve()) not in _TOML_DOCUMENTS
+        assert load_local_config()["gvit"]["backend"] == "uv"